@@ -25,6 +25,9 @@ biasCorrect = 0
 # DISABLED FOR DEBUG nReal = 1000000
 nReal = 10000
 
+#run_loopParam checkpoints its results and random state to this file after each parameter value, and restarts from it if present (for a loop with identical configuration). Set to None to disable
+checkpointFile = os.path.join(output, "BiasLoop_Checkpoint.pkl")
+
 #Set up the ground truth
 SB = dict(size = 1.41, e1 = 0.0, e2 = 0.0, magnification = 1., shear = [0.,0.], flux = 100, modelType = 'gaussian', bg = 0.)
 PSF = dict(PSF_Type = 0, PSF_size = 0.05, PSF_Gauss_e1 = 0., PSF_Guass_e2 = 0.0)
@@ -130,8 +133,17 @@ def run_loopParam(imageParams = None, parLab = None, parVals = None, verbose = F
     if(parVals is None):
         raise RuntimeError("run_loopParam: Parameter values must be passed for this to work")
     
+    #Restart from the checkpoint of an interrupted loop with this configuration, if present
+    runHash = IO.hash_Configuration(dict(imageParams = imageParams, parLab = parLab, parVals = parVals, nReal = nReal, fitParams = fitParams, initialGuess = initialGuess, minimiseMethod = minimiseMethod, errorType = errorType))
+    resume = IO.read_Checkpoint(checkpointFile, runHash)
+
     ML, bias, err = [],[],[]
-    for val in parVals:
+    if(resume is not None):
+        ML, bias, err = resume['ML'], resume['bias'], resume['err']
+        np.random.set_state(resume['randomState'])
+        print "Restarting from checkpoint ", checkpointFile, " with ", len(ML), " of ", len(parVals), " values completed"
+
+    for val in parVals[len(ML):]:
         print "\n\nConsidering ", parLab , " = ", val
         
         imageParams['SB'][parLab] = val
@@ -142,6 +154,9 @@ def run_loopParam(imageParams = None, parLab = None, parVals = None, verbose = F
         bias.append(result[1])
         err.append(result[2])
 
+        if(checkpointFile is not None):
+            IO.write_Checkpoint(checkpointFile, dict(ML = ML, bias = bias, err = err, randomState = np.random.get_state()), runHash)
+
     print "Finished loop. Outputting"
 
     ML = np.array(ML)
@@ -157,6 +172,9 @@ def run_loopParam(imageParams = None, parLab = None, parVals = None, verbose = F
     dset = f.create_dataset("err", data = err)
     f.close()
 
+    if(checkpointFile is not None and os.path.exists(checkpointFile)):
+        os.remove(checkpointFile)
+
     ##Plot
     import pylab as pl
     f = pl.figure()
@@ -0,0 +1,54 @@
+'''
+Checks bias_components_Batch, and bias_components, against the triple loop of the original bias_components.
+
+Run from the ML_Estimator directory. Each check is reported, and the script raises if any fail.
+'''
+import python.measure_Bias as mBias
+import numpy as np
+
+failed = []
+def report(label, passed, detail = ''):
+    print label, ':', ('passed' if passed else 'FAILED'), detail
+    if(not passed):
+        failed.append(label)
+
+rng = np.random.RandomState(1)
+
+##--------------- Bias components ---------------##
+print '\n Bias components:'
+def bias_components_Loop(parameter_derivatives, noise):
+    ## Original (triple-loop) bias_components
+    nPar = len(parameter_derivatives[0])
+    pDer = list(parameter_derivatives)
+    s2 = noise*noise
+    I = np.zeros((nPar, nPar))
+    K = np.zeros((nPar, nPar, nPar))
+    J = np.zeros(K.shape)
+    nPix = np.prod(pDer[0][0].shape)
+    for i in range(nPar):
+        for j in range(nPar):
+            I[i,j] = (pDer[0][i]*pDer[0][j]).sum()
+            for k in range(nPar):
+                K[i,j,k] = (pDer[0][k]*pDer[1][i,j] + pDer[0][j]*pDer[1][i,k] + pDer[0][i]*pDer[1][j,k]).sum()
+                J[i,j,k] = (pDer[0][j]*pDer[1][i,k]).sum()
+    I /= (nPix*s2)
+    K /= (-1.*nPix*s2)
+    J /= (nPix*s2)
+    return I, K, J
+
+nGal, nPar = 5, 3
+der1 = rng.randn(nGal, nPar, 10, 12)
+der2 = rng.randn(nGal, nPar, nPar, 10, 12)
+der2 = der2 + np.swapaxes(der2, 1, 2) #Second derivatives are symmetric
+noise = 0.5+rng.rand(nGal)
+I, K, J = mBias.bias_components_Batch(der1, der2, noise)
+for label, batch, index in [['I', I, 0], ['K', K, 1], ['J', J, 2]]:
+    loop = np.array([bias_components_Loop([der1[g], der2[g]], noise[g])[index] for g in range(nGal)])
+    report('bias_components_Batch '+label, np.allclose(batch, loop, rtol = 1.e-12, atol = 1.e-14), str(np.absolute(batch-loop).max()))
+single = mBias.bias_components([der1[0], der2[0]], noise[0])
+report('bias_components', all([np.allclose(single[i], bias_components_Loop([der1[0], der2[0]], noise[0])[i], rtol = 1.e-12, atol = 1.e-14) for i in range(3)]))
+
+print '\n'
+if(len(failed) > 0):
+    raise RuntimeError('bias_Component_Tests - '+str(len(failed))+' checks failed: '+str(failed))
+print 'All checks passed'
@@ -0,0 +1,75 @@
+'''
+Checks that a parallel bias_bySNR run, interrupted within an SNR bin and restarted from its checkpoint, reproduces the output of an uninterrupted run.
+
+Run from the ML_Estimator directory (with the compiled surface brightness profiles built). Each check is reported, and the script raises if any fail.
+'''
+import produce_Bias as pb
+import python.IO as IO
+import numpy as np
+import tempfile
+import shutil
+import copy
+import os
+
+failed = []
+def report(label, passed, detail = ''):
+    print label, ':', ('passed' if passed else 'FAILED'), detail
+    if(not passed):
+        failed.append(label)
+
+##--------------- Checkpoint restart of a parallel bias run ---------------##
+print '\n Checkpoint restart:'
+def run_Bias(directory, interruptAfter = None):
+    ## Runs a small parallel bias_bySNR into directory. If interruptAfter is not None, the run is interrupted after that many chunks have been written, and then restarted from its checkpoint
+    pb.imageParams = copy.deepcopy(initialImageParams)
+    pb.Output = directory+'/'; pb.checkpointFile = directory+'/checkpoint.pkl'; pb.checkpointInterval = 0.
+
+    writeRows = pb.write_Rows
+    if(interruptAfter is not None):
+        nWrite = [0]
+        def interrupting_Write_Rows(handle, rows):
+            writeRows(handle, rows)
+            if(handle['filename'].endswith('_BC.bin')):
+                nWrite[0] += 1
+                if(nWrite[0] == interruptAfter):
+                    raise KeyboardInterrupt('Interrupted for test')
+        pb.write_Rows = interrupting_Write_Rows
+        try:
+            pb.bias_bySNR()
+            report('Interrupted run was interrupted', False)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            pb.write_Rows = writeRows
+        pb.imageParams = copy.deepcopy(initialImageParams)
+    pb.bias_bySNR()
+
+    output = {}
+    for f in sorted(os.listdir(directory)):
+        if(f.endswith('.bin')):
+            output[f] = IO.load_Result_Table(directory+'/'+f)[0].copy()
+        else:
+            output[f] = open(directory+'/'+f).read()
+    return output
+
+pb.SNRRange = [20., 30., 10.]; pb.nRealisation = 3000; pb.percentError = 0.
+pb.nProcess = 2; pb.parallelChunkSize = 500; pb.randomSeed = 7
+pb.catalogueFit = True; pb.catalogueBatchSize = 500; pb.minimiseMethod = 'lm'; pb.preSearchMethod = None; pb.biasCorrect = 1; pb.outputFormat = 'binary'
+pb.fittedParameters = dict(size = 1.41, e1 = 0.); pb.initialGuess = dict(size = 1.41, e1 = 0.)
+pb.fitParamsLabels = pb.fittedParameters.keys(); pb.fitParamsValues = pb.fittedParameters.values()
+initialImageParams = copy.deepcopy(pb.imageParams)
+
+tempDir = tempfile.mkdtemp()
+try:
+    uninterrupted = run_Bias(tempDir+'/uninterrupted')
+    ## Interrupted within the second SNR bin, after its output has been written beyond the last checkpoint
+    restarted = run_Bias(tempDir+'/restarted', interruptAfter = 8)
+    report('Restart reproduces uninterrupted run', sorted(uninterrupted.keys()) == sorted(restarted.keys()) and 'checkpoint.pkl' not in restarted and\
+           all([np.array_equal(uninterrupted[k], restarted[k]) for k in uninterrupted.keys()]), str(sorted(restarted.keys())))
+finally:
+    shutil.rmtree(tempDir)
+
+print '\n'
+if(len(failed) > 0):
+    raise RuntimeError('checkpoint_Tests - '+str(len(failed))+' checks failed: '+str(failed))
+print 'All checks passed'
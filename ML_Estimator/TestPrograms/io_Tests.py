@@ -0,0 +1,70 @@
+'''
+Checks the append/truncate/reload round trip of the IO binary tables, and the reload of ASCII output.
+
+Run from the ML_Estimator directory. Each check is reported, and the script raises if any fail.
+'''
+import python.IO as IO
+import numpy as np
+import tempfile
+import shutil
+import os
+
+failed = []
+def report(label, passed, detail = ''):
+    print label, ':', ('passed' if passed else 'FAILED'), detail
+    if(not passed):
+        failed.append(label)
+
+rng = np.random.RandomState(1)
+
+##--------------- Binary tables ---------------##
+print '\n Binary tables:'
+tempDir = tempfile.mkdtemp()
+try:
+    filename = os.path.join(tempDir, 'table.bin')
+    rows = rng.randn(25, 2)
+
+    sink = IO.open_Binary_Table(filename, ['size', 'e1'], header = dict(title = 'Test'), bufferRows = 4, verbose = False)
+    IO.write_Rows(sink, rows[:10])
+    position = IO.get_Output_Position(sink)
+    IO.write_Rows(sink, rows[10:13])
+    IO.close_Output(sink)
+
+    ## Rows written after the position are discarded, as on restarting from a checkpoint
+    IO.truncate_Output(filename, position)
+    sink = IO.open_Binary_Table(filename, ['size', 'e1'], mode = 'a', verbose = False)
+    IO.write_Rows(sink, rows[10:20])
+    IO.close_Output(sink)
+
+    ## A partially-written row (e.g. from an interrupted run) is discarded on appending
+    with open(filename, 'ab') as handle:
+        handle.write('\x00'*5)
+    sink = IO.open_Binary_Table(filename, ['size', 'e1'], mode = 'a', verbose = False)
+    for r in rows[20:]:
+        IO.write_Rows(sink, r)
+    IO.close_Output(sink)
+
+    table, labels = IO.load_Result_Table(filename)
+    header, offset = IO.read_Binary_Header(filename)
+    report('Append/truncate/reload', labels == ['size', 'e1'] and header['title'] == 'Test' and table.shape == rows.shape and np.array_equal(table, rows))
+
+    try:
+        IO.open_Binary_Table(filename, ['size'], mode = 'a', verbose = False)
+        report('Append with mismatched labels raises', False)
+    except ValueError:
+        report('Append with mismatched labels raises', True)
+
+    ## ASCII output is reloaded by the same routine
+    asciiFilename = os.path.join(tempDir, 'table.dat')
+    handle = IO.initialise_Output(asciiFilename, verbose = False)
+    IO.write_Rows(handle, rows)
+    IO.close_Output(handle)
+    table, labels = IO.load_Result_Table(asciiFilename)
+    report('ASCII reload', labels is None and np.allclose(table, rows, rtol = 1.e-15))
+finally:
+    shutil.rmtree(tempDir)
+
+print '\n'
+if(len(failed) > 0):
+    raise RuntimeError('io_Tests - '+str(len(failed))+' checks failed: '+str(failed))
+print 'All checks passed'
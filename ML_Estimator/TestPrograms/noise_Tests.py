@@ -0,0 +1,48 @@
+'''
+Checks estimate_Noise, for single images, stacks and batches, against the original curve-of-growth loop.
+
+Run from the ML_Estimator directory (with the compiled surface brightness profiles built). Each check is reported, and the script raises if any fail.
+'''
+import python.image_measurement_ML as ML
+import numpy as np
+
+failed = []
+def report(label, passed, detail = ''):
+    print label, ':', ('passed' if passed else 'FAILED'), detail
+    if(not passed):
+        failed.append(label)
+
+rng = np.random.RandomState(1)
+
+##--------------- Noise estimation ---------------##
+print '\n Noise estimation:'
+def estimate_Noise_Loop(image, maskCentroid = None):
+    ## Original curve-of-growth loop of estimate_Noise, with the start of the mask clipped at the image edge
+    if(maskCentroid is None):
+        return image.std()
+    res = np.zeros(max(maskCentroid[0], maskCentroid[1], abs(image.shape[-2]-maskCentroid[0]), abs(image.shape[-1]-maskCentroid[1])))
+    tImage = image.copy()
+    for con in range(1, res.shape[0]+1):
+        maskRad = (con-1)
+        if(len(tImage.shape) == 3):
+            for i in range(tImage.shape[0]):
+                tImage[i][max(maskCentroid[0]-maskRad,0):maskCentroid[0]+maskRad, max(0,maskCentroid[1]-maskRad):maskCentroid[1]+maskRad] = 0.
+        else:
+            tImage[max(0,maskCentroid[0]-maskRad):maskCentroid[0]+maskRad, max(0,maskCentroid[1]-maskRad):maskCentroid[1]+maskRad] = 0.
+        res[con-1] = tImage.std()
+    return res[np.argmin(np.absolute(np.diff(res)))]
+
+for shape, centroid in [[(10,10),(5,5)], [(15,12),(3,9)], [(4,15,12),(7,6)], [(9,9),(0,0)], [(3,9,9),(8,8)], [(10,10),None]]:
+    image = rng.randn(*shape)
+    if(centroid is not None):
+        image += 5.*np.exp(-np.power(np.indices(shape[-2:]) - np.array(centroid)[:,None,None], 2).sum(axis = 0)/4.)
+    new = ML.estimate_Noise(image, centroid); old = estimate_Noise_Loop(image, centroid)
+    report('estimate_Noise '+str(shape)+' '+str(centroid), np.allclose(new, old, rtol = 1.e-12), str([new, old]))
+
+images = rng.randn(6, 10, 10)*np.arange(1, 7)[:,None,None]
+report('estimate_Noise batch', np.allclose(ML.estimate_Noise(images, (5,5), batch = True), [estimate_Noise_Loop(im, (5,5)) for im in images], rtol = 1.e-12))
+
+print '\n'
+if(len(failed) > 0):
+    raise RuntimeError('noise_Tests - '+str(len(failed))+' checks failed: '+str(failed))
+print 'All checks passed'
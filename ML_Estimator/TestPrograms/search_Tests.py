@@ -0,0 +1,73 @@
+'''
+Checks that the maximum-likelihood search methods agree: each is run on the same noisy postage stamps, fitting size, e1, e2 and flux, and must reach the minimum of (-1.)*log-Likelihood (evaluated by get_logLikelihood, including its hard prior) found by the simplex search, to within lnLTolerance. The batched catalogue search (least_Squares_ML_Search_Batch) must do the same for every object, and report each as converged. At lower SNR, each search must end within the hard prior.
+
+Run from the ML_Estimator directory (with the compiled surface brightness profiles built). Each check is reported, and the script raises if any fail.
+'''
+import python.model_Production as modPro
+import python.surface_Brightness_Profiles as SBPro
+import python.image_measurement_ML as ML
+import numpy as np
+import sys
+
+failed = []
+def report(label, passed, detail = ''):
+    print label, ':', ('passed' if passed else 'FAILED'), detail
+    if(not passed):
+        failed.append(label)
+
+## Stamps, and the noise levels at which they are fit (SNR ~ 20 to 7)
+nStamp = 20
+noiseLevels = [1., 2., 3.]
+lnLTolerance = 1.e-3
+## Noise levels at which the searches are only required to remain within the prior (SNR ~ 4 to 2.5)
+lowSNRNoiseLevels = [5., 8.]
+
+fitParams = ['size', 'e1', 'e2', 'flux']
+imageParams = modPro.default_ModelParameter_Dictionary(SB = dict(size = 1.41, e1 = 0., e2 = 0., magnification = 1., shear = [0., 0.], flux = 100., modelType = 'gaussian'),\
+                                                       centroid = (np.array([10., 10.])+1)/2., noise = 1., stamp_size = np.array([10, 10]), pixel_scale = 1.,\
+                                                       PSF = dict(PSF_Type = 0, PSF_size = 0.05, PSF_Gauss_e1 = 0., PSF_Gauss_e2 = 0.))
+initialGuess = dict(size = 1.41, e1 = 0., e2 = 0., flux = 100.)
+noiseFreeImage = modPro.user_get_Pixelised_Model(imageParams, sbProfileFunc = SBPro.gaussian_SBProfile_CXX)[0].flatten()
+
+def get_Search_lnL(image, searchMethod):
+    ## (-1.)*lnL at the ML estimate of searchMethod
+    maxima = ML.find_ML_Estimator(image, fitParams = fitParams, searchMethod = searchMethod, error = None, setParams = modPro.copy_ModelParameters(imageParams), **initialGuess)[0]
+    return ML.get_logLikelihood(maxima, fitParams, image, imageParams)
+
+def get_Batch_lnL(images):
+    ## (-1.)*lnL at the ML estimate of each object from the batched catalogue search, and whether each is reported as converged
+    x0 = np.ones((images.shape[0], len(fitParams)))*np.array([initialGuess[k] for k in fitParams])
+    maxima, fisher, converged = ML.least_Squares_ML_Search_Batch(x0, fitParams, images, modPro.copy_ModelParameters(imageParams))
+    return np.array([ML.get_logLikelihood(m, fitParams, image, imageParams) for m, image in zip(maxima, images)]), converged
+
+##--------------- Gradient-based and least-squares searches ---------------##
+print '\n Gradient-based and least-squares searches:'
+rng = np.random.RandomState(2)
+for noise in noiseLevels:
+    imageParams['noise'] = noise
+    images = noiseFreeImage[None,:] + noise*rng.randn(nStamp, noiseFreeImage.shape[0])
+    reference = np.array([get_Search_lnL(image, 'simplex') for image in images])
+
+    for method in sorted(ML.gradientSearchMethods.keys())+['lm']:
+        lnL = np.array([get_Search_lnL(image, method) for image in images])
+        report(method+' at noise '+str(noise), (lnL - reference <= lnLTolerance).all(), str((lnL - reference > lnLTolerance).sum())+'/'+str(nStamp)+' worse than simplex')
+
+    lnL, converged = get_Batch_lnL(images)
+    report('catalogue at noise '+str(noise), (lnL - reference <= lnLTolerance).all() and converged.all(), str((lnL - reference > lnLTolerance).sum())+'/'+str(nStamp)+' worse than simplex, '+str((~converged).sum())+'/'+str(nStamp)+' not converged')
+
+##--------------- Low SNR ---------------##
+## At low SNR the likelihood may have several local maxima, so that the methods need not agree, but each must end within the hard prior (where get_logLikelihood is finite)
+print '\n Low SNR searches:'
+for noise in lowSNRNoiseLevels:
+    imageParams['noise'] = noise
+    images = noiseFreeImage[None,:] + noise*rng.randn(nStamp, noiseFreeImage.shape[0])
+    for method in ['simplex']+sorted(ML.gradientSearchMethods.keys())+['lm']:
+        lnL = np.array([get_Search_lnL(image, method) for image in images])
+        report(method+' at noise '+str(noise), (lnL < sys.float_info.max/10).all(), str((lnL >= sys.float_info.max/10).sum())+'/'+str(nStamp)+' outside the prior')
+    lnL = get_Batch_lnL(images)[0]
+    report('catalogue at noise '+str(noise), (lnL < sys.float_info.max/10).all(), str((lnL >= sys.float_info.max/10).sum())+'/'+str(nStamp)+' outside the prior')
+
+print '\n'
+if(len(failed) > 0):
+    raise RuntimeError('search_Tests - '+str(len(failed))+' checks failed: '+str(failed))
+print 'All checks passed'
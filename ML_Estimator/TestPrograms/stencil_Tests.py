@@ -0,0 +1,34 @@
+'''
+Checks the finite-difference stencils, with and without extrapolation, against analytic derivatives.
+
+Run from the ML_Estimator directory. Each check is reported, and the script raises if any fail.
+'''
+import python.derivatives as der
+import numpy as np
+
+failed = []
+def report(label, passed, detail = ''):
+    print label, ':', ('passed' if passed else 'FAILED'), detail
+    if(not passed):
+        failed.append(label)
+
+##--------------- Finite-difference stencils ---------------##
+print '\n Finite-difference stencils:'
+## Derivatives of exp(a x) are a^n exp(a x): odd derivatives change sign with a, so that sign errors in the stencil are apparent
+a = np.array([2., -1.5, 0.5])
+x0 = 0.3
+for order, n, tolerance in [[3, [1,2], 1.e-3], [5, [1,2,3], 1.e-3], [7, [1,2,3], 1.e-6]]:
+    numerical = der.finite_difference_derivative(lambda x: np.exp(a*x), x0, [], n = n, order = order, dx = 0.01)
+    for nn in range(len(n)):
+        analytic = np.power(a, n[nn])*np.exp(a*x0)
+        report('Order '+str(order)+' stencil, derivative '+str(n[nn]), np.allclose(numerical[nn], analytic, rtol = tolerance), str(np.absolute(numerical[nn]/analytic-1.).max()))
+
+    extrapolated = der.finite_difference_derivative(lambda x: np.exp(a*x), x0, [], n = n, order = order, dx = [0.04, 0.01], extrapolate = True, maxEval = 3)
+    for nn in range(len(n)):
+        analytic = np.power(a, n[nn])*np.exp(a*x0)
+        report('Order '+str(order)+' extrapolated stencil, derivative '+str(n[nn]), np.allclose(extrapolated[nn], analytic, rtol = tolerance), str(np.absolute(extrapolated[nn]/analytic-1.).max()))
+
+print '\n'
+if(len(failed) > 0):
+    raise RuntimeError('stencil_Tests - '+str(len(failed))+' checks failed: '+str(failed))
+print 'All checks passed'
@@ -0,0 +1,38 @@
+'''
+Checks the streaming running statistics: Welford single-sample updates, and merge_Running_Statistics over batches split in different ways, against np.mean/np.std.
+
+Run from the ML_Estimator directory. Each check is reported, and the script raises if any fail.
+'''
+import python.runningStatistics as runStats
+import numpy as np
+
+failed = []
+def report(label, passed, detail = ''):
+    print label, ':', ('passed' if passed else 'FAILED'), detail
+    if(not passed):
+        failed.append(label)
+
+rng = np.random.RandomState(1)
+
+##--------------- Running statistics ---------------##
+print '\n Running statistics:'
+samples = 3.+2.*rng.randn(1000, 3)
+samples[:,2] += 1.e6 #Large offset, where the naive sum of squares loses precision
+
+stats = runStats.initialise_Running_Statistics(3)
+for s in samples:
+    runStats.update_Running_Statistics(stats, s)
+Mean, StD, MeanStD = runStats.get_Running_Statistics(stats)
+report('Welford single-sample updates', np.allclose(Mean, samples.mean(axis = 0), rtol = 1.e-12) and np.allclose(StD, samples.std(axis = 0), rtol = 1.e-9), str(np.absolute(StD-samples.std(axis = 0)).max()))
+
+for split in [[500], [1, 999], [0, 10, 10, 980], list(range(1, 1000, 37))]:
+    stats = runStats.initialise_Running_Statistics(3)
+    for batch in np.split(samples, split):
+        runStats.merge_Running_Statistics(stats, runStats.get_Batch_Running_Statistics(batch))
+    Mean, StD, MeanStD = runStats.get_Running_Statistics(stats, ddof = 1)
+    report('Merged batches, split at '+str(split[:4]), stats['n'] == samples.shape[0] and np.allclose(Mean, samples.mean(axis = 0), rtol = 1.e-12) and np.allclose(StD, samples.std(axis = 0, ddof = 1), rtol = 1.e-9))
+
+print '\n'
+if(len(failed) > 0):
+    raise RuntimeError('streaming_Tests - '+str(len(failed))+' checks failed: '+str(failed))
+print 'All checks passed'
@@ -3,10 +3,12 @@ Touch Date: 31 Aug 2015
 Produces the statistics on simulated runs of produce bias. This has been implemented in produce bias itself, however is included here seperately as backup when the produce bias run does not finish
 '''
 import numpy as np
+from python.IO import load_Result_Table
+import python.runningStatistics as runStats
 
 directory = '/disk1/cajd/Euclid/ML_Estimator/ML_Output/SNRBias/28Aug2015/2D/e1_e2/xtol_minus5/NoLookup/Simplex/BiasCorrected/'
 filePrefix = 'e10p3_e20p3'
-fileSuffix = '.dat'
+fileSuffix = '.bin' ## Binary (.bin) and ASCII (.dat) output of produce_Bias are both read, the format being detected from the file
 doBC = [1,1]
 SNRRange = [150.,201.,25.]
 nPar = 2 ##This should be read in from input, but problem where it si just a list
@@ -39,6 +41,17 @@ def intialise_Output(filename, mode = 'w', verbose = True):
         print 'File will be output to: ',filename
         
     return handle
+
+def get_File_Statistics(filename, chunkRows = 1000000):
+    '''
+    Returns the mean, standard deviation and error on the mean of each column of the result table filename. Binary tables are memory-mapped, and accumulated in chunks of chunkRows so that they are never read into memory in full.
+    '''
+    Input, labels = load_Result_Table(filename)
+
+    stats = runStats.initialise_Running_Statistics(Input.shape[1])
+    for start in range(0, Input.shape[0], chunkRows):
+        runStats.update_Running_Statistics(stats, Input[start:start+chunkRows])
+    return runStats.get_Running_Statistics(stats)
                         
 if(doBC[0]):
     handle1 = intialise_Output(directory+filePrefix+'_Statistics.dat', mode = 'a')
@@ -48,16 +61,14 @@ if(doBC[0]):
     handle2.write('## Recovered statistics as a result of bias run. Output of form [Bias, StD, Error on Bias] repeated for all fit quantities \n')
     
     for SNR in np.arange(*SNRRange):
-        Input = np.genfromtxt(directory+filePrefix+'_SNR'+str(SNR)+fileSuffix)
-        
-        Mean = Input.mean(axis = 0); StD = Input.std(axis = 0); MeanStD = StD/np.sqrt(Input.shape[0])
+        Mean, StD, MeanStD = get_File_Statistics(directory+filePrefix+'_SNR'+str(SNR)+fileSuffix)
         
         
         if(nPar == 1):
-            out = np.array([SNR, Mean, StD, MeanStD])
+            out = np.array([SNR, Mean[0], StD[0], MeanStD[0]])
             np.savetxt(handle1, out.reshape(1,out.shape[0]))
             
-            out = np.array([SNR, Mean-inputValues[0], StD, MeanStD])
+            out = np.array([SNR, Mean[0]-inputValues[0], StD[0], MeanStD[0]])
             np.savetxt(handle2, out.reshape(1,out.shape[0]))
             
         else:
@@ -79,16 +90,14 @@ if(doBC[1]):
     handle2.write('## Recovered statistics as a result of bias run. Output of form [Bias, StD, Error on Bias] repeated for all fit quantities \n')
     
     for SNR in np.arange(*SNRRange):
-        Input = np.genfromtxt(directory+filePrefix+'_SNR'+str(SNR)+'_BC'+fileSuffix)
-        
-        Mean = Input.mean(axis = 0); StD = Input.std(axis = 0); MeanStD = StD/np.sqrt(Input.shape[0])
+        Mean, StD, MeanStD = get_File_Statistics(directory+filePrefix+'_SNR'+str(SNR)+'_BC'+fileSuffix)
         
 
         if(nPar == 1):
-            out = np.array([SNR, Mean, StD, MeanStD])
+            out = np.array([SNR, Mean[0], StD[0], MeanStD[0]])
             np.savetxt(handle1, out.reshape(1,out.shape[0]))
             
-            out = np.array([SNR, Mean-inputValues[0], StD, MeanStD])
+            out = np.array([SNR, Mean[0]-inputValues[0], StD[0], MeanStD[0]])
             np.savetxt(handle2, out.reshape(1,out.shape[0]))
             
         else:
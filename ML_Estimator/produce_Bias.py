@@ -7,7 +7,9 @@ import numpy as np
 import python.image_measurement_ML as ML
 import python.model_Production as modPro
 import python.surface_Brightness_Profiles as SBPro
+import python.runningStatistics as runStats
 import sys
+import os
 from python.IO import *
 
 Output = './ML_Output/Bio/'
@@ -25,8 +27,26 @@ if(len(sys.argv) >= 2):
     SNRRange = [inputSNR, inputSNR, 1.]
 else:
     SNRRange = [5., 505., 100.] #Min, Max, Interval
-minimiseMethod = 'simplex'#'Powell' #Acceptable are: simplex, powell, cg, ncg, bfgs, l_bfgs_b. See scipy documentation for discussion of these methods
+minimiseMethod = 'simplex'#'Powell' #Acceptable are: simplex, powell, cg, ncg, bfgs, l_bfgs_b, tnc (see scipy documentation for discussion of these methods; the gradient-based methods use the analytic gradient, see ML.gradient_ML_Search), and lm (least-squares search using the analytic model Jacobian, see ML.least_Squares_ML_Search)
 errorType = 'Fisher'
+## If True, realisations are produced and fit in batches of catalogueBatchSize, using the batched least-squares search of ML.find_ML_Estimator_Catalogue, rather than one at a time with minimiseMethod. preSearchMethod, the model lookup and profileLinear are not used in this case
+catalogueFit = False
+catalogueBatchSize = 10000
+## Maximum number of realisations in each SNR bin of bias_bySNR. A bin stops early (beyond 10000 realisations) once the error on the bias of every fit parameter is within percentError percent
+nRealisation = 10000000
+percentError = 1
+## Number of processes over which the realisations of bias_bySNR are distributed: 1 runs serially, and 0 (or None) uses every core on the node. Realisations are fit in chunks of parallelChunkSize, each with an independent random stream seeded by (randomSeed, SNR bin, chunk). If randomSeed is None, a seed is drawn and reported so that the run can be repeated. A chunk which fails is resubmitted up to maxChunkRetry times before the run is aborted
+nProcess = 1
+parallelChunkSize = 1000
+randomSeed = None
+maxChunkRetry = 1
+## Time (seconds) to wait for a chunk before it is treated as failed and resubmitted (e.g. where the worker running it was killed). None waits indefinitely
+chunkTimeout = 3600.
+## Format of the realisation output: 'binary' writes appendable binary tables (.bin, see IO.open_Binary_Table) labelled by fit parameter, with the image parameters in the header, which are memory-mapped on loading (see IO.load_Result_Table); 'ascii' writes one text row per realisation (.dat)
+outputFormat = 'binary'
+## If not None, bias_bySNR checkpoints its state (completed SNR bins, running statistics, random state and output position of the current bin) to this file at least every checkpointInterval seconds, and at the end of each SNR bin. A run started with an identical configuration restarts from the checkpoint, discarding any output written after it. The checkpoint is removed once the run completes
+checkpointFile = None
+checkpointInterval = 600.
 
 ##Input default values for parameters which will be fitted (this is used to set fitParams, so parameters to be fit must be entered here)
 fittedParameters = dict(size = 1.41)
@@ -38,6 +58,9 @@ initialGuess = dict(size = 1.41)
 
 fitParamsLabels = fittedParameters.keys(); fitParamsValues = fittedParameters.values()
 
+## Linear parameters (flux and/or bg) in fitParamsLabels which are solved for by linear least squares for each trial of the remaining parameters, rather than searched over (see ML.find_ML_Estimator). Where used, bruteRange, initialGuess and any lookup refer to the remaining parameters only. None searches over all
+profileLinear = None
+
 ## preSearchMethod defines whether a grid-based method is used to define an initial guess. Will give a lot of slow-down for large parameter spaces, but likely to reduce the effect of local mimina or dependancies on initial guesses
 preSearchMethod = 'grid'
 ## bruteRange must be a tuple of 2-element lists (or three element slice), even in the 1D case
@@ -55,8 +78,10 @@ imageParams = modPro.default_ModelParameter_Dictionary(SB = dict(size = 1.41, e1
                                                        )
 
 
-## Model Lookup Defintions - Overridden in the number of fitted parameters is greater than one
+## Model Lookup Defintions. Lookups may be over any number of fitted parameters (lookupRange and lookupWidth must be conformal with fitParamsLabels)
 useLookup = False
+## Interpolation used in the lookup: None (nearest grid point), 'linear' or 'cubic'. Where interpolated, the model derivatives are also taken from the lookup
+lookupInterp = None
 ## 1D Ellipticity lookup
 '''
 lookupRange = [-0.99, 0.99]
@@ -70,6 +95,8 @@ lookupWidth = [0.01,0.01]
 ##High Res 2D Ellipticity lookup
 lookupRange = [[0.2, 0.4],[0.2, 0.4]]
 lookupWidth = [0.001,0.001]
+## Lookup tables are stored here, and reused by any run with an identical configuration. Set to None to construct the table in memory for each run
+lookupCache = './ML_Output/Lookup/'
 
 
 
@@ -87,47 +114,200 @@ def bias_bySNR_analytic():
     global imageParams
     modPro.set_modelParameter(imageParams, fitParamsLabels, fitParamsValues)
 
-    handle = intialise_Output(Output+filePrefix+'_AnaBias.dat', mode = 'a')
+    handle = initialise_Output(Output+filePrefix+'_AnaBias.dat', mode = 'a')
     handle.write('## Recovered statistics as a result of bias run, single fit at a time, done analytically. Output of form [Bias] repeated for all fit quantities \n')
     for k in fitParamsLabels:
         handle.write('#'+str(k)+' = '+str(fittedParameters[k])+'\n')
 
+    ## SNR bins, as in bias_bySNR
+    SNR = []
     S = -1 #Counter
-    filenames = []
-
-    e = 0 ##Loop over this for multiple runs
     while True:
-        print '\n'+400*'-'
-        
         S += 1
-        SNR = SNRRange[0] + S*SNRRange[2]
-
-        ##Exit Condition
-        if(SNR > SNRRange[1]):
+        if(SNRRange[0] + S*SNRRange[2] > SNRRange[1]):
             break
+        SNR.append(SNRRange[0] + S*SNRRange[2])
+    SNR = np.array(SNR)
 
-        ##Set Model
-        imageParams['SNR'] = SNR
+    ## The model derivatives and bias components are evaluated once, and the bias rescaled for the noise of each SNR
+    bias, noise = mBias.analytic_GaussianLikelihood_Bias_byNoise(fitParamsValues, fitParamsLabels, imageParams, SNR = SNR, diffType = 'ana')
+
+    for S in range(SNR.shape[0]):
+        print 'Analytic Bias for SNR:', SNR[S], ' with noise:', noise[S], ' is :', bias[S]
+
+    ### different to bias_bySNR
+    np.savetxt(handle, np.hstack((SNR.reshape(-1,1), bias)))
+
+    handle.close()
+
+##--------------- Parallel execution of bias_bySNR ---------------##
+## State shared by all chunks run on a worker, set once when the worker starts (see initialise_Bias_Worker)
+_workerState = {}
 
-        ##Produce image to update noise to correct value (THIS IS A HACK AND NEEDS CHANGED) - estimate_Noise works fairly well, but you need to specify the noise correctly
-        #disc, imageParams = modPro.get_Pixelised_Model(imageParams, noiseType = 'G', outputImage = False)
+def initialise_Bias_Worker(noiseFreeImage, modelLookup, currentRun = None):
+    '''
+    Initialiser for the worker processes used by bias_bySNR. Stores the noise-free image and model lookup, so that these are set once per worker rather than sent with every chunk. A lookup stored on disk is reopened memory-mapped, so that all workers share a single copy through the page cache.
+    currentRun is a shared counter (multiprocessing.Value) labelling the SNR bin currently being run, which is advanced once a bin stops, so that chunks of a finished bin still queued are skipped (see fit_Realisation_Chunk).
+    '''
+    if(modelLookup is not None and modelLookup.get('filename', None) is not None):
+        interp = modelLookup['interp']
+        modelLookup = modPro.load_Model_Lookup(modelLookup['filename'])
+        modelLookup['interp'] = interp
+    _workerState['noiseFreeImage'] = noiseFreeImage
+    _workerState['modelLookup'] = modelLookup
+    _workerState['currentRun'] = currentRun
+
+def fit_Realisation_Chunk(chunkParams, seed, nReal, run = None):
+    '''
+    Produces nReal noisy realisations of the noise-free image held by the worker, using a random stream seeded by seed, and fits each as bias_bySNR (see catalogueFit). Run on a worker of the pool in bias_bySNR.
+
+    Requires:
+    -- chunkParams: model dictionary for the realisations, with noise set for the SNR bin
+    -- seed: seed (or sequence of seeds) for np.random.RandomState
+    -- nReal: number of realisations
+    -- run: label of the run (SNR bin) the chunk belongs to. If this is no longer the current run (see initialise_Bias_Worker), the chunk is not needed and is skipped (checked on starting the chunk, and between realisations where these are fit one at a time)
+
+    Returns:
+    -- MaxL, BCMaxL: [nReal, nPar] ML estimates and bias-corrected estimates. The latter is None where not evaluated
+    -- stats: running statistics accumulator of MaxL over the chunk (see runningStatistics), to be merged into that of the SNR bin
+    Returns None where the chunk is skipped.
+    '''
+    currentRun = _workerState.get('currentRun', None)
+    stale = lambda: (run is not None and currentRun is not None and currentRun.value != run)
+    if(stale()):
+        return None
+
+    noiseFreeImage = _workerState['noiseFreeImage'].flatten()
+    rng = np.random.RandomState(seed)
+    images = noiseFreeImage[None,:] + chunkParams['noise']*rng.randn(nReal, noiseFreeImage.shape[0])
+
+    if(catalogueFit):
+        MLReturn = ML.find_ML_Estimator_Catalogue(images, fitParamsLabels, setParams = chunkParams, initialGuess = [initialGuess[k] for k in fitParamsLabels], biasCorrect = biasCorrect, error = errorType)
+    else:
+        ## The run is checked between realisations, so that a chunk no longer needed stops early
+        MLReturn = []
+        for real in range(nReal):
+            if(stale()):
+                return None
+            MLReturn.append(ML.find_ML_Estimator(images[real], modelLookup = _workerState['modelLookup'], fitParams = fitParamsLabels, searchMethod = minimiseMethod, preSearchMethod = preSearchMethod, bruteRange = bruteRange, biasCorrect = biasCorrect, error = errorType, setParams = chunkParams.copy(), profileLinear = profileLinear, **initialGuess))
+        MLReturn = [np.array(r) for r in zip(*MLReturn)]
+
+    MaxL = MLReturn[0]
+    BCMaxL = (MLReturn[1] if biasCorrect else None)
+    return MaxL, BCMaxL, runStats.get_Batch_Running_Statistics(MaxL)
+
+def run_Realisations_Parallel(pool, nWorker, chunkParams, seed, nRealisation, handle, bchandle, stats, percentError, startChunk = 0, checkpoint = None, currentRun = None):
+    '''
+    Runs the realisations of a single SNR bin of bias_bySNR across a pool of nWorker workers, in chunks of parallelChunkSize. A limited number of chunks are in flight at once, so that the run can stop once percentError is reached. Results are gathered here in chunk order and written to handle (and bchandle), and the running statistics of each chunk merged into stats.
+    The run starts from chunk startChunk, where stats must already contain the realisations of the previous chunks (on restarting from a checkpoint). If passed, checkpoint is called with the index of the next chunk to run after each chunk is gathered.
+    If passed, currentRun (the shared counter of initialise_Bias_Worker) is advanced when the run stops, so that chunks submitted beyond the stopping point are skipped by the workers rather than run. A chunk not returned within chunkTimeout seconds is treated as failed, and resubmitted as for a chunk which raised.
 
-        ## Check image to get SNR
-        imageSB, imageParams = modPro.user_get_Pixelised_Model(imageParams, outputImage = True, sbProfileFunc = SBPro.gaussian_SBProfile_Weave)
-        imageParams['noise'] = modPro.SNR_Mapping(imageSB, SNR = SNR)
+    Returns:
+    -- nDone: number of realisations completed
+    '''
+    nChunk = int(np.ceil(float(nRealisation)/parallelChunkSize))
+    nInFlight = 2*nWorker
 
-        print 'Analytic Bias Check: For SNR', SNR, ' has noise var:', imageParams['noise']
+    run = (currentRun.value if currentRun is not None else None)
 
-        bias = np.array(mBias.analytic_GaussianLikelihood_Bias(fitParamsValues, fitParamsLabels, imageParams, diffType = 'ana'))
-        #bias = np.array([mBias.analytic_GaussianLikelihood_Bias(fitParamsValues[e], fitParamsLabels[e], imageParams, diffType = 'ana')])
+    def submit(c):
+        nReal = min(parallelChunkSize, nRealisation - c*parallelChunkSize)
+        return pool.apply_async(fit_Realisation_Chunk, (chunkParams, list(seed)+[c], nReal, run))
 
-        print '\n Analytic Bias for SNR:', SNR, ' is :', bias
-        print ' '
+    try:
+        nDone = gather_Realisation_Chunks(submit, nChunk, nInFlight, chunkParams, handle, bchandle, stats, percentError, startChunk, checkpoint)
+    finally:
+        ## Any chunks submitted beyond the stopping point are skipped
+        if(currentRun is not None):
+            currentRun.value += 1
+    return nDone
 
-        ### different to bias_bySNR
-        np.savetxt(handle, np.hstack((np.array(SNR).reshape(1,1),bias.reshape(1,bias.shape[0]))))#.reshape(1,bias.shape[1]+1))
+def gather_Realisation_Chunks(submit, nChunk, nInFlight, chunkParams, handle, bchandle, stats, percentError, startChunk, checkpoint):
+    '''
+    Submits (using submit) and gathers the chunks of run_Realisations_Parallel in order, keeping nInFlight in flight, until all nChunk have run or percentError is reached. Failed chunks are resubmitted up to maxChunkRetry times.
 
-    handle.close()
+    Returns:
+    -- nDone: number of realisations completed
+    '''
+    import multiprocessing
+
+    pending = {}
+    nextChunk = startChunk; nDone = stats['n']
+    for c in range(startChunk, nChunk):
+        while(nextChunk < nChunk and nextChunk < c + nInFlight):
+            pending[nextChunk] = [submit(nextChunk), 0]
+            nextChunk += 1
+
+        while True:
+            try:
+                cMaxL, cBCMaxL, cStats = pending[c][0].get(chunkTimeout)
+                break
+            except Exception as e:
+                if(isinstance(e, multiprocessing.TimeoutError)):
+                    e = 'no result within chunkTimeout = '+str(chunkTimeout)+'s'
+                if(pending[c][1] >= maxChunkRetry):
+                    raise RuntimeError('bias_bySNR - chunk '+str(c)+' failed after '+str(pending[c][1]+1)+' attempts: '+str(e))
+                print 'bias_bySNR - chunk', c, 'failed (', str(e), '): resubmitting'
+                pending[c] = [submit(c), pending[c][1]+1]
+        del pending[c]
+
+        write_Rows(handle, cMaxL)
+        if(cBCMaxL is not None):
+            write_Rows(bchandle, cBCMaxL)
+        runStats.merge_Running_Statistics(stats, cStats)
+        nDone += cMaxL.shape[0]
+        if(checkpoint is not None):
+            checkpoint(chunk = c+1)
+
+        if(nDone > 10000 and check_Bias_Convergence(stats, chunkParams['SNR'], percentError)):
+            break
+
+    return nDone
+
+def check_Bias_Convergence(stats, SNR, percentError):
+    '''
+    Stopping test for the realisations of an SNR bin of bias_bySNR: returns True (and reports) once the error on the mean of every fit parameter is within percentError percent of its bias, evaluated from the running statistics stats of the ML estimates. A non-positive percentError never stops.
+    '''
+    if(percentError <= 0.):
+        return False
+    reached, Bias, Err, percent = runStats.percentError_Reached(stats, fitParamsValues, percentError)
+    if(reached):
+        print '\n For SNR:', SNR, ' percentage error was reached in ', stats['n'], ' simulated images'
+        print 'With mean, std, %Err:', Bias, Err, percent
+    return reached
+
+def open_Realisation_Output(filename, title, mode = 'a', position = None):
+    '''
+    Opens the output for the realisations of an SNR bin of bias_bySNR, in outputFormat, with the current imageParams as header. filename is given without extension. Results are appended (mode = 'a') or overwrite any existing output (mode = 'w').
+    If position is not None, the output is being resumed from a checkpoint: the file is truncated to position bytes (see get_Output_Position), and appended to without a new header.
+
+    Returns:
+    -- handle: open file or binary table sink, to be written with write_Rows
+    '''
+    if(outputFormat == 'binary'):
+        if(position is not None):
+            truncate_Output(filename+'.bin', position)
+        return open_Binary_Table(filename+'.bin', fitParamsLabels, header = dict(title = title, imageParams = imageParams), mode = ('a' if position is not None else mode))
+    elif(outputFormat == 'ascii'):
+        if(position is not None):
+            truncate_Output(filename+'.dat', position)
+            return initialise_Output(filename+'.dat', mode = 'a')
+        handle = initialise_Output(filename+'.dat', mode = mode)
+        ##Write Header
+        handle.write('# '+title+'. Following is input image parameters \n')
+        for k in imageParams.keys():
+            handle.write('#'+str(k)+' = '+str(imageParams[k])+'\n')
+        return handle
+    else:
+        raise ValueError('open_Realisation_Output - outputFormat not recognised: '+str(outputFormat))
+
+def get_Bias_Run_Configuration(nRealisation, percentError):
+    '''
+    Returns the configuration of a bias_bySNR run, used to check that a checkpoint is only resumed by an identical run.
+    '''
+    return dict(Output = Output, filePrefix = filePrefix, SNRRange = SNRRange, nRealisation = nRealisation, percentError = percentError, fittedParameters = fittedParameters, initialGuess = initialGuess, imageParams = imageParams,\
+                minimiseMethod = minimiseMethod, preSearchMethod = preSearchMethod, bruteRange = bruteRange, errorType = errorType, biasCorrect = biasCorrect, profileLinear = profileLinear, useLookup = useLookup,\
+                catalogueFit = catalogueFit, catalogueBatchSize = catalogueBatchSize, parallel = (nProcess != 1), parallelChunkSize = parallelChunkSize, randomSeed = randomSeed, outputFormat = outputFormat)
 
 def bias_bySNR():
     '''
@@ -138,9 +318,6 @@ def bias_bySNR():
     '''
     print 'Producing Bias by SNR ratio'
 
-    nRealisation = 10000000 
-    percentError = 1
-
     global imageParams    
     modPro.set_modelParameter(imageParams, fitParamsLabels, fitParamsValues)
 
@@ -148,14 +325,49 @@ def bias_bySNR():
     noiseFreeImage, disc = modPro.user_get_Pixelised_Model(imageParams, noiseType = None, sbProfileFunc = SBPro.gaussian_SBProfile_CXX)
 
     modelLookup = None
-    if(len(fitParamsLabels) <= 2 and useLookup):
-        modelLookup =  modPro.get_Model_Lookup(imageParams, fitParamsLabels, lookupRange, lookupWidth, noiseType = None, sbProfileFunc = SBPro.gaussian_SBProfile_CXX)
+    if(useLookup):
+        ## Profiled parameters are not included in the lookup
+        lookupLabels = [l for l in fitParamsLabels if profileLinear is None or l not in profileLinear]
+        modelLookup =  modPro.get_Model_Lookup(imageParams, lookupLabels, lookupRange, lookupWidth, cacheDirectory = lookupCache, interp = lookupInterp, noiseType = None, sbProfileFunc = SBPro.gaussian_SBProfile_CXX)
         print 'Created model lookup table'
 
+    ## Restart from the checkpoint of an interrupted run with this configuration, if present
+    runHash = hash_Configuration(get_Bias_Run_Configuration(nRealisation, percentError))
+    resume = read_Checkpoint(checkpointFile, runHash)
+    if(resume is not None):
+        print 'Restarting from checkpoint', checkpointFile, 'in SNR bin', resume['S'], 'after', resume['statsStore'][-1]['n'], 'realisations'
+
+    ## Pool of workers, each holding the noise-free image and lookup
+    pool = None; seed = None; currentRun = None
+    if(nProcess != 1):
+        import multiprocessing
+        nWorker = (nProcess if nProcess else multiprocessing.cpu_count())
+        currentRun = multiprocessing.Value('l', 0)
+        pool = multiprocessing.Pool(nWorker, initializer = initialise_Bias_Worker, initargs = (noiseFreeImage, modelLookup, currentRun))
+        seed = (resume['seed'] if resume is not None else randomSeed)
+        if(seed is None):
+            seed = np.random.randint(0, 2**31-1)
+        print 'Running realisations over', nWorker, 'processes, with random seed:', seed
+
 
     print 'Simulating Bias in SNR bins:\n'
     S = -1 #Counter
-    filenames = []; SNRStore = []
+    SNRStore = []; statsStore = []
+    if(resume is not None):
+        SNRStore = resume['SNRStore']; statsStore = resume['statsStore']
+        S = resume['S'] - (0 if resume['binComplete'] else 1)
+        np.random.set_state(resume['randomState'])
+
+    import time
+    lastCheckpoint = [time.time()]
+    def checkpoint(force = False, binComplete = False, chunk = 0):
+        ## Writes the state of the current SNR bin S to checkpointFile, where checkpointInterval has passed since the last checkpoint (or force)
+        if(checkpointFile is None or (not force and time.time() - lastCheckpoint[0] < checkpointInterval)):
+            return
+        outputPosition = [get_Output_Position(handle), (get_Output_Position(bchandle) if bchandle is not None else None)]
+        write_Checkpoint(checkpointFile, dict(S = S, seed = seed, SNRStore = SNRStore, statsStore = statsStore, randomState = np.random.get_state(), binComplete = binComplete, chunk = chunk, outputPosition = outputPosition), runHash)
+        lastCheckpoint[0] = time.time()
+
     while True:
         S += 1
         SNR = SNRRange[0] + S*SNRRange[2]
@@ -167,90 +379,111 @@ def bias_bySNR():
         ##Set Model
         imageParams['SNR'] = SNR
 
-        ## Store SNR for output
-        SNRStore.append(SNR)
+        ## Mean and variance of the ML estimates are accumulated as the realisations are run, rather than storing each. A bin interrupted at the checkpoint continues from its checkpointed statistics and output
+        binResume = (resume if (resume is not None and not resume['binComplete'] and resume['S'] == S) else None)
+        if(binResume is None):
+            ## Store SNR for output
+            SNRStore.append(SNR)
+            stats = runStats.initialise_Running_Statistics(len(fitParamsLabels))
+            statsStore.append(stats)
+            outputPosition = [None, None]
+        else:
+            stats = statsStore[S]
+            outputPosition = binResume['outputPosition']
 
-        ##Intialise output and set header
-        filenames.append(Output+filePrefix+'_SNR'+str(SNR)+'.dat')
-        handle = intialise_Output(filenames[S], mode = 'a')
-        ##Write Header
-        handle.write('# Bias Run Output. Following is input image parameters \n')
-        for k in imageParams.keys():
-            handle.write('#'+str(k)+' = '+str(imageParams[k])+'\n')
+        ##Intialise output and set header. Where checkpointing, the output of the bin is started afresh, as any previous output is not covered by the checkpoint
+        outputMode = ('a' if checkpointFile is None else 'w')
+        handle = open_Realisation_Output(Output+filePrefix+'_SNR'+str(SNR), 'Bias Run Output', mode = outputMode, position = outputPosition[0])
 
         ## Output Bias Corrected value
         bchandle = None
         if(biasCorrect):
-            bchandle = intialise_Output(Output+filePrefix+'_SNR'+str(SNR)+'_BC.dat', mode = 'a')
-            bchandle.write('# Bias Corrected Bias Run Output. Following is input image parameters \n')
-            for k in imageParams.keys():
-                bchandle.write('#'+str(k)+' = '+str(imageParams[k])+'\n')
+            bchandle = open_Realisation_Output(Output+filePrefix+'_SNR'+str(SNR)+'_BC', 'Bias Corrected Bias Run Output', mode = outputMode, position = outputPosition[1])
+
+        if(pool is not None):
+            ## Noise is set by the SNR, as in user_get_Pixelised_Model
+            imageParams['noise'] = modPro.SNR_Mapping(noiseFreeImage, SNR = SNR)
+            try:
+                run_Realisations_Parallel(pool, nWorker, imageParams.copy(), [seed, S], nRealisation, handle, bchandle, stats, percentError, startChunk = (binResume['chunk'] if binResume is not None else 0), checkpoint = checkpoint, currentRun = currentRun)
+            except:
+                pool.terminate()
+                raise
+        elif(catalogueFit):
+            ## All realisations in a batch are fit together. Noise is set by the SNR, as in user_get_Pixelised_Model
+            imageParams['noise'] = modPro.SNR_Mapping(noiseFreeImage, SNR = SNR)
+            real = stats['n']
+            while real < nRealisation:
+                nBatch = min(catalogueBatchSize, nRealisation-real)
+                images = noiseFreeImage.flatten()[None,:] + imageParams['noise']*np.random.randn(nBatch, noiseFreeImage.size)
+
+                MLReturn = ML.find_ML_Estimator_Catalogue(images, fitParamsLabels, setParams = imageParams, initialGuess = [initialGuess[k] for k in fitParamsLabels], biasCorrect = biasCorrect, error = errorType)
+                runStats.update_Running_Statistics(stats, MLReturn[0])
+                write_Rows(handle, MLReturn[0])
+                if(biasCorrect):
+                    write_Rows(bchandle, MLReturn[1])
+                real += nBatch
+                checkpoint()
+
+                if(real > 10000 and check_Bias_Convergence(stats, SNR, percentError)):
+                    break
+        else:
+            for real in range(stats['n'], nRealisation):
+                ### Produce a data set for the realisations
             
+                ## This version uses GALSIM default
+                #image, imageParams = modPro.get_Pixelised_Model(imageParams, noiseType = 'G')
 
-        MaxL = np.zeros((nRealisation, len(fitParamsLabels))); BCMaxL = np.zeros(MaxL.shape); MaxLErr = np.zeros(MaxL.shape)
-        for real in range(nRealisation):
-            ### Produce a data set for the realisations
-            
-            ## This version uses GALSIM default
-            #image, imageParams = modPro.get_Pixelised_Model(imageParams, noiseType = 'G')
-
-            ## GALSIM with user-defined SB Profile
-            #image, imageParams = modPro.get_Pixelised_Model(imageParams, noiseType = 'G', sbProfileFunc = SBPro.gaussian_SBProfile_Weave)
-            ## SYMPY - Very slow
-            #modPro.get_Pixelised_Model_wrapFunction(0., imageParams, noiseType = 'G', outputImage = False, sbProfileFunc = SBPro.gaussian_SBProfile_Sympy)
-
-            ## Entirely user-defined
-            image, imageParams = modPro.user_get_Pixelised_Model(imageParams, noiseType = 'G', sbProfileFunc = SBPro.gaussian_SBProfile_CXX, inputImage = noiseFreeImage)
-
-            #MLEx = ML.find_ML_Estimator(image, modelLookup = None, fitParams = fittedParameters.keys(),  outputHandle = None, setParams = imageParams, e1 = 0.35) ##Needs edited to remove information on e1 (passed in for now) - This should only ever be set to the parameters being fit
-
-            ##Find usign lookup table where appropriate
-            MLReturn = ML.find_ML_Estimator(image, modelLookup = modelLookup, fitParams = fitParamsLabels,  outputHandle = handle, searchMethod = minimiseMethod, preSearchMethod = preSearchMethod, bruteRange = bruteRange, biasCorrect = biasCorrect, bcoutputHandle = bchandle, error = errorType, setParams = imageParams.copy(), **initialGuess)
-            if(biasCorrect):
-                MaxL[real,:], BCMaxL[real,:] = MLReturn[0:2]
-                if(len(MLReturn) == 3): #Erro is output
-                    MaxLErr[real,:] = MLReturn[2]
-            else:
-                MaxL[real,:] = MLReturn[0]
-                if(len(MLReturn) == 2):#Error is output
-                    MaxLErr[real,:] =  MLReturn[1]
-
-            if(real > 10000 and real%1000 == 0 and percentError > 0.):
-                Mean = (MaxL[:real,:].mean(axis = 0)-fitParamsValues); Err = MaxL[:real,:].std(axis = 0)/np.sqrt(real)
-                if((np.absolute(100.*(Err/Mean)) < percentError).sum() == MaxL.shape[1]):
-                    print '\n For SNR:', SNR, ' percentage error was reached in ', real, ' simulated images'
-                    print 'With mean, std, %Err:', Mean, Err, np.absolute(100.*(Err/Mean))
+                ## GALSIM with user-defined SB Profile
+                #image, imageParams = modPro.get_Pixelised_Model(imageParams, noiseType = 'G', sbProfileFunc = SBPro.gaussian_SBProfile_Weave)
+                ## SYMPY - Very slow
+                #modPro.get_Pixelised_Model_wrapFunction(0., imageParams, noiseType = 'G', outputImage = False, sbProfileFunc = SBPro.gaussian_SBProfile_Sympy)
+
+                ## Entirely user-defined
+                image, imageParams = modPro.user_get_Pixelised_Model(imageParams, noiseType = 'G', sbProfileFunc = SBPro.gaussian_SBProfile_CXX, inputImage = noiseFreeImage)
+
+                #MLEx = ML.find_ML_Estimator(image, modelLookup = None, fitParams = fittedParameters.keys(),  outputHandle = None, setParams = imageParams, e1 = 0.35) ##Needs edited to remove information on e1 (passed in for now) - This should only ever be set to the parameters being fit
+
+                ##Find usign lookup table where appropriate
+                MLReturn = ML.find_ML_Estimator(image.flatten(), modelLookup = modelLookup, fitParams = fitParamsLabels,  outputHandle = handle, searchMethod = minimiseMethod, preSearchMethod = preSearchMethod, bruteRange = bruteRange, biasCorrect = biasCorrect, bcoutputHandle = bchandle, error = errorType, setParams = imageParams.copy(), profileLinear = profileLinear, **initialGuess)
+                runStats.update_Running_Statistics(stats, MLReturn[0])
+                checkpoint()
+
+                if(real > 10000 and real%1000 == 0 and check_Bias_Convergence(stats, SNR, percentError)):
                     break
 
-            #print '----- Realisation:', real, ':: Ex:', MLEx, ' Look:', MLLook, ' :: Ratio:', MLEx/MLLook
-            #raw_input('Check')
+                #print '----- Realisation:', real, ':: Ex:', MLEx, ' Look:', MLLook, ' :: Ratio:', MLEx/MLLook
+                #raw_input('Check')
 
-        handle.close()
+        checkpoint(force = True, binComplete = True)
+        close_Output(handle)
+        if(bchandle is not None):
+            close_Output(bchandle)
 
+    if(pool is not None):
+        ## All required chunks have been gathered: any still queued or running are not needed. The pool is terminated rather than closed, as a chunk lost with a killed worker would otherwise block the join
+        pool.terminate(); pool.join()
 
     ### Construct and output mean, std and error on mean for each fit parameter
-    handle1 = intialise_Output(Output+filePrefix+'_Statistics.dat', mode = 'a')
+    handle1 = initialise_Output(Output+filePrefix+'_Statistics.dat', mode = 'a')
     handle1.write('## Recovered statistics as a result of bias run. Output of form [Mean, StD, Error on Mean] repeated for all fit quantities \n')
     for k in fittedParameters.keys():
         handle1.write('#'+str(k)+' = '+str(fittedParameters[k])+'\n')
 
-    handle2 = intialise_Output(Output+filePrefix+'_Bias.dat', mode = 'a')
+    handle2 = initialise_Output(Output+filePrefix+'_Bias.dat', mode = 'a')
     handle2.write('## Recovered statistics as a result of bias run. Output of form [Bias, StD, Error on Bias] repeated for all fit quantities \n')
     for k in fittedParameters.keys():
         handle2.write('#'+str(k)+' = '+str(fittedParameters[k])+'\n')
 
-    ##Produce Mean, StD from sampling and output
-    for f in range(len(filenames)):
-        Input = np.genfromtxt(filenames[f])
-
+    ##Produce Mean, StD from the running statistics of each SNR bin and output
+    for f in range(len(SNRStore)):
         SNR = SNRStore[f]
-        Mean = Input.mean(axis = 0); StD = Input.std(axis = 0); MeanStD = StD/np.sqrt(Input.shape[0])
+        Mean, StD, MeanStD = runStats.get_Running_Statistics(statsStore[f])
 
         if(len(fittedParameters.keys()) == 1):
-            out = np.array([SNR, Mean, StD, MeanStD])
+            out = np.array([SNR, Mean[0], StD[0], MeanStD[0]])
             np.savetxt(handle1, out.reshape(1,out.shape[0]))
             
-            out = np.array([SNR, Mean-fittedParameters.values()[0], StD, MeanStD])
+            out = np.array([SNR, Mean[0]-fittedParameters.values()[0], StD[0], MeanStD[0]])
             np.savetxt(handle2, out.reshape(1,out.shape[0]))
 
         else:
@@ -261,6 +494,9 @@ def bias_bySNR():
             np.savetxt(handle2, out.reshape(1,out.shape[0]))
 
 
+    if(checkpointFile is not None and os.path.exists(checkpointFile)):
+        os.remove(checkpointFile)
+
     print 'Finished SNR Bias loop without incident'
 
 
@@ -279,7 +515,7 @@ if __name__ == "__main__":
     ''' #Single Run - ML Estimate
     print 'Running'
 
-    handle = intialise_Output('./ML_Output/SNR_500./Test.dat', mode = 'a')
+    handle = initialise_Output('./ML_Output/SNR_500./Test.dat', mode = 'a')
 
     for i in range(10000000):
         print 'Doing:', i
@@ -3,6 +3,8 @@ import numpy as np
 import os
 import time
 
+## Superseded by setting nProcess in produce_Bias.py, which distributes the realisations of each SNR bin over a pool of processes and gathers the results
+
 SNRRange = [20., 36., 5.]
 ##This manually needs changed in both routines
 outputDirectory = './ML_Output/SNRBias/28Aug2015/2D/e1_e2/xtol_minus5/NoLookup/Simplex/BiasCorrected/LowSNR/'
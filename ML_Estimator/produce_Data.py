@@ -18,8 +18,9 @@ imageParams = modPro.default_ModelParameter_Dictionary(SB = dict(size = 1.41, e1
                                                        centroid = (np.array(imageShape)+1)/2., noise = 10., SNR = 50., stamp_size = imageShape, pixel_scale = 1.,\
                                                        PSF = dict(PSF_Type = 0, PSF_size = 0.05, PSF_Gauss_e1 = 0., PSF_Gauss_e2 = 0.0))
 
-def produce_Realisations(imageParams, nReal = 1000, ccdSpecs = None, noiseFunc = nDist.PN_Likelihood, outputPrefix = os.path.join(Output,"Realisations.dat"), suppressOutput = False): 
+def produce_Realisations(imageParams, nReal = 1000, ccdSpecs = None, noiseFunc = nDist.PN_Likelihood, outputPrefix = os.path.join(Output,"Realisations.dat"), suppressOutput = False, direct = True): 
     #Single Run - Derivative
+    #Where noiseFunc has a direct sampler (see noiseDistributions.directSamplers) and direct is True, all pixels of all realisations are drawn in a single vectorised call. Otherwise each pixel is inverse sampled from the tabulated noiseFunc
     print 'Running Data Production'
     
     ##Surface Brightness profile routine
@@ -46,29 +47,37 @@ def produce_Realisations(imageParams, nReal = 1000, ccdSpecs = None, noiseFunc =
         ccdSpecs = dict(qe = 0.9, charge = 0.001, readout = 1., ADUf = 1)
         
     #Produce noise realisations by sampling from the correct distribution
+    if(direct and noiseFunc in nDist.directSamplers):
+        nImage = nDist.directSamplers[noiseFunc](fImage, ccdSpecs, nReal)
+    else:
+        nImage = produce_Realisations_Inverse(fImage, nReal, ccdSpecs, noiseFunc)
+
+    #Output to file
+    if(not suppressOutput):
+        np.savetxt(handle, nImage)
+        handle.close()
+            
+    print "Finished sampling"
+
+    return fImage, nImage
+
+def produce_Realisations_Inverse(fImage, nReal, ccdSpecs, noiseFunc):
+    #Produces nReal noise realisations of the flattened image fImage, by inverse sampling each pixel from the likelihood noiseFunc tabulated on a grid of counts
+    #CDF tables are cached, so that pixels with the same expected photon count share a table (see noiseDistributions.get_Inverse_CDF_Table)
     nImage = np.zeros((nReal,fImage.shape[0]))
     for i in range(fImage.shape[0]):
-        counts, pdf = noiseFunc(fImage[i], ccdSpecs)
-        
         try:
-            nImage[:,i] = nDist.inverse_Sample(counts, pdf, nReal)
+            nImage[:,i] = nDist.inverse_Sample_Table(fImage[i], ccdSpecs, nReal, noiseFunc)
         except ValueError as e:
             print "Sampling failed for likelihood shown::"
             print "Exception raised: ", e.args[0]
+            counts, pdf = noiseFunc(fImage[i], ccdSpecs)
             f = pl.figure(); ax = f.add_subplot(111)
             ax.plot(counts, pdf)
             pl.show()
             exit()
 
-    #Output to file
-    if(not suppressOutput):
-        for i in range(nReal):
-            np.savetxt(handle, nImage[i].reshape(1,nImage.shape[1]))
-        handle.close()
-            
-    print "Finished sampling"
-
-    return fImage, nImage
+    return nImage
 
 
 if __name__ == "__main__":
@@ -27,3 +27,333 @@ def initialise_Output(filename, mode = 'w', verbose = True):
         print 'File will be output to: ',filename
 
     return handle
+
+### Binary array files, with a JSON header. These are laid out as:
+### -- binaryMagic
+### -- header length (8 bytes, little-endian unsigned integer)
+### -- JSON header, padded with spaces so that the array data is aligned to binaryAlignment bytes. Always contains `dtype' and `shape' of the stored array
+### -- array data (C-order)
+### so that the array can be opened with np.memmap, and shared between processes without being read into memory
+
+binaryMagic = 'MLEBIN01'
+binaryAlignment = 64
+
+def jsonify(obj):
+    '''
+    Returns a copy of obj which can be serialised to JSON: numpy arrays and scalars are converted to lists and python scalars, tuples to lists, and functions (or any other object) to their (module-qualified) name.
+    '''
+    import numpy as np
+
+    if(isinstance(obj, dict)):
+        return dict([[str(k), jsonify(v)] for k, v in obj.items()])
+    elif(isinstance(obj, (list, tuple))):
+        return [jsonify(v) for v in obj]
+    elif(isinstance(obj, np.ndarray)):
+        return jsonify(obj.tolist())
+    elif(isinstance(obj, np.generic)):
+        return obj.item()
+    elif(obj is None or isinstance(obj, (bool, int, long, float, basestring))):
+        return obj
+    elif(hasattr(obj, '__name__')):
+        return str(getattr(obj, '__module__', None))+'.'+obj.__name__
+    else:
+        return repr(obj)
+
+def hash_Configuration(config):
+    '''
+    Returns a (hex) hash of config, which must be serialisable by jsonify. Dictionaries are hashed independently of their key order, so that identical configurations always produce the same hash.
+    '''
+    import hashlib
+    import json
+
+    return hashlib.sha1(json.dumps(jsonify(config), sort_keys = True)).hexdigest()
+
+def write_Binary_Array(filename, array, header = None):
+    '''
+    Writes array to filename in binary format, preceded by a JSON header containing the information in the dictionary header (which must be serialisable by jsonify), and the dtype and shape of the array.
+    The file is written to a temporary file and moved into place, so that other processes never see a partially written file.
+
+    Requires:
+    -- filename: Output filename. Directory is created if necessary
+    -- array: numpy array to be stored
+    -- header: Dictionary of information stored with the array
+
+    Returns:
+    -- filename
+    '''
+    import numpy as np
+    import json
+    import struct
+
+    array = np.ascontiguousarray(array)
+
+    if(header is None):
+        header = {}
+    header = jsonify(header)
+    header['dtype'] = array.dtype.str
+    header['shape'] = list(array.shape)
+
+    headerString = json.dumps(header, sort_keys = True)
+    start = len(binaryMagic) + 8 + len(headerString)
+    headerString += ' '*((-start) % binaryAlignment)
+
+    directory = os.path.dirname(os.path.abspath(filename))
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    tempFilename = filename+'.tmp'+str(os.getpid())
+    with open(tempFilename, 'wb') as handle:
+        handle.write(binaryMagic)
+        handle.write(struct.pack('<Q', len(headerString)))
+        handle.write(headerString)
+        array.tofile(handle)
+    os.rename(tempFilename, filename)
+
+    return filename
+
+def read_Binary_Header(filename):
+    '''
+    Reads the header of a binary file written by write_Binary_Array.
+
+    Returns:
+    -- header: Dictionary of header information
+    -- offset: Offset in bytes to the start of the array data
+    '''
+    import json
+    import struct
+
+    with open(filename, 'rb') as handle:
+        magic = handle.read(len(binaryMagic))
+        if(magic != binaryMagic):
+            raise ValueError('read_Binary_Header - '+filename+' is not a binary array file (or was written by an incompatible version)')
+        headerLength = struct.unpack('<Q', handle.read(8))[0]
+        header = json.loads(handle.read(headerLength))
+
+    return header, len(binaryMagic) + 8 + headerLength
+
+def load_Binary_Array(filename, mode = 'r'):
+    '''
+    Opens a binary file written by write_Binary_Array as a memory-mapped array. The data is not read into memory, and all processes opening the file read-only share one physical copy.
+
+    Requires:
+    -- filename
+    -- mode: np.memmap mode: `r' (read-only, default), `r+' (read-write) or `c' (copy-on-write)
+
+    Returns:
+    -- array: np.memmap of the stored array
+    -- header: Dictionary of header information
+    '''
+    import numpy as np
+
+    header, offset = read_Binary_Header(filename)
+    dtype = np.dtype(str(header['dtype']))
+    shape = list(header['shape'])
+    if(shape[0] < 0):
+        ## Appendable table (see open_Binary_Table): rows are counted from the file size, ignoring any partially written row
+        shape[0] = get_Binary_Table_Rows(filename, header, offset)
+        if(shape[0] == 0):
+            return np.zeros(shape, dtype = dtype), header
+
+    array = np.memmap(filename, dtype = dtype, mode = mode, offset = offset, shape = tuple(shape))
+
+    return array, header
+
+### Appendable binary tables, used for the output of fit results. These have the binary array layout above, with the number of rows left open (stored as -1 in `shape'), so that rows can be appended as a run progresses. The number of rows is taken from the file size on loading. The header contains the column `labels', and any run information passed in.
+### Writing is through a sink (a dictionary holding the open file and a buffer of rows): rows are buffered in memory and written in blocks of bufferRows
+
+def get_Binary_Table_Rows(filename, header, offset):
+    '''
+    Returns the number of complete rows stored in the appendable binary table filename, with header and data offset as returned by read_Binary_Header.
+    '''
+    import numpy as np
+
+    rowBytes = np.dtype(str(header['dtype'])).itemsize*int(np.prod(header['shape'][1:]))
+    return (os.path.getsize(filename) - offset)//rowBytes
+
+def open_Binary_Table(filename, labels, header = None, mode = 'a', bufferRows = 10000, dtype = '<f8', verbose = True):
+    '''
+    Opens an appendable binary table for output, and returns a sink to which rows can be written (see write_Rows). Load using load_Binary_Array (memory-mapped) or load_Result_Table.
+
+    Requires:
+    -- filename: Output filename. Directory is created if necessary
+    -- labels: label of each column (e.g. the fit parameters)
+    -- header: Dictionary of run information stored with the table (must be serialisable by jsonify)
+    -- mode: `a' appends to an existing table, which must have the same labels and dtype (any partially written row, e.g. from an interrupted run, is discarded); `w' overwrites. A new table is created in either case if the file does not exist
+    -- bufferRows: number of rows held in memory before being written
+    -- dtype: data type of the stored values
+    -- verbose: If true, will output filename to screen
+
+    Returns:
+    -- sink: Dictionary holding the open file (`handle'), the number of columns (`nCol'), and the row buffer
+    '''
+    import numpy as np
+    import json
+    import struct
+
+    labels = [str(l) for l in labels]
+    dtype = np.dtype(dtype)
+
+    if(mode == 'a' and os.path.exists(filename)):
+        existingHeader, offset = read_Binary_Header(filename)
+        if(existingHeader.get('labels') != labels or np.dtype(str(existingHeader['dtype'])) != dtype):
+            raise ValueError('open_Binary_Table - existing table '+filename+' has labels '+str(existingHeader.get('labels'))+' and dtype '+str(existingHeader['dtype'])+', which do not match those requested: '+str(labels)+' '+dtype.str)
+        handle = open(filename, 'r+b')
+        handle.truncate(offset + get_Binary_Table_Rows(filename, existingHeader, offset)*dtype.itemsize*len(labels))
+        handle.seek(0, 2)
+    elif(mode in ['a', 'w']):
+        if(header is None):
+            header = {}
+        header = jsonify(header)
+        header['labels'] = labels
+        header['dtype'] = dtype.str
+        header['shape'] = [-1, len(labels)]
+
+        headerString = json.dumps(header, sort_keys = True)
+        start = len(binaryMagic) + 8 + len(headerString)
+        headerString += ' '*((-start) % binaryAlignment)
+
+        directory = os.path.dirname(os.path.abspath(filename))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        handle = open(filename, 'wb')
+        handle.write(binaryMagic)
+        handle.write(struct.pack('<Q', len(headerString)))
+        handle.write(headerString)
+    else:
+        raise ValueError('open_Binary_Table - mode must be one of `a\' or `w\': '+str(mode))
+
+    if(verbose):
+        print 'File will be output to: ',filename
+
+    return {'filename':filename, 'handle':handle, 'nCol':len(labels), 'dtype':dtype, 'buffer':[], 'nBuffer':0, 'bufferRows':bufferRows}
+
+def flush_Binary_Table(sink):
+    '''
+    Writes any rows buffered in sink to file.
+    '''
+    import numpy as np
+
+    if(sink['nBuffer'] > 0):
+        np.concatenate(sink['buffer']).tofile(sink['handle'])
+        sink['buffer'] = []; sink['nBuffer'] = 0
+    sink['handle'].flush()
+
+def write_Rows(handle, rows):
+    '''
+    Writes rows of results to output. handle may be an open (ASCII) file, in which case the rows are written by np.savetxt, or a binary table sink returned by open_Binary_Table.
+
+    Requires:
+    -- handle: open file or binary table sink
+    -- rows: [nRow, nCol] array, or [nCol] for a single row
+    '''
+    import numpy as np
+
+    if(isinstance(handle, dict)):
+        rows = np.asarray(rows, dtype = handle['dtype']).reshape(-1, handle['nCol'])
+        handle['buffer'].append(rows); handle['nBuffer'] += rows.shape[0]
+        if(handle['nBuffer'] >= handle['bufferRows']):
+            flush_Binary_Table(handle)
+    else:
+        np.savetxt(handle, np.atleast_2d(rows))
+
+def close_Output(handle):
+    '''
+    Closes an output opened by initialise_Output or open_Binary_Table, writing any buffered rows.
+    '''
+    if(isinstance(handle, dict)):
+        flush_Binary_Table(handle)
+        handle = handle['handle']
+    handle.close()
+
+def load_Result_Table(filename):
+    '''
+    Loads a table of results written either as ASCII (e.g. by np.savetxt) or as an appendable binary table (see open_Binary_Table). The format is detected from the file. Binary tables are memory-mapped, and not read into memory.
+
+    Returns:
+    -- table: [nRow, nCol] array
+    -- labels: column labels, or None where not stored (ASCII)
+    '''
+    import numpy as np
+
+    with open(filename, 'rb') as handle:
+        isBinary = (handle.read(len(binaryMagic)) == binaryMagic)
+
+    if(isBinary):
+        table, header = load_Binary_Array(filename)
+        return table, header.get('labels')
+
+    return np.loadtxt(filename, ndmin = 2), None
+
+### Checkpoints, used to restart long runs. The state is pickled, and stored with a hash of the run configuration so that a checkpoint is only resumed by an identical run
+
+def write_Checkpoint(filename, state, configHash):
+    '''
+    Writes state to filename, together with configHash. The file is written to a temporary file and moved into place, so that a run interrupted while checkpointing leaves the previous checkpoint intact.
+
+    Requires:
+    -- filename: Checkpoint filename. Directory is created if necessary
+    -- state: Dictionary of run state. Must be picklable
+    -- configHash: Hash of the run configuration (see hash_Configuration). This should be taken at the start of the run, before any part of the configuration is modified
+
+    Returns:
+    -- filename
+    '''
+    import cPickle as pickle
+
+    directory = os.path.dirname(os.path.abspath(filename))
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    tempFilename = filename+'.tmp'+str(os.getpid())
+    with open(tempFilename, 'wb') as handle:
+        pickle.dump({'configHash':configHash, 'state':state}, handle, protocol = pickle.HIGHEST_PROTOCOL)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.rename(tempFilename, filename)
+
+    return filename
+
+def read_Checkpoint(filename, configHash):
+    '''
+    Reads a checkpoint written by write_Checkpoint.
+
+    Requires:
+    -- filename: Checkpoint filename
+    -- configHash: Hash of the run configuration, which must match that with which the checkpoint was written
+
+    Returns:
+    -- state: Dictionary of run state, or None if filename does not exist
+    '''
+    import cPickle as pickle
+
+    if(filename is None or not os.path.exists(filename)):
+        return None
+
+    with open(filename, 'rb') as handle:
+        checkpoint = pickle.load(handle)
+
+    if(checkpoint['configHash'] != configHash):
+        raise ValueError('read_Checkpoint - checkpoint '+filename+' was written by a run with a different configuration. Remove it to start afresh')
+
+    return checkpoint['state']
+
+def get_Output_Position(handle):
+    '''
+    Writes any buffered output of handle (an open file, or binary table sink) to file, and returns the size of the file in bytes. Used with truncate_Output to discard output written after a checkpoint.
+    '''
+    if(isinstance(handle, dict)):
+        flush_Binary_Table(handle)
+        handle = handle['handle']
+    handle.flush()
+    os.fsync(handle.fileno())
+    return os.fstat(handle.fileno()).st_size
+
+def truncate_Output(filename, position):
+    '''
+    Truncates filename to position bytes (as returned by get_Output_Position).
+    '''
+    if(os.path.getsize(filename) < position):
+        raise ValueError('truncate_Output - '+filename+' is shorter than the checkpointed position ('+str(position)+' bytes): has it been modified since the checkpoint?')
+
+    with open(filename, 'r+b') as handle:
+        handle.truncate(position)
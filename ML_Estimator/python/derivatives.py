@@ -4,10 +4,125 @@ Library module which calculates nth order derivatives over a scalar function, or
 Author: cajd
 """
 
-def finite_difference_derivative(fun, x0, args, n = [1], order = 5, dx = 1., maxEval = 100, eps = 1.e-4, convergenceType = 'sum'):
+def get_Stencil_Coefficients(n, order):
+    """
+    Returns the central finite difference coefficients for the nth derivative using `order` function evaluations, ordered from x0 + no*dx to x0 - no*dx (where no = order/2), as evaluated in finite_difference_derivative.
+
+    Requires:
+    -- n: order of differentiation (1, 2 or 3)
+    -- order: the number of finite intervals used to calculate the derivative
+
+    Returns:
+    -- ck: list of coefficients
+    -- ch: normalisation, such that derivative = sum(ck*f)/(ch*dx^power)
+    -- power: power of the interval width in the normalisation
+    -- accuracy: power of the interval width of the leading truncation error, used in Richardson extrapolation
+    """
+
+    if(n == 1):
+        #ck for order [1,2,3,4,5,6,7,8,9]
+        ick = [['1'],['2'],[1.,0,-1.] 
+               ,['4'],[-1.,8.,0.,-8.,1.],['6']
+               ,[1.,-9.,45.,0.,-45.,9.,-1.],['8'],[3.,-32.,168.,-672.,672.,168.,32.,-3.]]
+        
+        ich = ['1','2',2. 
+               ,'4',12.,'6'
+               ,60.,'8',840.]
+        power = 1
+    elif(n == 2):
+        #ck for order [1,2,3,4,5,6,7,8,9]
+        ick = [['1'],['2'],[1.,-2.,1.] 
+               ,['4'],[-1.,16.,-30.,16.,-1.],['6']
+               ,[2.,-27.,270.,-490.,270.,-27.,2.],['8'],['9']]
+        
+        ich = ['1','2',1. 
+               ,'4',12.,'6'
+               ,180.,'8','9']
+        power = 2
+    elif(n == 3):
+        #ck for order [1,2,3,4,5,6,7,8,9]
+        ick = [['1'],['2'],['3'] 
+               ,['4'],[1.,-2.,0.,2.,-1.],['6']
+               ,[-1.,8.,-13.,0.,13.,-8.,1.],['8'],['9']]
+        
+        ich = ['1','2','3' 
+               ,'4',2.,'6'
+               ,8.,'8','9']
+        power = 3
+    else:
+        raise ValueError('derivative - Derivative order (n) not valid. I can only consider 1st, 2nd and 3rd derivatives. Order entered is:', n)
+
+    ck = ick[order-1]
+    ch = ich[order-1]
+    if(len(ck) != order):
+        raise ValueError('derivative - Error assigning coefficents to function evaluations.', order, ch)
+
+    ## Central differences have truncation error in even powers of dx
+    accuracy = order - 1 - 2*int((n-1)/2)
+
+    return ck, ch, power, accuracy
+
+def evaluate_Stencil_Point(point):
+    """
+    Evaluates a single stencil point, entered as the tuple (fun, x, args), as fun(x, *args). Defined at module level so that it can be mapped over a process pool.
+    """
+    import numpy as np
+
+    fun, x, args = point
+    return np.array(fun(x, *args))
+
+def evaluate_Stencil(fun, x0, offsets, keys, args, cache, executor = None, batchFun = None, batchArgs = None):
+    """
+    Evaluates fun at the stencil points x0 - offsets, reusing (and storing) evaluations in cache so that each point is evaluated once across derivative orders and step widths. All points not already in cache are evaluated together: serially, mapped over executor, or in a single call of batchFun.
+
+    Requires:
+    -- fun, x0, args: as finite_difference_derivative
+    -- offsets: list of offsets from x0 at which the function is evaluated
+    -- keys: list of hashable labels for each offset, used to look up cache
+    -- cache: dictionary of previous evaluations, updated in place
+    -- executor, batchFun, batchArgs: as finite_difference_derivative
+
+    Returns:
+    -- f: list of function evaluations (numpy arrays), in the order of offsets
+    """
+    import numpy as np
+
+    ## Points still to be evaluated, with repeated keys evaluated once
+    missing = []; points = []
+    for offset, key in zip(offsets, keys):
+        if(key in cache or key in missing):
+            continue
+        missing.append(key); points.append(x0 - offset)
+
+    if(len(missing) > 0):
+        try:
+            if(batchFun is not None):
+                if(batchArgs is None):
+                    batchArgs = args
+                values = batchFun(np.array(points), *batchArgs)
+            elif(executor is not None):
+                values = list(executor.map(evaluate_Stencil_Point, [(fun, point, args) for point in points]))
+            else:
+                values = [evaluate_Stencil_Point((fun, point, args)) for point in points]
+        except:
+            raise ValueError('finite_difference_derivative - Failed to evaluate function over range considered. Values:', points)
+        if(len(values) != len(missing)):
+            raise RuntimeError('finite_difference_derivative - Number of function evaluations returned ('+str(len(values))+') does not match the number of points ('+str(len(missing))+')')
+        for key, value in zip(missing, values):
+            cache[key] = np.array(value)
+
+    f = [cache[key] for key in keys]
+    for i in range(1, len(f)):
+        if(f[i].shape != f[i-1].shape):
+            raise RuntimeError('finite_difference_derivative - Evaluation of function'+str(fun)+' at point '+str(x0 - offsets[i])+' failed')
+    return f
+
+def finite_difference_derivative(fun, x0, args, n = [1], order = 5, dx = 1., maxEval = 100, eps = 1.e-4, convergenceType = 'sum', extrapolate = False, executor = None, batchFun = None, batchArgs = None):
     '''
     Compute numerical derivatives using finite differences.
 
+    Function evaluations are cached, so that each stencil point is evaluated only once across all orders in `n` and all interval widths considered in the convergence test. The stencil points of each interval width are evaluated together, and may be evaluated concurrently (executor) or in a single vectorised call (batchFun).
+
     Requires:
     -- fun: symbolic link to function to be differentiated. Function must take arguments of the form (x, *args), where an element of the args tuple can defined which variable is being differentiated.
     -- x0: The central point around which the derivative is being taken.
@@ -18,6 +133,10 @@ def finite_difference_derivative(fun, x0, args, n = [1], order = 5, dx = 1., max
     -- maxEval: the maximum number of evaluations to use to calculate the derivative
     -- eps: the Tolerance which must be satisfied to return a converged estimate.
     -- convergenceType:  determines how the convergnece test is applied. If == sum, convergence test is applied to the sum over all pixels. If == pix, convergenceTest carried out on all pixels individually.
+    -- extrapolate: If True (and a convergence test is undertaken), the estimates from successive interval widths are combined by Richardson extrapolation to remove the leading truncation error, and the convergence test is applied to the extrapolated estimates.
+    -- executor: object with a map method (e.g. multiprocessing.Pool, multiprocessing.pool.ThreadPool, or a concurrent.futures executor), over which the stencil points are evaluated concurrently. For a process pool, fun and args must be picklable. If None, points are evaluated serially.
+    -- batchFun: function of the form batchFun(xs, *batchArgs), returning the stack of evaluations of fun at each point in the array xs (e.g. model_Production.get_Pixelised_Model_Batch). If passed, this is used in place of fun and executor.
+    -- batchArgs: arguments passed to batchFun. If None, args is used.
 
     Returns:
     -- result: Tuple containing the derivative of the function to order as set by `n` input.
@@ -40,13 +159,22 @@ def finite_difference_derivative(fun, x0, args, n = [1], order = 5, dx = 1., max
         if len(dx) != 2:
             raise ValueError('finite_difference_derivative - Entered dx is not applicable: Entered dx should either be a scalar (for single run), or a tuple of length two (for convergence test [start point, width]). dx:'+str(dx))
 
+    ## Stencil evaluations are labelled by their offset from x0 in units of the interval step, so that points shared between interval widths (e.g. 2*dx and 1*(2dx)) are recognised
+    if(dx[1] > 0):
+        unit = float(dx[1])
+    else:
+        unit = float(dx[0])
+    cache = {}
 
+    no = int(order/2)
     result = []; convdx = []
     for nn in range(len(n)):
 
+        ck, ch, power, accuracy = get_Stencil_Coefficients(n[nn], order)
+
         ##Convergence Testing - tests for convergence individually
         #Initialise result_store
-        result_store = [0]*maxEval
+        result_store = [0]*maxEval; raw_store = [0]*maxEval; width_store = [0]*maxEval
         foundConvergence = False
         for ev in range(maxEval):
 
@@ -56,102 +184,26 @@ def finite_difference_derivative(fun, x0, args, n = [1], order = 5, dx = 1., max
                 foundConvergence = True
             
             ##Get finite interval fucntion evaluations up to order entered
-            f = []
-            
-            no = int(order/2)
-            for i in range(-no, no+1, 1):
-                try:
-                    f.append(np.array(fun(x0 - i*idx, *args)))
-                except:
-                    raise ValueError('finite_difference_derivative - Failed to evaluate function over range considered - interval:', no, ' of:', order,'. Value, interval:', x0 - i*idx, idx)
-                if(i >= -no+1 and f[i+no].shape != f[i+no-1].shape):
-                    raise RuntimeError('finite_difference_derivative - Evaluation of function'+str(fun)+' at point '+str(x0 - i*idx)+' failed')
-
-            if(n[nn] == 1):
-                #ck for order [1,2,3,4,5,6,7,8,9]
-                ick = [['1'],['2'],[1.,0,-1.] 
-                       ,['4'],[1.,-8.,0.,8.,-1.],['6']
-                       ,[-1.,9.,-45.,0.,45.,-9.,1.],['8'],[3.,-32.,168.,-672.,672.,168.,32.,-3.]]
-                
-                ich = ['1','2',2. 
-                       ,'4',12.,'6'
-                       ,60.,'8',840.]
-                
-                ck = ick[order-1]
-                ch = ich[order-1]
-                
-                if(len(ck) != len(f)):
-                    raise ValueError('derivative - Error assigning coefficents to function evaluations.')
-                
-                res = np.zeros(f[0].shape)
-                for o in range(len(ck)):
-                    res += ck[o]*f[o]
-                res /= ch*idx
-                
-            elif(n[nn] == 2):
-                #ck for order [1,2,3,4,5,6,7,8,9]
-                ick = [['1'],['2'],[1.,-2.,1.] 
-                       ,['4'],[-1.,16.,-30.,16.,-1.],['6']
-                       ,[2.,-27.,270.,-490.,270.,-27.,2.],['8'],['9']]
-                
-                ich = ['1','2',1. 
-                       ,'4',12.,'6'
-                       ,180.,'8','9']
-                
-                
-                ck = ick[order-1]
-                ch = ich[order-1]
-                
-                if(len(ck) != len(f)):
-                    raise ValueError('derivative - Error assigning coefficents to function evaluations.', order, ch)
-                
-                res = np.zeros(f[0].shape)
-                for o in range(len(ck)):
-                    res += ck[o]*f[o]
-                res /= ch*idx*idx
-                
-            elif(n[nn] == 3):
-                #ck for order [1,2,3,4,5,6,7,8,9]
-                ick = [['1'],['2'],['3'] 
-                       ,['4'],[-1.,2.,0.,-2.,1.],['6']
-                       ,[1.,-8.,13.,0.,-13.,8.,-1.],['8'],['9']]
-                
-                ich = ['1','2','3' 
-                       ,'4',2.,'6'
-                       ,8.,'8','9']
-                
-                ck = ick[order-1]
-                ch = ich[order-1]
-                
-                if(len(ck) != len(f)):
-                    raise ValueError('derivative - Error assigning coefficents to function evaluations.', order, ch)
-
-                res = np.zeros(f[0].shape)
-                for o in range(len(ck)):
-                    res += ck[o]*f[o]
-                    '''
-                    try:
-                        res += ck[o]*f[o]
-                    except:
-                        print 'Failed in third order:'
-                        print 'Arrays:', ck[o], f[o]
-                        print 'Shape check:', ck[o], f[o].shape
-                    '''
-                res /= ch*idx*idx
-
-                
-            else:
-                raise ValueError('derivative - Derivative order (n) not valid. I can only consider 1st, 2nd and 3rd derivatives. Order entered is:', n[nn])
+            offsets = [i*idx for i in range(-no, no+1, 1)]
+            f = evaluate_Stencil(fun, x0, offsets, [round(offset/unit, 8) for offset in offsets], args, cache, executor = executor, batchFun = batchFun, batchArgs = batchArgs)
+
+            res = np.zeros(f[0].shape)
+            for o in range(len(ck)):
+                res += ck[o]*f[o]
+            res /= ch*np.power(idx, power)
+
+            raw_store[ev] = res; width_store[ev] = idx
+
+            ## Richardson extrapolation using the estimates at this and the previous interval widths
+            if(extrapolate and ev >= 1):
+                wPrev = np.power(width_store[ev-1], accuracy); wCur = np.power(idx, accuracy)
+                res = (wPrev*raw_store[ev] - wCur*raw_store[ev-1])/(wPrev - wCur)
 
             result_store[ev] = res
 
-            '''
-            if(ev >= 1):
-                print 'Result Check:'
-                print result_store[ev-2:ev], idx
-                print (np.absolute(result_store[ev]-result_store[ev-1]) <= eps), (np.absolute(result_store[ev]-result_store[ev-1]) <= eps).sum()
-                raw_input('Check')
-            '''
+            ## Extrapolated estimates are only compared with each other
+            if(extrapolate and ev < 2):
+                continue
 
             ##Validity check
             if(ev >= 1 and result_store[ev].shape != result_store[ev-1].shape):
@@ -10,66 +10,79 @@ To Do:
 import numpy as np
 import os
 from copy import deepcopy
+from functools import partial
 
 verbose = False
 vverbose  = False
 debug = False
 
-def estimate_Noise(image, maskCentroid = None):
+def estimate_Noise(image, maskCentroid = None, batch = False):
     """
-    Routine which takes in an image and estimates the noise, needed to accurately calculate the expected bias on profile measurements. Where a centroid value is passed, the code uses a form of `curve of growth` to estiamte the noise, by increasing the size of a cricular mask steadily by one pixel around that centroid and looking for convergence (defined here as the point where the difference between loops is minimised), otherwise the full image is used.
+    Routine which takes in an image and estimates the noise, needed to accurately calculate the expected bias on profile measurements. Where a centroid value is passed, the code uses a form of `curve of growth` to estiamte the noise, by increasing the size of a square mask steadily by one pixel around that centroid and looking for convergence (defined here as the point where the difference between loops is minimised), otherwise the full image is used.
+
+    The curve of growth is evaluated in a single pass: each pixel is labelled by the mask radius at which it is first masked, and the sum and sum of squares of the pixels still unmasked at every radius are obtained from cumulative sums over those labels (np.bincount), so the cost is O(nPix) rather than O(nRadius x nPix). As before, masked pixels are treated as zero-valued (rather than removed) when taking the standard deviation.
 
     *** Noise is known to be too large when the postage stamps size is not large enough, so that the model makes up a significant percentage of the image. One may therefore expect the noise to be too large for small PS sizes. ***
 
     Agrees well with GALSIM noise var on all SNR provided masCentroid is accurately placed on source centre (tested for ellipticity = 0.)
 
     Requires:
-    -- image: Image of source (2-dimensional numpy array)
-    -- maskCentroid: center of mask - used to iteritively mask out source to get an accurate estimate of the background noise after removing the source. If None, then the noise is returned as the standard deviation of the image without masking applied. If not None, then the noise is minimum of the difference between successive runs where the mask is increased by one pixel each side of the centre as passed in.
+    -- image: Image of source (2-dimensional numpy array), or stack of images ([nImage, nX, nY] numpy array). Where maskCentroid is None, the image may be of any shape.
+    -- maskCentroid: center of mask - used to iteritively mask out source to get an accurate estimate of the background noise after removing the source. If None, then the noise is returned as the standard deviation of the image without masking applied. If not None, then the noise is minimum of the difference between successive runs where the mask is increased by one pixel each side of the centre as passed in. Non-integer centroids are truncated to the containing pixel.
+    -- batch: If False, all images in a stack are used together to give a single noise estimate. If True, the first axis of image labels separate images (e.g. the postage stamps of a catalogue, all with the same stamp size and centroid), and the noise is estimated for each separately.
 
     Returns:
-    -- result: Scalar giving the standard deviation of the pixel in the input image, after masking (if appropriate).
-
-    NOTE: UNTESTED for multiple images
+    -- result: Scalar giving the standard deviation of the pixel in the input image, after masking (if appropriate). If batch, a [nImage] array giving the result for each image.
     
     """
 
+    image = np.asarray(image, dtype = float)
 
-    if(maskCentroid is not None):
-        res = np.zeros(max(maskCentroid[0], maskCentroid[1], abs(image.shape[0]-maskCentroid[0]), abs(image.shape[1]-maskCentroid[1])))
+    if(batch):
+        nImage = image.shape[0]
     else:
-        res = np.zeros(1)
-        
-    maskRad = 0; con = 0
-    tImage = image.copy()
-    while True:
-        con += 1
+        nImage = 1
 
-        maskRad = (con-1)*1 #Done in pixels
+    if(maskCentroid is None):
+        res = image.reshape(nImage, -1).std(axis = 1)
+        if(batch):
+            return res
+        return res[0]
 
-        if(maskCentroid is not None):
-            if(len(tImage.shape) == 3):
-                for i in range(tImage.shape[0]):
-                    tImage[i][maskCentroid[0]-maskRad:maskCentroid[0]+maskRad, maskCentroid[1]-maskRad:maskCentroid[1]+maskRad] = 0.
-            else:
-                tImage[maskCentroid[0]-maskRad:maskCentroid[0]+maskRad, maskCentroid[1]-maskRad:maskCentroid[1]+maskRad] = 0.
+    if(image.ndim < 2 or image.ndim > 3 or (batch and image.ndim != 3)):
+        raise ValueError('estimate_Noise - image not of expected shape for masking: '+str(image.shape))
 
-        res[con-1] = tImage.std()
+    nX, nY = image.shape[-2:]
+    cen = [int(maskCentroid[0]), int(maskCentroid[1])]
+    nRad = max(cen[0], cen[1], abs(nX-cen[0]), abs(nY-cen[1]))
 
-        if(maskCentroid is None):
-            break
-        elif(con == res.shape[0]):
-            break
+    ## Radius at which each pixel is first masked: a mask of radius r covers [cen-r, cen+r) along each axis
+    xRad = np.maximum(cen[0]-np.arange(nX), np.arange(nX)-cen[0]+1)
+    yRad = np.maximum(cen[1]-np.arange(nY), np.arange(nY)-cen[1]+1)
+    pixRad = np.maximum(xRad[:,None], yRad[None,:]).flatten()
 
-    if(maskCentroid is not None):
-        return res[np.argmin(np.absolute(np.diff(res)))]
-    else:
-        return res[0]
+    ## Sum and sum of squares of the pixels masked at each radius, for each image (all images pooled unless batch)
+    stack = image.reshape(nImage, -1, nX*nY)
+    nPix = float(stack.shape[1]*stack.shape[2])
+    label = np.broadcast_to(np.arange(nImage)[:,None,None]*(nRad+1) + pixRad[None,None,:], stack.shape).flatten()
+    sum1 = np.bincount(label, weights = stack.flatten(), minlength = nImage*(nRad+1)).reshape(nImage, nRad+1)
+    sum2 = np.bincount(label, weights = np.power(stack,2).flatten(), minlength = nImage*(nRad+1)).reshape(nImage, nRad+1)
+
+    ## Sums over the pixels still unmasked at radius r = 0, ..., nRad-1
+    unmasked1 = sum1.sum(axis = 1)[:,None] - np.cumsum(sum1, axis = 1)[:,:nRad]
+    unmasked2 = sum2.sum(axis = 1)[:,None] - np.cumsum(sum2, axis = 1)[:,:nRad]
+    mean = unmasked1/nPix
+    res = np.sqrt(np.maximum(unmasked2/nPix - np.power(mean,2), 0.))
+
+    result = res[np.arange(nImage), np.argmin(np.absolute(np.diff(res, axis = 1)), axis = 1)]
+    if(batch):
+        return result
+    return result[0]
 
 
 ## -o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o----- Error Estimation -----o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-##
 
-def fisher_Error_ML(ML, fitParams, image, setParams, modelLookup):
+def fisher_Error_ML(ML, fitParams, image, setParams, modelLookup, fisherMatrix = None):
     from copy import deepcopy
     """
     Calculates the marginalised fisher error on the set of fitParams (tuple) around maximum-likelihood point ML. As the log-Likelihood depends on the image, the images must be supplied, along with a model dictionary giving the fixed model parameters (setParams), and the modelLookup (this can be None is no lookup is to be used). The model fit is therefore constructed by setParams+{fitParams:ML}.
@@ -81,9 +94,10 @@ def fisher_Error_ML(ML, fitParams, image, setParams, modelLookup):
     Requires:
     ML: Computed ML point, entered as 1D list/tuple/numpy array
     fitParams: list of strings, labelling the parameters to be fit as defined in model dictionary definition (see default model dictionary definition)
-    image: 2D ndarray, containing image postage stamp (image being fit)
+    image: 2D ndarray, containing image postage stamp (image being fit), or the statistics of a stack of realisations (see get_Stack_Statistics)
     setParams: model dictionary defining all fixed parameters
     modelLookup: modelLookup table as defined in find_ML_Estimator. Can be None if no lookup is used.
+    fisherMatrix: [nPar, nPar] Fisher matrix around ML, if already known (e.g. J^T J from the least-squares search, see least_Squares_ML_Search). If None, it is evaluated from the second derivative of the log-Likelihood.
 
     Returns:
     -- err: Tuple containing marginalised Fisher error for all input parameters (in each case all other parameters are considered fixed to ML or input values).
@@ -92,33 +106,39 @@ def fisher_Error_ML(ML, fitParams, image, setParams, modelLookup):
     -- Value of marginalised error is verified to be comparable to the variance over 5x10^5 simulated images for e1, e2 as free parameters without a prior.
     """
     
-    parameters = deepcopy(ML); pLabels = deepcopy(fitParams)
+    if(fisherMatrix is not None):
+        ddlnL = np.array(fisherMatrix)
+    else:
+        parameters = deepcopy(ML); pLabels = deepcopy(fitParams)
 
-    ddlnL = differentiate_logLikelihood_Gaussian_Analytic(parameters, pLabels, image, setParams, modelLookup = modelLookup, order = 2, signModifier = 1.)
-    ddlnL = -1.*ddlnL ##This is now the Fisher Matrix
+        ddlnL = differentiate_logLikelihood_Gaussian_Analytic(parameters, pLabels, image, setParams, modelLookup = modelLookup, order = 2, signModifier = 1.)
+        ddlnL = -1.*ddlnL ##This is now the Fisher Matrix
 
     Fin = np.linalg.inv(ddlnL)
 
     return np.sqrt(np.diag(Fin))
     
 ##-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o---- ML Estimation   ----o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-o-##
-def find_ML_Estimator(image, fitParams, outputHandle = None, setParams = None, modelLookup = None, searchMethod = 'simplex', preSearchMethod = None, Prior = None, bruteRange = None, biasCorrect = 0, calcNoise = None, bcoutputHandle = None, error = 'Fisher', **iParams):
+def find_ML_Estimator(image, fitParams, outputHandle = None, setParams = None, modelLookup = None, searchMethod = 'simplex', preSearchMethod = None, Prior = None, bruteRange = None, biasCorrect = 0, calcNoise = None, bcoutputHandle = None, error = 'Fisher', profileLinear = None, stackStatistics = True, **iParams):
     import scipy.optimize as opt
     import model_Production as modPro
     from surface_Brightness_Profiles import gaussian_SBProfile_CXX
     import measure_Bias as mBias
     from generalManipulation import makeIterableList
+    from IO import write_Rows
     """
     MAIN ROUTINE FOR THIS MODULE. Takes in an image (at minimum) and a set of values which defines the model parameters (fit and those which are free to vary), and returns the parameter values at which the log-Likelihood is minimised (or Likelihood is maximised). Can correct for first order noise bias (if biasCorrect != 0), and an estimate of the error (if error is equal to a set of pre-defined values [see below]).
     
     Requires:
     -- image: 2d array of pixelised image
     -- fitParams: tuple of strings which define the model parameters which are free to vary (those which will be fit). These must satisfy the definition of model parameters as set out in the default model dictionary. If None, then e1, e2 and T are fit (this could be made stricter by removing the default None initialisation, thereby requiring that a set of parameters to be fit is passed in).
-    -- outputHandle: handle of the output file. **Result is always appended**. If not passed in, then result is not output. Output is in ASCII form.
+    -- outputHandle: handle of the output file. **Result is always appended**. If not passed in, then result is not output. This may be an open file, in which case output is in ASCII form, or a binary table sink (see IO.open_Binary_Table).
     -- setParams: Default model dictionary containing fixed parameters which describes the model being fixed. One part of a two part approach to setting the full model parameter dictionary, along with iParams. If None, then default model dictionary is taken.
     -- modelLookup: Dictionary containing lookup table for pixelised model images, as defined in model_Production module. If None, no lookup is used, and the model is re-evalauted for each change in model parameters.
     -- searchMethod: String detailing which form of minimisation to use. Accepted values are:
-    ___ simplex, brent, powell, cg, bfgs, l_bfgs_b, ncg (as defined in SciPy documentation)
+    ___ simplex, brent, powell (as defined in SciPy documentation)
+    ___ cg, bfgs, ncg, l_bfgs_b, tnc: gradient-based searches using the analytic gradient of the log-Likelihood, evaluated together with its value (see gradient_ML_Search). l_bfgs_b and tnc apply the hard prior on size and ellipticity as bounds.
+    ___ lm (or least_squares): least-squares search on the pixel residuals using the analytic model Jacobian (see least_Squares_ML_Search). Where the Fisher error is requested, J^T J from this search is used as the Fisher matrix. Cannot be combined with profileLinear: flux and bg are linear, and so are fit efficiently by the least-squares search directly.
     -- preSearchMethod: String detailing initial search over parameter space to find global Minimium, used as an initial guess for refinement with searchMethod. If None, initial guess is set to default passed in by the combination of setParams and iParams. If not None, then code will run an initial, coarse search over the parameter space to attempt to find the global mimima. By default this is switched off. Where preSearchMethod == grid or brute, the a grid based search is used. Where this is used, a range must either be entered by the user through bruteRange, or it is taken from the entered prior information. NOTE: This still uses a typically coarse grid, therefore if the range is too wide then it is possible that the code may still find a local mimimum if this exists within one grid point interval of the global miminum.
     -- Prior: NOT USED YET. Skeleton to allow for a parameter prior structure to be passed in
     -- bruteRange: [nPar, 2] sized tuple setting the range in which the initial preSearchMethod is evaluated, if this is done using a grid or brute method (both equivalent), where nPar is the number of free model parameters being fit. THIS DOES NOT CONSTITUTE A PRIOR, as the refinement may still find an ML value outside this range, however where the global maximum occurs outside this range the returned ML value may be expected to be biased.
@@ -127,6 +147,8 @@ def find_ML_Estimator(image, fitParams, outputHandle = None, setParams = None, m
     -- error: String detailing error estiamte to output. Supported values are:
     ___ fisher: Marginalised fisher error for each parameter around the ML point. See docstring for fisher_Error_ML().
     ___ brute: UNSUPPORTED, however an error defined on the parameter likelihood itself can be derived if the preSearchMethod and bruteRange is defined such that the Likelihood has *compact support*. If not, then this would be inaccurate (underestimated). Therefore coding for this is deferred until the application of a prior is developed, as use of a prior ensures compact support by default.
+    -- profileLinear: label, or list of labels, of fit parameters which enter the model linearly (flux and/or bg) and which are solved for by linear least squares for each trial of the remaining parameters, rather than being searched over (see get_logLikelihood_Profiled). Only the remaining parameters are searched, so bruteRange, initial guesses and any modelLookup refer to these only. The returned estimate still contains all fitParams. If None, all fitParams are searched over.
+    -- stackStatistics: If True (default) and image contains multiple realisations, the per-pixel mean and scatter of the stack (see get_Stack_Statistics) are computed once, and the likelihood and its derivatives are evaluated from these, at a cost per evaluation independent of the number of realisations. If False, the full stack is used in every evaluation.
     -- iParams: set of optional arguments which, together with setParams, defines the intial model dictionary. Allows parameter values to be input individually on call, and is particularly useful for setting initial guesses where preSearchMethod == None.
     
     
@@ -146,13 +168,31 @@ def find_ML_Estimator(image, fitParams, outputHandle = None, setParams = None, m
     ##Initialise result variables
     Returned = []
     err = None
+    fisherMatrix = None
 
     ## Exceptions based on input objects
     if(image is None or sum(image.shape) == 0):
         raise RuntimeError('find_ML_Estimator - image supplied is None or uninitialised')
         
-    if(len(fitParams) > 2 and modelLookup is not None and modelLookup['useLookup']):
-        raise RuntimeError('find_ML_Estimator - Model Lookup is not supported for more than double parameter fits')
+    ## Linear parameters which are profiled (solved for) rather than searched over
+    fitParams = makeIterableList(fitParams)
+    if(profileLinear is None):
+        linearLabels = []
+    else:
+        linearLabels = list(makeIterableList(profileLinear))
+        for l in linearLabels:
+            if(l not in fitParams):
+                raise ValueError('find_ML_Estimator - Profiled parameter must also be a fit parameter:'+str(l))
+    searchParams = [l for l in fitParams if l not in linearLabels]
+    if(len(linearLabels) > 0 and searchMethod.lower() in ['lm', 'least_squares']):
+        raise ValueError('find_ML_Estimator - profileLinear cannot be used with the least-squares search method:'+str(searchMethod))
+    if(len(linearLabels) > 0):
+        lnLFunc = partial(get_logLikelihood_Profiled, linearLabels = linearLabels)
+    else:
+        lnLFunc = get_logLikelihood
+
+    if(modelLookup is not None and modelLookup['useLookup'] and modelLookup['nP'] != len(searchParams)):
+        raise RuntimeError('find_ML_Estimator - Model Lookup dimension does not match the number of (non-profiled) fit parameters')
 
     ##Set up initial params, which sets the intial guess or fixed value for the parameters which defines the model
     ##This line sets up the keywords that are accepted by the routine
@@ -222,7 +262,7 @@ def find_ML_Estimator(image, fitParams, outputHandle = None, setParams = None, m
     
     ####### Search lnL for minimum
     #Construct initial guess for free parameters by removing them from dictionary
-    x0 = modPro.unpack_Dictionary(modelParams, requested_keys = fitParams)
+    x0 = modPro.unpack_Dictionary(modelParams, requested_keys = searchParams)
 
     ###### Sanity check image dimensions compared to model parameters
     imDim = len(image.shape)
@@ -234,6 +274,18 @@ def find_ML_Estimator(image, fitParams, outputHandle = None, setParams = None, m
         print 'Image shape: ', image.shape, ' Model shape:' , modelParams['stamp_size']
         raise ValueError("find_ML_Estimator: image sahpe of second dimension is not consistent with expected model parameter dimension. 2D image array must contain multiple images across first dimension, and (flattened) pixels as a data vector in the second dimension: Have you remembered to flatten the image?")
 
+    ## The image (or its stack statistics) entering the likelihood
+    if(stackStatistics and imDim == 2):
+        fitImage = get_Stack_Statistics(image)
+    else:
+        fitImage = image
+
+    ## The likelihood is evaluated on a working copy of modelParams, in which the search parameters are set in place (see compile_Fit_Parameters). The profiled likelihood sets only the linear parameters, in its own unit-amplitude copy
+    lnLParams = modelParams
+    if(len(linearLabels) == 0 and len(searchParams) > 0):
+        lnLParams, compiled = compile_Fit_Parameters(modelParams, searchParams)
+        lnLFunc = partial(get_logLikelihood, compiled = compiled)
+
 
     if(preSearchMethod is not None):
         ## Conduct a presearch of the parameter space to set initial guess (usually grid-based or brute-force)
@@ -247,7 +299,11 @@ def find_ML_Estimator(image, fitParams, outputHandle = None, setParams = None, m
 
                 print "Using bruteRange: ", bruteRange
                 #x0, fval, bruteGrid, bruteVal
-                bruteOut = opt.brute(get_logLikelihood, ranges = bruteRange, args = (fitParams, image, modelParams, modelLookup, 'sum'), finish = None, full_output = True)
+                if(modelLookup is not None and modelLookup['useLookup']):
+                    bruteOut = opt.brute(lnLFunc, ranges = bruteRange, args = (searchParams, fitImage, lnLParams, modelLookup, 'sum'), finish = None, full_output = True)
+                else:
+                    ##All grid points evaluated in one batched model evaluation
+                    bruteOut = brute_Search_Batch(bruteRange, searchParams, fitImage, modelParams, linearLabels = (linearLabels if len(linearLabels) > 0 else None))
                 x0, fval, bruteGrid, bruteVal = bruteOut
                 ## x0 has len(nParam); fval is scalar; bruteGrid has len(nParam), nGrid*nParam; bruteVal has nGrid*nParam
 
@@ -288,8 +344,15 @@ def find_ML_Estimator(image, fitParams, outputHandle = None, setParams = None, m
 
     ##Find minimum chi^2 using scipy optimize routines
     ##version 11+ maxima = opt.minimize(get_logLikelihood, x0, args = (fitParams, image, modelParams))
-    if(searchMethod.lower() == 'simplex'):
-        maxima = opt.fmin(get_logLikelihood, x0 = x0, xtol = 0.00001, args = (fitParams, image, modelParams, modelLookup, 'sum'), disp = (verbose or debug))
+    if(len(searchParams) == 0):
+        ## All fit parameters are profiled
+        maxima = np.array([])
+    elif(searchMethod.lower() == 'lm' or searchMethod.lower() == 'least_squares'):
+        maxima, fisherMatrix, nEval = least_Squares_ML_Search(x0, searchParams, fitImage, modelParams, modelLookup)
+        if(verbose or debug):
+            print 'Least-squares search converged after ', nEval, ' model evaluations'
+    elif(searchMethod.lower() == 'simplex'):
+        maxima = opt.fmin(lnLFunc, x0 = x0, xtol = 0.00001, args = (searchParams, fitImage, lnLParams, modelLookup, 'sum'), disp = (verbose or debug))
     elif(searchMethod.lower() == "emcee"):
         import emcee
 
@@ -314,7 +377,7 @@ def find_ML_Estimator(image, fitParams, outputHandle = None, setParams = None, m
 
         print "P0:", p0
 
-        sampler = emcee.EnsembleSampler(nWalkers, nDim, get_logLikelihood,  args = (fitParams, image, modelParams, modelLookup, 'sum', -1))
+        sampler = emcee.EnsembleSampler(nWalkers, nDim, lnLFunc,  args = (searchParams, fitImage, lnLParams, modelLookup, 'sum', -1))
 
         #Burn-in
         if(verbose):
@@ -347,32 +410,31 @@ def find_ML_Estimator(image, fitParams, outputHandle = None, setParams = None, m
             for i in range(1,nDim+1):
                 ax = f.add_subplot(nDim, 1, i)
                 ax.hist(chain[:,i-1], bins = 100)
-                ax.set_title("Par: "+ fitParams[i-1])
+                ax.set_title("Par: "+ searchParams[i-1])
 
             pl.show()
                 
     elif(searchMethod.lower() == 'brent'):
-        maxima = opt.fmin_brent(get_logLikelihood, x0 = x0, xtol = 0.00001, args = (fitParams, image, modelParams, modelLookup, 'sum'), disp = (verbose or debug))
+        maxima = opt.fmin_brent(lnLFunc, x0 = x0, xtol = 0.00001, args = (searchParams, fitImage, lnLParams, modelLookup, 'sum'), disp = (verbose or debug))
     elif(searchMethod.lower() == 'powell'):
-        maxima = opt.fmin_powell(get_logLikelihood, x0 = x0, xtol = 0.00001, args = (fitParams, image, modelParams, modelLookup, 'sum'), disp = (verbose or debug))
-    elif(searchMethod.lower() == 'cg'):
-        ##Not tested (10Aug)
-        maxima = opt.fmin_cg(get_logLikelihood, x0 = x0, fprime = differentiate_logLikelihood_Gaussian_Analytic, args = (fitParams, image, modelParams, modelLookup, 'sum'), disp = (verbose or debug), ftol = 0.000001)
-    elif(searchMethod.lower() == 'bfgs'):
-        ##Not tested (10Aug)
-        maxima = opt.fmin_bfgs(get_logLikelihood, x0 = x0, fprime = differentiate_logLikelihood_Gaussian_Analytic, args = (fitParams, image, modelParams, modelLookup, 'sum'), disp = (verbose or debug))
-    elif(searchMethod.lower() == 'l_bfgs_b'):
-        ##Not tested (10Aug)
-        maxima = opt.fmin_l_bfgs_b(get_logLikelihood, x0 = x0, fprime = differentiate_logLikelihood_Gaussian_Analytic, args = (fitParams, image, modelParams, modelLookup, 'sum'), disp = (verbose or debug))
-    elif(searchMethod.lower() == 'ncg'):
-        ##Not tested (10Aug)
-        maxima = opt.fmin_ncg(get_logLikelihood, x0 = x0, fprime = differentiate_logLikelihood_Gaussian_Analytic, args = (fitParams, image, modelParams, modelLookup, 'sum'), disp = (verbose or debug))
+        maxima = opt.fmin_powell(lnLFunc, x0 = x0, xtol = 0.00001, args = (searchParams, fitImage, lnLParams, modelLookup, 'sum'), disp = (verbose or debug))
+    elif(searchMethod.lower() in gradientSearchMethods):
+        ## Value and analytic gradient from a single model evaluation
+        maxima, nEval = gradient_ML_Search(x0, searchParams, fitImage, modelParams, modelLookup, method = searchMethod, linearLabels = linearLabels)
+        if(verbose or debug):
+            print 'Gradient search converged after ', nEval, ' model evaluations'
     else:
         raise ValueError('find_ML_Estimator - searchMethod entered is not supported:'+str(searchMethod))
 
     ##Make numpy array (in the case where 1D is used and scalar is returned):
-    if(len(fitParams)==1):
+    if(len(searchParams)==1):
         maxima = np.array(makeIterableList(maxima))
+
+    ## Solve for the profiled parameters at the maximum, and construct the full estimate in fitParams order
+    if(len(linearLabels) > 0):
+        amplitudes = get_Profiled_Model(maxima, searchParams, fitImage, modelParams, linearLabels, modelLookup)[0][0]
+        modPro.set_modelParameter(modelParams, linearLabels, amplitudes)
+        maxima = np.array([amplitudes[linearLabels.index(l)] if l in linearLabels else maxima[searchParams.index(l)] for l in fitParams])
         
     if(vverbose):
         print 'maxima is:', maxima
@@ -431,7 +493,7 @@ def find_ML_Estimator(image, fitParams, outputHandle = None, setParams = None, m
 
     ##Output Result
     if(outputHandle is not None):
-        np.savetxt(outputHandle, np.array(maxima).reshape(1,maxima.shape[0]))
+        write_Rows(outputHandle, maxima)
         
     ## Bias Correct
     if(biasCorrect == 0):
@@ -442,13 +504,13 @@ def find_ML_Estimator(image, fitParams, outputHandle = None, setParams = None, m
 
         ##Output Result
         if(bcoutputHandle is not None):
-            np.savetxt(bcoutputHandle, np.array(bc_maxima).reshape(1,bc_maxima.shape[0]))
+            write_Rows(bcoutputHandle, bc_maxima)
 
         if(verbose):
             print 'BC Maxima found to be:', bc_maxima
 
         ##Return minimised parameters
-        Returned.append(maxima, bc_maxima)
+        Returned.extend([maxima, bc_maxima])
     else:
         raise ValueError('get_ML_estimator - biasCorrect(ion) value entered is not applicable:'+ str(biasCorrect))
 
@@ -458,7 +520,8 @@ def find_ML_Estimator(image, fitParams, outputHandle = None, setParams = None, m
         if(err is not None):
             err = err #Do nothing
         elif(error.lower() == 'fisher'):
-            err = fisher_Error_ML(maxima, fitParams, image, modelParams, modelLookup) #Use finalised modelParams here?
+            ## A lookup over the searched parameters only cannot be used for the full set of fitParams
+            err = fisher_Error_ML(maxima, fitParams, fitImage, modelParams, (modelLookup if len(linearLabels) == 0 else None), fisherMatrix = fisherMatrix) #Use finalised modelParams here?
         else:
             raise ValueError("get_ML_estimator - failed to return error, error requested, but value not found nor acceptable lable used")
         Returned.append(err)
@@ -467,7 +530,50 @@ def find_ML_Estimator(image, fitParams, outputHandle = None, setParams = None, m
     return Returned
 
 
-def get_logLikelihood(parameters, pLabels, image, setParams, modelLookup = None, returnType = 'sum', signModifier = 1, callCount = 0):
+###---------------- Sufficient statistics of a stack of realisations --------------------------###
+## For a Gaussian likelihood, sum_i (I_i - m)^2 = sum_i (I_i - <I>)^2 + nImage*(<I> - m)^2 for each pixel, so the likelihood of a stack of realisations of the same field, and all its derivatives, depend on the image only through the per-pixel mean <I> and scatter sum_i (I_i - <I>)^2. Computing these once per fit makes each likelihood evaluation O(nPix) irrespective of the number of realisations. Where the likelihood routines below accept `image', the statistics returned by get_Stack_Statistics can be entered in its place.
+
+def get_Stack_Statistics(image):
+    """
+    Returns the sufficient statistics of an image, or stack of image realisations, for the Gaussian log-Likelihood.
+
+    Requires:
+    image: flattened image, or 2D array of flattened images (first dimension labels realisation)
+
+    Returns:
+    stackStats: dictionary with keys:
+    ---`nImage`: number of realisations (1 for a single image)
+    ---`mean`: [nPix] per-pixel mean over realisations
+    ---`scatter`: [nPix] per-pixel sum of squared deviations from the mean, sum_i (I_i - <I>)^2
+    """
+
+    if(isinstance(image, dict)):
+        return image
+
+    image = np.asarray(image, dtype = float)
+    if(len(image.shape) == 1):
+        image = image.reshape(1,-1)
+    elif(len(image.shape) != 2):
+        raise ValueError('get_Stack_Statistics - image must be a flattened image, or 2D array of flattened images')
+
+    mean = image.mean(axis = 0)
+    return dict(nImage = image.shape[0], mean = mean, scatter = np.power(image-mean[None,:],2.).sum(axis = 0))
+
+def get_Stack_ChiSquared(model, stackStats):
+    """
+    Returns the per-pixel chi^2 (unnormalised by the noise), sum_i (I_i - model)^2, summed over all realisations in the stack described by stackStats.
+
+    Requires:
+    model: [nPix] or [N, nPix] array of flattened models
+    stackStats: image statistics, as returned by get_Stack_Statistics
+
+    Returns:
+    chi2: array of the same shape as model
+    """
+
+    return stackStats['scatter'] + stackStats['nImage']*np.power(stackStats['mean']-model,2.)
+
+def get_logLikelihood(parameters, pLabels, image, setParams, modelLookup = None, returnType = 'sum', signModifier = 1, callCount = 0, compiled = None):
     import math, sys
     import model_Production as modPro
     import surface_Brightness_Profiles as SBPro
@@ -479,12 +585,13 @@ def get_logLikelihood(parameters, pLabels, image, setParams, modelLookup = None,
     Requires:
     parameters: flattened array of parameter values for free parameters (allows for external program to set variation in these params)
     pLabels: string tuple of length `parameters`, which is used to identify the parameters being varied. These labels should satisfy the modelParameter dictionary keys using in setting up the model.
-    image: 2d <ndarray> of pixelised image.
+    image: 2d <ndarray> of pixelised image, or the statistics of a stack of realisations (see get_Stack_Statistics).
     setParams: dictionary of fixed model parameters which sets the model SB profile being fit.
     modelLookup: An instance of the model lookup table, as set in model_Production module. If None, the the pixelised model image is re-evaluated for each change in parameters.
     returnType (default sum):
     ---`sum`: Total log-likelihood, summing over all pixels
-    ---`pix`: log-likelihood evaluated per pixel. Returns ndarray of the same shape as the input image
+    ---`pix`: log-likelihood evaluated per pixel. Returns ndarray of the same shape as the input image, or if stack statistics are entered, the log-likelihood per pixel summed over realisations
+    compiled: If not None, setParams is the working copy of a fit, and compiled the locations of pLabels within it, as returned by compile_Fit_Parameters. The parameters are then set in place in setParams, rather than in a copy.
 
     Returns:
     lnL <scalar>: -1*log_likelihood evaulated at entered model parameters
@@ -493,10 +600,8 @@ def get_logLikelihood(parameters, pLabels, image, setParams, modelLookup = None,
 
     callCount += 1
     
-    ##Set up dictionary based on model parameters. Shallow copy so changes do not overwrite the original
-    modelParams = deepcopy(setParams)
-    
-    if((setParams['stamp_size']-np.array(image.shape)).sum() > 0):
+    stackStats = (image if isinstance(image, dict) else None)
+    if(stackStats is None and (setParams['stamp_size']-np.array(image.shape)).sum() > 0):
         raise RuntimeError('get_logLikelihood - stamp size passed does not match image:', str(setParams['stamp_size']), ':', str( image.shape))
     
     parameters = generalManipulation.makeIterableList(parameters); pLabels = generalManipulation.makeIterableList(pLabels)
@@ -504,8 +609,8 @@ def get_logLikelihood(parameters, pLabels, image, setParams, modelLookup = None,
         raise ValueError('get_logLikelihood - parameters and labels entered do not have the same length (iterable test): parameters:', str(parameters), ' labels:', str(pLabels))
     
     
-    ##Vary parameters which are being varied as input
-    modPro.set_modelParameter(modelParams, pLabels, parameters)
+    ##Vary parameters which are being varied as input. Shallow copy of setParams so changes do not overwrite the original, unless this is the working copy of a fit
+    modelParams = set_Fit_Parameters(setParams, pLabels, parameters, compiled)
     
     ''' Deprecated for above
     for l in range(len(pLabels)):
@@ -557,22 +662,20 @@ def get_logLikelihood(parameters, pLabels, image, setParams, modelLookup = None,
         
     keepPix = returnType.lower() == 'pix' or returnType.lower() == 'all'
 
-    pixlnL = np.array([])
-    lnL = 0
     absSign = signModifier/abs(signModifier)
-    if(len(image.shape) == len(model.shape)+1):
-        #print "Considering sum over images", pLabels, parameters
-        for i in range(image.shape[0]):
-            tpixlnL = absSign*np.power(image[i]-model,2.)
-            lnL += tpixlnL.sum()
-            if(keepPix):
-                pixlnL = np.append(pixlnL, tpixlnL)
-    
+    if(stackStats is not None):
+        ## O(nPix), irrespective of the number of realisations
+        tpixlnL = absSign*get_Stack_ChiSquared(model, stackStats)
+    elif(len(image.shape) == len(model.shape)+1):
+        ## Sum over images, as a flattened [nImage*nPix] array
+        tpixlnL = absSign*np.power(image-model[None,:],2.).flatten()
     else:
         tpixlnL = absSign*np.power(image-model,2.)
-        lnL += tpixlnL.sum()
-        if(keepPix):
-            pixlnL = np.append(pixlnL,tpixlnL)
+    lnL = tpixlnL.sum()
+    if(keepPix):
+        pixlnL = tpixlnL.flatten()
+    else:
+        pixlnL = np.array([])
 
     pixlnL *= 0.5/(modelParams['noise']**2.); lnL *= 0.5/(modelParams['noise']**2.)
 
@@ -589,24 +692,309 @@ def get_logLikelihood(parameters, pLabels, image, setParams, modelLookup = None,
     elif(returnType.lower() == 'all'):
         return [lnL, pixlnL]
 
+def get_logLikelihood_Batch(parameters, pLabels, image, setParams, signModifier = 1, linearLabels = None):
+    import sys
+    import model_Production as modPro
+    import surface_Brightness_Profiles as SBPro
+    import generalManipulation
+    """
+    Vectorised version of get_logLikelihood: returns the (-1.)*log-Likelihood (summed over pixels) for each of N sets of free parameter values, with all N models produced in a single call to model_Production.get_Pixelised_Model_Batch. The same hard prior as get_logLikelihood is applied. Model lookup tables are not supported.
+
+    Requires:
+    parameters: [N, nPar] array of parameter values for free parameters, with each row a seperate evaluation.
+    pLabels: string tuple of length nPar, labelling the parameters being varied, as in get_logLikelihood.
+    image: flattened image, or 2D array of flattened images (first dimension labels realisation), or their stack statistics, as in get_logLikelihood.
+    setParams: dictionary of fixed model parameters which sets the model SB profile being fit.
+    linearLabels: If not None, the parameters labelled (flux and/or bg) are profiled for each set of parameters, as in get_logLikelihood_Profiled.
+
+    Returns:
+    lnL <[N] ndarray>: -1*log_likelihood evaluated at each set of entered model parameters
+    """
+
+    pLabels = generalManipulation.makeIterableList(pLabels)
+    parameters = np.array(parameters, dtype = float).reshape(-1, len(pLabels))
+
+    ##Values of parameters entering hard prior
+    prior = {}
+    for k in ['e1', 'e2', 'size']:
+        if(k in pLabels):
+            prior[k] = parameters[:,list(pLabels).index(k)]
+        else:
+            prior[k] = setParams['SB'][k]
+    wall = np.logical_or(np.sqrt(prior['e1']**2. + prior['e2']**2.) >= 0.99, prior['size'] <= 0.)*np.ones(parameters.shape[0], dtype = bool)
+
+    if(linearLabels is not None):
+        model = get_Profiled_Model(parameters, pLabels, image, setParams, linearLabels)[1]
+    else:
+        model = modPro.get_Pixelised_Model_Batch(parameters, setParams, pLabels, sbProfileFunc = SBPro.gaussian_SBProfile_CXX)
+        model = model.reshape(model.shape[0], -1)
+
+    absSign = signModifier/abs(signModifier)
+    if(isinstance(image, dict)):
+        lnL = get_Stack_ChiSquared(model, image).sum(axis = 1)
+    elif(len(image.shape) == 2):
+        ## Sum over images: sum_i (I_i - m)^2 = sum_i I_i^2 - 2 m.sum_i I_i + nImage*m^2
+        lnL = np.power(image,2.).sum() - 2.*np.dot(model, image.sum(axis = 0)) + image.shape[0]*np.power(model,2.).sum(axis = 1)
+    else:
+        lnL = np.power(image[None,:]-model,2.).sum(axis = 1)
+    lnL *= absSign*0.5/(setParams['noise']**2.)
+
+    lnL[wall] = sys.float_info.max/10
+
+    return lnL
+
+def brute_Search_Batch(ranges, pLabels, image, setParams, Ns = 20, linearLabels = None):
+    """
+    Grid-based search of the log-Likelihood, equivalent to scipy.optimize.brute(get_logLikelihood, ranges, args = (pLabels, image, setParams), Ns = Ns, finish = None, full_output = True), but evaluating the likelihood over the whole grid in a single batched call (get_logLikelihood_Batch) rather than one grid point at a time.
+
+    Requires:
+    ranges: [nPar] tuple with each element either a slice or a (low, high) tuple, as for scipy.optimize.brute
+    pLabels, image, setParams: as get_logLikelihood
+    Ns: number of grid points per dimension where the range is entered as a (low, high) tuple
+    linearLabels: If not None, the parameters labelled (flux and/or bg) are profiled at each grid point (see get_logLikelihood_Profiled)
+
+    Returns:
+    x0, fval, grid, lnL: grid point of minimum (-1.)*lnL, value at that point, the parameter grid, and (-1.)*lnL over the grid, as returned by scipy.optimize.brute
+    """
+
+    nPar = len(ranges)
+    lrange = list(ranges)
+    for k in range(nPar):
+        if(not isinstance(lrange[k], slice)):
+            if(len(lrange[k]) < 3):
+                lrange[k] = tuple(lrange[k]) + (complex(Ns),)
+            lrange[k] = slice(*lrange[k])
+
+    if(nPar == 1):
+        grid = np.mgrid[lrange[0]]
+        gridList = (grid,)
+    else:
+        grid = np.mgrid[lrange]
+        gridList = grid
+
+    lnL = get_logLikelihood_Batch(np.array([g.flatten() for g in gridList]).T, pLabels, image, setParams, linearLabels = linearLabels).reshape(gridList[0].shape)
+
+    minIndex = np.unravel_index(np.argmin(lnL), lnL.shape)
+    x0 = np.array([g[minIndex] for g in gridList])
+    if(nPar == 1):
+        x0 = x0[0]
+
+    return x0, lnL[minIndex], grid, lnL
+
+###---------------- Profiled linear parameters (flux, background) ------------------------------###
+## The model is linear in the flux and background (bg), so for any set of values of the remaining (shape) parameters the likelihood can be maximised over these in closed form, by linear least squares. Fitting only the shape parameters non-linearly, with flux and/or bg `profiled' in this way, removes these from the non-linear search and from any model lookup table.
+
+## Parameters which enter the model linearly, and can be profiled
+linearParameterLabels = ['flux', 'bg']
+
+def solve_Linear_Amplitudes(unitModel, image, linearLabels, fixed):
+    """
+    Returns the least-squares values of the linear model parameters (flux and/or bg), for one or many unit-flux models. The model is flux*unitModel + bg, and the parameters not in linearLabels are held at the values in fixed.
+
+    Requires:
+    unitModel: [nPix] or [N, nPix] array of (flattened) models with unit flux and zero background
+    image: flattened image, or 2D array of flattened images (first dimension labels realisation), or their stack statistics (see get_Stack_Statistics). For multiple realisations, the fit is to their mean, which minimises the summed chi^2.
+    linearLabels: list of labels of parameters to solve for, subset of linearParameterLabels
+    fixed: dictionary giving the values of flux and bg where they are not solved for. A bg of None (no background, as the renderer) is taken as zero
+
+    Returns:
+    amplitudes: [N, len(linearLabels)] best-fit values, ordered as linearLabels. Where the system is singular (e.g. the unit model is zero), these are zero
+    model: [N, nPix] best-fit model
+    """
+
+    u = np.atleast_2d(unitModel)
+    if(isinstance(image, dict)):
+        data = image['mean']
+    elif(len(image.shape) == 2):
+        data = image.mean(axis = 0)
+    else:
+        data = image
+
+    offset = np.zeros(u.shape)
+    if('flux' not in linearLabels):
+        offset += fixed['flux']*u
+    if('bg' not in linearLabels and fixed.get('bg', None) is not None):
+        offset += fixed['bg']
+    target = data[None,:] - offset
+
+    A = np.empty(u.shape+(len(linearLabels),))
+    for j, l in enumerate(linearLabels):
+        if(l == 'flux'):
+            A[:,:,j] = u
+        elif(l == 'bg'):
+            A[:,:,j] = 1.
+        else:
+            raise ValueError('solve_Linear_Amplitudes - Parameter entered is not linear:'+str(l))
+
+    ## Normal equations, for all models at once
+    G = np.einsum('npi,npj->nij', A, A)
+    r = np.einsum('npi,np->ni', A, target)
+    singular = np.abs(np.linalg.det(G)) <= 1.e-12*np.power(np.einsum('nii->n', G), len(linearLabels))
+    G[singular] = np.identity(len(linearLabels))
+    amplitudes = np.linalg.solve(G, r[:,:,None])[:,:,0]
+    amplitudes[singular] = 0.
+
+    return amplitudes, offset + np.einsum('npj,nj->np', A, amplitudes)
+
+def get_Profiled_Model(parameters, pLabels, image, setParams, linearLabels = ['flux'], modelLookup = None):
+    """
+    Returns the best-fit (profiled) model for one or many sets of the non-linear parameters, with the linear parameters (linearLabels) set to their least-squares values for the image (see solve_Linear_Amplitudes).
+
+    Requires:
+    parameters: [nPar] or [N, nPar] array of values of the non-linear parameters
+    pLabels: labels of the non-linear parameters. Must not include any of linearLabels
+    image: flattened image, or 2D array of flattened images
+    setParams: dictionary of fixed model parameters
+    linearLabels: labels of the parameters to be profiled, subset of linearParameterLabels
+    modelLookup: lookup table (see model_Production.get_Model_Lookup) over pLabels, from which the unit model is taken. If None (or not in use), the model is rendered.
+
+    Returns:
+    amplitudes: [N, len(linearLabels)] best-fit values of the profiled parameters
+    model: [N, nPix] best-fit model
+    """
+    import model_Production as modPro
+    import surface_Brightness_Profiles as SBPro
+    import generalManipulation
+
+    pLabels = generalManipulation.makeIterableList(pLabels); linearLabels = generalManipulation.makeIterableList(linearLabels)
+    for l in linearLabels:
+        if(l not in linearParameterLabels):
+            raise ValueError('get_Profiled_Model - Only '+str(linearParameterLabels)+' can be profiled:'+str(l))
+        if(l in pLabels):
+            raise ValueError('get_Profiled_Model - Profiled parameter cannot also be fit non-linearly:'+str(l))
+    parameters = np.array(parameters, dtype = float).reshape(-1, len(pLabels))
+
+    if(modelLookup is not None and modelLookup['useLookup']):
+        ## Lookup models are produced with flux baseFlux and background baseBg (None for no background)
+        unitModel = np.array([modPro.return_Model_Lookup(modelLookup, p)[0].flatten() for p in parameters])
+        if(modelLookup['baseBg'] is not None):
+            unitModel = unitModel - modelLookup['baseBg']
+        unitModel = unitModel/modelLookup['baseFlux']
+    else:
+        unitParams = modPro.copy_ModelParameters(setParams)
+        modPro.set_modelParameter(unitParams, ['flux', 'bg'], [1., 0.])
+        unitModel = modPro.get_Pixelised_Model_Batch(parameters, unitParams, pLabels, sbProfileFunc = SBPro.gaussian_SBProfile_CXX)
+        unitModel = unitModel.reshape(unitModel.shape[0], -1)
+
+    return solve_Linear_Amplitudes(unitModel, image, linearLabels, setParams['SB'])
+
+def get_logLikelihood_Profiled(parameters, pLabels, image, setParams, modelLookup = None, returnType = 'sum', signModifier = 1, linearLabels = ['flux']):
+    """
+    Returns the (-1.)*profiled log-Likelihood: the (-1.)*log-Likelihood of get_logLikelihood, maximised over the linear parameters linearLabels (flux and/or bg), which are solved for by linear least squares rather than being searched over. The call fingerprint matches that of get_logLikelihood, so this can be used in its place in a minimisation routine, with pLabels holding only the non-linear parameters.
+
+    Requires:
+    As get_logLikelihood, and
+    linearLabels: labels of the parameters to be profiled, subset of linearParameterLabels. These must not be in pLabels.
+
+    Returns:
+    As get_logLikelihood
+    """
+    import math, sys
+    import generalManipulation
+
+    parameters = generalManipulation.makeIterableList(parameters); pLabels = generalManipulation.makeIterableList(pLabels)
+    if(len(parameters) != len(pLabels)):
+        raise ValueError('get_logLikelihood_Profiled - parameters and labels entered do not have the same length (iterable test): parameters:', str(parameters), ' labels:', str(pLabels))
+
+    ## Hard prior, as get_logLikelihood
+    prior = dict([[k, setParams['SB'][k]] for k in ['e1', 'e2', 'size']])
+    for k in range(len(pLabels)):
+        if(pLabels[k] in prior):
+            prior[pLabels[k]] = parameters[k]
+    if(math.sqrt(prior['e1']**2. + prior['e2']**2.) >= 0.99 or prior['size'] <= 0.):
+        return sys.float_info.max/10
+
+    amplitudes, model = get_Profiled_Model(parameters, pLabels, image, setParams, linearLabels, modelLookup)
+    model = model[0]
+
+    absSign = signModifier/abs(signModifier)
+    if(isinstance(image, dict)):
+        pixlnL = absSign*get_Stack_ChiSquared(model, image)
+    elif(len(image.shape) == 2):
+        pixlnL = absSign*np.power(image-model[None,:],2.).flatten()
+    else:
+        pixlnL = absSign*np.power(image-model,2.)
+    pixlnL *= 0.5/(setParams['noise']**2.)
+
+    if(returnType.lower() == 'sum'):
+        return pixlnL.sum()
+    elif(returnType.lower() == 'pix'):
+        return pixlnL
+    elif(returnType.lower() == 'all'):
+        return [pixlnL.sum(), pixlnL]
+
+def differentiate_logLikelihood_Profiled(parameters, pLabels, image, setParams, modelLookup = None, returnType = None, order = 1, signModifier = -1., linearLabels = ['flux']):
+    """
+    Returns the first derivative of the (-1.)*profiled log-Likelihood (get_logLikelihood_Profiled) with respect to the non-linear parameters. As the profiled parameters are at their maximum-likelihood values, this is equal to the derivative of the log-Likelihood with these held fixed at those values. Call fingerprint matches differentiate_logLikelihood_Gaussian_Analytic, so this can be used as fprime in gradient-based minimisation. Only first derivatives (order == 1) are supported.
+    """
+    import model_Production as modPro
+    import generalManipulation
+
+    if(order != 1):
+        raise ValueError('differentiate_logLikelihood_Profiled - Only first derivatives of the profiled likelihood are supported')
+
+    linearLabels = generalManipulation.makeIterableList(linearLabels)
+    amplitudes, model = get_Profiled_Model(parameters, pLabels, image, setParams, linearLabels, modelLookup)
+    modelParams = modPro.copy_ModelParameters(setParams)
+    modPro.set_modelParameter(modelParams, linearLabels, amplitudes[0])
+
+    return differentiate_logLikelihood_Gaussian_Analytic(parameters, pLabels, image, modelParams, modelLookup = None, order = 1, signModifier = signModifier)
+
 ###---------------- Derivatives of log-Likelihood -----------------------------------------------###
 
-def differentiate_logLikelihood_Gaussian_Analytic(parameters, pLabels, image, setParams, modelLookup = None, returnType = None, order = 1, signModifier = -1.):
+def get_Fit_Model_Bundle(parameters, pLabels, modelParams, modelLookup = None, order = 1):
+    """
+    Returns the flattened model and its derivatives wrt the parameters labelled pLabels, as used in the derivatives of the log-Likelihood. Model, first and second derivatives are evaluated together as a single bundle (see model_Production.get_Pixelised_Model_Bundle). If an interpolated lookup table over the same parameters is used, the bundle is taken from the table; for other lookup tables, only the model is.
+
+    Requires:
+    parameters, pLabels: values and labels of the parameters being varied
+    modelParams: model dictionary, with the parameters pLabels already set to parameters
+    modelLookup: An instance of the model lookup table, or None
+    order: highest order of derivative returned (1 or 2)
+
+    Returns:
+    model: [nPix] model
+    modDer: [nP, nPix] first derivatives
+    modDer2: [nP, nP, nPix] second derivatives, or None if order == 1
+    """
     import generalManipulation
     import model_Production as modPro
     from surface_Brightness_Profiles import gaussian_SBProfile_CXX
+
+    useLookup = (modelLookup is not None and modelLookup['useLookup'])
+    lookupBundle = (useLookup and modelLookup['interp'] is not None and modelLookup['interp'].lower() != 'nearest' and sorted(generalManipulation.makeIterableList(modelLookup.get('labels', []))) == sorted(pLabels))
+    if(lookupBundle):
+        bundle = modPro.return_Model_Lookup_Bundle(modelLookup, parameters, pLabels, order = order)
+    else:
+        bundle = modPro.get_Pixelised_Model_Bundle(modelParams, pLabels, sbProfileFunc = gaussian_SBProfile_CXX, order = order)
+    model, modDer, modDer2 = modPro.unpack_Model_Bundle(bundle, len(pLabels))
+    #modDer stores the first derivative of all parameters entered, stored as an nP*nPix*nPix array; modDer2 all second derivatives as nP*nP*nPix*nPix (None if order == 1)
+    if(useLookup and not lookupBundle):
+        model = np.array(modPro.return_Model_Lookup(modelLookup, parameters)[0]) #First element of this routine is the model image itself
+
+    #Flatten model and derivative model images to reflect the form of the input image
+    model = model.flatten()
+    modDer = modDer.reshape((modDer.shape[0], -1))
+    if(modDer2 is not None):
+        modDer2 = modDer2.reshape((modDer2.shape[0],modDer2.shape[1], -1))
+
+    return model, modDer, modDer2
+
+def differentiate_logLikelihood_Gaussian_Analytic(parameters, pLabels, image, setParams, modelLookup = None, returnType = None, order = 1, signModifier = -1.):
+    import generalManipulation
+    import model_Production as modPro
     '''
     Returns the analytic derivative of the Gaussian log-Likelihood (ignoring parameter-independent prefactor whose derivative is zero) for parameters labelled by pLabels.
-    Uses analytic derivative of the pixelised model as given in differentiate_Pixelised_Model_Analytic routine of model_Production routine.
+    Uses analytic derivative of the pixelised model as given by the model bundle (get_Pixelised_Model_Bundle) of model_Production routine.
 
     *** Note: `noise` as defined in set params must the noise_std, and must accurately describe the noise properties of the image. ***
 
     Requires:
     parameters: flattened array of parameter values to vary (allows for external program to set variation in these params)
     pLabels: tuple of length `parameters`, which is used to identify the parameters being varied. These labels should satisfy the modelParameter dictionary keys using in setting up the model
-    image: 2d <ndarray> of pixelised image
+    image: 2d <ndarray> of pixelised image, or 2D array of flattened images, or their stack statistics (see get_Stack_Statistics)
     setParams: dictionary of fixed model parameters which sets the model SB profile being fit.
-    modelLookup: An instance of the model lookup table, as set in model_Production module
+    modelLookup: An instance of the model lookup table, as set in model_Production module. If the lookup is interpolated (interp `linear' or `cubic') over exactly the parameters pLabels, the model and its derivatives are all taken from the table; otherwise only the model is.
     returnType: IGNORED, but included so that this method mimic the call fingerprint of the log-Likelihood evaluation routine if used as part of a pre-fab minimisation routine.
     order: sets the order to which derivatives are taken. If order == 1, the return is a tuple (ndarray) of length len(parameters), which contains the first derivatives of all parameters. If order == 2, the retrun is a two-dimensional ndarray, where each element i,j gives the sendon derivative wrt parameter i and parameter j. Order >= 3 or <= 0 are not supported.
     signModifier: default -1. Result is multiplied by abs(signModifier)/signModifier, to change the sing of the output. This is required as the lnL routine actually returns -lnL = chi^2 where a minimisation routine is used. Thus, where the minimisation uses first derivatives, the signModifier should be postive, whilst for other applications (such as the fisher error) on requires the derivative of lnL, and so sign modifier must be negative. The absolute value of signModifier is unimportant.
@@ -636,7 +1024,7 @@ def differentiate_logLikelihood_Gaussian_Analytic(parameters, pLabels, image, se
 
     ### Set up model parameters as input
     ##Set up dictionary based on model parameters. Shallow copy so changes do not overwrite the original
-    modelParams = deepcopy(setParams)
+    modelParams = modPro.copy_ModelParameters(setParams)
     
     ##Check whether parameters input are iterable and assign to a tuple if not: this allows both `parameters' and `pLabels' to be passed as e.g. a float and string and the method to still be used as it
     parameters = generalManipulation.makeIterableList(parameters); pLabels = generalManipulation.makeIterableList(pLabels)
@@ -646,15 +1034,8 @@ def differentiate_logLikelihood_Gaussian_Analytic(parameters, pLabels, image, se
     ##Vary parameters which are being varied as input
     modPro.set_modelParameter(modelParams, pLabels, parameters)
 
-    ''' Get Model'''
-    if(modelLookup is not None and modelLookup['useLookup']):
-        model = np.array(modPro.return_Model_Lookup(modelLookup, parameters)[0]) #First element of this routine is the model image itself
-    else:
-        model = modPro.user_get_Pixelised_Model(modelParams, sbProfileFunc = gaussian_SBProfile_CXX)[0]
-
-    ''' Get model derivatives '''    
-    modDer = modPro.differentiate_Pixelised_Model_Analytic(modelParams, parameters, pLabels, n = 1, permute = False)
-    #modDer stores only the n'th derivative of all parameters entered, stored as an nP*nPix*nPix array.
+    ''' Get Model and model derivatives '''
+    model, modDer, modDer2 = get_Fit_Model_Bundle(parameters, pLabels, modelParams, modelLookup, order = (2 if order == 2 else 1))
 
     ''' Testing flattening
     print "modDer shape:", modDer.shape()
@@ -665,28 +1046,12 @@ def differentiate_logLikelihood_Gaussian_Analytic(parameters, pLabels, image, se
     raw_input()
     '''
 
-    modDer2 = None
-    if(order == 2):
-        ##Calculate 2nd derivative also
-        modDer2 = modPro.differentiate_Pixelised_Model_Analytic(modelParams, parameters, pLabels, n = 2, permute = True)
-            #modDer2 stores the 2nd derivative of all parameters entered, stored as an nP*nP*nPix*nPix array.
-
-    #Flatten and reshape model and derivative model images to reflect the form of the input image (which can by multi-realisations)
-    model = model.flatten()
-    modDer = modDer.reshape((modDer.shape[0], -1))
-    if(modDer2 is not None):
-        modDer2 = modDer2.reshape((modDer2.shape[0],modDer2.shape[1], -1))
-        
-    if(len(image.shape) == 2):
-        ## Repeat each nReal times
-        nRepeat = image.shape[0]
-        
-        model = np.tile(model, (nRepeat, 1))
-        
-        modDer = np.array([np.tile(modDer[i],(nRepeat,1)) for i in range(modDer.shape[0])])
-
-        #There's most likely a better way to do this (i.e. quicker)
-        modDer2 = np.array([ [np.tile(modDer2[i,j],(nRepeat,1)) for j in range(modDer2.shape[1])] for i in range(modDer2.shape[0])])
+    ## Multiple realisations: the derivatives depend on the images only through their sum, so sum_i (I_i - m) = nImage*(<I> - m) is used rather than repeating the model for each realisation
+    nImage = 1
+    if(isinstance(image, dict) or len(image.shape) == 2):
+        stackStats = get_Stack_Statistics(image)
+        nImage = stackStats['nImage']
+        image = stackStats['mean']
         
     # print "Shape check:"
     # print "Image:", image.shape
@@ -709,7 +1074,7 @@ def differentiate_logLikelihood_Gaussian_Analytic(parameters, pLabels, image, se
 
         ##Set derivative as sum_pix(delI*derI)/sig^2 for all parameters entered
         ## ReturnTypes other than sum could be implemented by removing the sum pats of this relation, however the implementation of fprime in the minimisation routines requires the return to be a 1D array containing the gradient in each direction.
-        res = (tdelI*modDer).sum(axis = -1).sum(axis = -1)
+        res = (tdelI*modDer).reshape(modDer.shape[0], -1).sum(axis = -1)
         
     elif(order == 2):
         res = np.zeros((nP,nP))
@@ -719,7 +1084,459 @@ def differentiate_logLikelihood_Gaussian_Analytic(parameters, pLabels, image, se
             for j in range(nP):
                 res[i,j] = (delI*modDer2[i,j] - modDer[i]*modDer[j]).sum(axis = -1).sum(axis = -1)
 
-    res /= (signModifier/abs(signModifier))*modelParams['noise']*modelParams['noise']
+    res *= nImage/((signModifier/abs(signModifier))*modelParams['noise']*modelParams['noise'])
     
     return res
     
+
+###---------------- Search helpers ---------------------------------------------------------------###
+
+## The hard prior of get_logLikelihood (|e| < 0.99, size > 0) as used by the gradient-based and least-squares searches: trial points outside the prior are evaluated at their projection onto it (see project_Prior), set just within the prior, with a quadratic penalty of priorPenalty*excess^2/2 (in units of -lnL) on the distance outside. The objective is then continuous across the prior, and is minimised on or within it. The batched search (least_Squares_ML_Search_Batch) projects its trial points onto the prior without a penalty
+priorEllipticity = 0.99 - 1.e-6
+priorSize = 1.e-6
+priorPenalty = 1.e4
+
+def project_Prior(parameters, pLabels, setParams):
+    """
+    Projects parameters onto the hard prior of get_logLikelihood: the fit ellipticity components are scaled radially onto |e| = priorEllipticity (components not fit are held at their value in setParams), and size is raised to priorSize. Parameters within the prior are unchanged.
+
+    Requires:
+    parameters: [nP] or [N, nP] parameter values
+    pLabels: labels of the parameters
+    setParams: model dictionary, giving e1 and e2 where these are not in pLabels
+
+    Returns:
+    projected: projected parameters, of the same shape as parameters
+    dProjected: [N, nP, nP] derivative of projected (first index) wrt parameters (second index)
+    excess: [N, 2] distance outside the prior in ellipticity and in size, zero within the prior
+    dExcess: [N, 2, nP] derivative of excess wrt parameters
+    For a single set of [nP] parameters, the leading [N] dimension is dropped.
+    """
+    pLabels = list(pLabels)
+    x = np.array(parameters, dtype = float)
+    single = (x.ndim == 1)
+    x = x.reshape(-1, len(pLabels))
+    N, nP = x.shape
+
+    projected = x.copy()
+    dProjected = np.tile(np.identity(nP), (N,1,1))
+    excess = np.zeros((N,2)); dExcess = np.zeros((N,2,nP))
+
+    ## Fit ellipticity components f are scaled onto |f| = radius, the circle |e| = priorEllipticity at the fixed components
+    eIndex = [pLabels.index(l) for l in ['e1', 'e2'] if l in pLabels]
+    if(len(eIndex) > 0):
+        fixed = sum([setParams['SB'][l]**2. for l in ['e1', 'e2'] if l not in pLabels])
+        radius = np.sqrt(max(priorEllipticity**2. - fixed, 0.))
+        modulus = np.sqrt(np.power(x[:,eIndex], 2.).sum(axis = 1))
+        outside = np.where(modulus > radius)[0]
+        if(outside.shape[0] > 0):
+            unit = x[outside][:,eIndex]/modulus[outside,None]
+            projected[np.ix_(outside, eIndex)] = radius*unit
+            dProjected[np.ix_(outside, eIndex, eIndex)] = (radius/modulus[outside])[:,None,None]*(np.identity(len(eIndex))[None,:,:] - unit[:,:,None]*unit[:,None,:])
+            excess[outside,0] = modulus[outside] - radius
+            dExcess[np.ix_(outside, [0], eIndex)] = unit[:,None,:]
+
+    if('size' in pLabels):
+        s = pLabels.index('size')
+        below = np.where(x[:,s] < priorSize)[0]
+        projected[below,s] = priorSize
+        dProjected[below,s,s] = 0.
+        excess[below,1] = priorSize - x[below,s]
+        dExcess[below,1,s] = -1.
+
+    if(single):
+        return projected[0], dProjected[0], excess[0], dExcess[0]
+    return projected, dProjected, excess, dExcess
+
+def compile_Fit_Parameters(setParams, pLabels):
+    """
+    Returns a working copy of the model dictionary setParams for a fit over the parameters labelled pLabels, and the locations of these parameters within it (see model_Production.compile_ModelParameters). Both are built once per fit, and passed to the likelihood callbacks (as setParams and compiled), which then set each trial point in place rather than copying the dictionary and locating each label on every evaluation. setParams is not modified.
+    """
+    import model_Production as modPro
+
+    workParams = modPro.copy_ModelParameters(setParams)
+    return workParams, modPro.compile_ModelParameters(workParams, pLabels)
+
+def set_Fit_Parameters(setParams, pLabels, parameters, compiled = None):
+    """
+    Returns the model dictionary for a likelihood evaluation at parameters: setParams itself, with parameters set in place, if compiled (see compile_Fit_Parameters) is passed, and otherwise a copy of setParams with parameters set.
+    """
+    import model_Production as modPro
+
+    if(compiled is None):
+        modelParams = modPro.copy_ModelParameters(setParams)
+        modPro.set_modelParameter(modelParams, pLabels, parameters)
+        return modelParams
+    modPro.set_Compiled_Parameters(compiled, parameters)
+    return setParams
+
+def memoise_Last_Evaluation(func):
+    """
+    Returns a wrapper of func(x) which stores the result of the last evaluation, so that successive calls at the same point (e.g. for the value and gradient, or residual and Jacobian, in a minimisation routine) evaluate func only once. The number of evaluations of func is stored in wrapper.cache['nEval'].
+    """
+    cache = dict(x = None, value = None, nEval = 0)
+    def wrapper(x):
+        if(cache['x'] is None or not np.array_equal(x, cache['x'])):
+            cache['value'] = func(x)
+            cache['x'] = np.array(x, copy = True); cache['nEval'] += 1
+        return cache['value']
+    wrapper.cache = cache
+    return wrapper
+
+###---------------- Gradient-based search --------------------------------------------------------###
+
+## Search methods accepted by find_ML_Estimator which use the analytic gradient, and their name in scipy.optimize.minimize
+gradientSearchMethods = {'cg':'CG', 'bfgs':'BFGS', 'ncg':'Newton-CG', 'l_bfgs_b':'L-BFGS-B', 'tnc':'TNC'}
+
+def get_logLikelihood_Gradient(parameters, pLabels, image, setParams, modelLookup = None, linearLabels = None, compiled = None):
+    """
+    Returns the (-1.)*log-Likelihood (as get_logLikelihood, summed over pixels) and its gradient wrt the parameters labelled pLabels, from a single evaluation of the model and its first derivatives (see get_Fit_Model_Bundle). This is the combined value and gradient callback used by gradient_ML_Search.
+
+    Requires:
+    parameters, pLabels, image, setParams, modelLookup: as get_logLikelihood
+    linearLabels: If not None, labels of parameters (flux and/or bg) which are profiled, as get_logLikelihood_Profiled. As the profiled parameters are at their maximum-likelihood values, the gradient is that with these held fixed.
+    compiled: as get_logLikelihood
+
+    Returns:
+    lnL <scalar>: -1*log_likelihood
+    dlnL <[nP] ndarray>: derivative of -1*log_likelihood wrt parameters
+    Outside the hard prior of get_logLikelihood, lnL is evaluated at the projection of parameters onto the prior, plus a quadratic penalty on the distance outside it (see project_Prior), so that lnL and dlnL are continuous across the prior. Where the fixed parameters of setParams are themselves outside the prior, lnL is sys.float_info.max/10 and dlnL is zero.
+    """
+    import math, sys
+    import generalManipulation
+    import model_Production as modPro
+
+    parameters = generalManipulation.makeIterableList(parameters); pLabels = generalManipulation.makeIterableList(pLabels)
+    if(len(parameters) != len(pLabels)):
+        raise ValueError('get_logLikelihood_Gradient - parameters and labels entered do not have the same length (iterable test)')
+
+    ## The model is evaluated at the projection onto the hard prior
+    parameters, dProjected, excess, dExcess = project_Prior(parameters, pLabels, setParams)
+    modelParams = set_Fit_Parameters(setParams, pLabels, parameters, compiled)
+
+    if(math.sqrt(modelParams['SB']['e1']**2. + modelParams['SB']['e2']**2.) >= 0.99 or modelParams['SB']['size'] <= 0.):
+        return sys.float_info.max/10, np.zeros(len(pLabels))
+
+    if(linearLabels is not None and len(linearLabels) > 0):
+        ## The lookup is over pLabels at fixed flux, so is used only in solving for the profiled parameters
+        amplitudes = get_Profiled_Model(parameters, pLabels, image, setParams, linearLabels, modelLookup)[0][0]
+        modPro.set_modelParameter(modelParams, linearLabels, amplitudes)
+        modelLookup = None
+
+    model, modDer, disc = get_Fit_Model_Bundle(parameters, pLabels, modelParams, modelLookup, order = 1)
+
+    stackStats = get_Stack_Statistics(image)
+    delI = stackStats['mean'] - model
+    norm = 1./(modelParams['noise']**2.)
+
+    lnL = 0.5*norm*get_Stack_ChiSquared(model, stackStats).sum() + 0.5*priorPenalty*np.power(excess, 2.).sum()
+    dlnL = -norm*stackStats['nImage']*np.dot(dProjected.T, np.dot(modDer, delI)) + priorPenalty*np.dot(excess, dExcess)
+
+    return lnL, dlnL
+
+def gradient_ML_Search(x0, pLabels, image, setParams, modelLookup = None, method = 'l_bfgs_b', linearLabels = None, gtol = 1.e-6, maxIter = 1000):
+    """
+    Maximum-likelihood search using scipy.optimize.minimize, with the value and analytic gradient of the log-Likelihood evaluated together (get_logLikelihood_Gradient) and the last evaluation cached, so that no trial point is evaluated twice. The searches are unbounded: trial points outside the hard prior on size and ellipticity are evaluated at their projection onto the prior, with a penalty on the distance outside it (see project_Prior), and the ML estimate is the projection of the final point of the search.
+
+    Requires:
+    x0: initial guess for the parameters labelled pLabels
+    pLabels, image, setParams, modelLookup: as get_logLikelihood
+    method: search method, as a key of gradientSearchMethods
+    linearLabels: labels of profiled parameters, as get_logLikelihood_Profiled, or None
+    gtol: tolerance on the gradient
+    maxIter: maximum number of iterations
+
+    Returns:
+    maxima: [nP] ML estimate
+    nEval: number of model bundles evaluated
+    """
+    import scipy.optimize as opt
+    import generalManipulation
+
+    if(method.lower() not in gradientSearchMethods):
+        raise ValueError('gradient_ML_Search - method not recognised:'+str(method))
+    method = gradientSearchMethods[method.lower()]
+
+    pLabels = generalManipulation.makeIterableList(pLabels)
+    x0 = np.array(generalManipulation.makeIterableList(x0), dtype = float)
+    stackStats = get_Stack_Statistics(image)
+
+    ## Trial parameters are set in place in a working copy of setParams, compiled once for the search
+    workParams, compiled = compile_Fit_Parameters(setParams, pLabels)
+    evaluate = memoise_Last_Evaluation(lambda x: get_logLikelihood_Gradient(x, pLabels, stackStats, workParams, modelLookup, linearLabels, compiled = compiled))
+
+    options = dict(maxiter = maxIter)
+    if(method == 'Newton-CG'):
+        options['xtol'] = gtol
+    else:
+        options['gtol'] = gtol
+
+    x0 = project_Prior(x0, pLabels, setParams)[0]
+    result = opt.minimize(evaluate, x0, jac = True, method = method, options = options)
+
+    if(not result.success and (verbose or debug)):
+        print 'gradient_ML_Search - ', method, ' did not report convergence: ', result.message
+
+    return project_Prior(result.x, pLabels, setParams)[0], evaluate.cache['nEval']
+
+###---------------- Least-squares (Gauss-Newton) search -----------------------------------------###
+## For a Gaussian likelihood, -lnL = 0.5*|r|^2 + const, with residual vector r = sqrt(nImage)*(<I> - model)/sigma, whose Jacobian J = -sqrt(nImage)*dmodel/dtheta/sigma is given by the analytic model derivatives. A Levenberg-Marquardt/trust-region least-squares search on r uses this curvature information, and so typically converges in a handful of model evaluations, and J^T J at the solution is the Fisher matrix.
+
+def get_Residual_Jacobian(parameters, pLabels, image, setParams, modelLookup = None, compiled = None):
+    """
+    Returns the noise-normalised residual vector r, and its Jacobian, for the Gaussian log-Likelihood, where -lnL = 0.5*|r|^2 + const. Model and derivatives are evaluated together in a single bundle (see get_Fit_Model_Bundle).
+
+    Requires:
+    parameters, pLabels, image, setParams, modelLookup, compiled: as get_logLikelihood
+
+    Returns:
+    r: [nPix] residual vector. For a stack of realisations, this is sqrt(nImage)*(<I> - model)/sigma
+    J: [nPix, nP] Jacobian of r wrt parameters
+    """
+    import generalManipulation
+    import model_Production as modPro
+
+    parameters = generalManipulation.makeIterableList(parameters); pLabels = generalManipulation.makeIterableList(pLabels)
+    if(len(parameters) != len(pLabels)):
+        raise ValueError('get_Residual_Jacobian - parameters and labels entered do not have the same length (iterable test)')
+
+    modelParams = set_Fit_Parameters(setParams, pLabels, parameters, compiled)
+
+    model, modDer, disc = get_Fit_Model_Bundle(parameters, pLabels, modelParams, modelLookup, order = 1)
+
+    stackStats = get_Stack_Statistics(image)
+    norm = np.sqrt(stackStats['nImage'])/modelParams['noise']
+
+    return norm*(stackStats['mean'] - model), -norm*modDer.T
+
+def least_Squares_ML_Search(x0, pLabels, image, setParams, modelLookup = None, xtol = 1.e-8, maxEval = 100):
+    """
+    Maximum-likelihood search using scipy.optimize.least_squares on the residual vector of get_Residual_Jacobian, with the analytic model Jacobian. Residual and Jacobian are evaluated from the same model bundle, which is cached so that each trial point is rendered once. As gradient_ML_Search, the search is unbounded: trial points outside the hard prior on size and ellipticity are evaluated at their projection onto the prior, with the penalty on the distance outside it appended to the residual vector (see project_Prior), and the ML estimate is the projection of the final point of the search.
+
+    Requires:
+    x0: initial guess for the parameters labelled pLabels
+    pLabels, image, setParams, modelLookup: as get_logLikelihood
+    xtol: relative tolerance on the change in parameters, as scipy.optimize.least_squares
+    maxEval: maximum number of residual evaluations
+
+    Returns:
+    maxima: [nP] ML estimate. Where the search does not report convergence (reported under verbose or debug), this is the final point of the search
+    fisher: [nP, nP] Fisher matrix J^T J at the ML estimate
+    nEval: number of model bundles evaluated
+    """
+    import scipy.optimize as opt
+    import generalManipulation
+
+    pLabels = generalManipulation.makeIterableList(pLabels)
+    x0 = np.array(generalManipulation.makeIterableList(x0), dtype = float)
+    stackStats = get_Stack_Statistics(image)
+
+    x0 = project_Prior(x0, pLabels, setParams)[0]
+
+    ## Trial parameters are set in place in a working copy of setParams, compiled once for the search
+    workParams, compiled = compile_Fit_Parameters(setParams, pLabels)
+    penaltyNorm = np.sqrt(priorPenalty)
+    def get_Projected_Residual_Jacobian(x):
+        ## Residual and Jacobian at the projection of x onto the hard prior, with the penalty terms appended, so that 0.5*|r|^2 is the objective of get_logLikelihood_Gradient
+        xProjected, dProjected, excess, dExcess = project_Prior(x, pLabels, setParams)
+        r, J = get_Residual_Jacobian(xProjected, pLabels, stackStats, workParams, modelLookup, compiled = compiled)
+        return np.append(r, penaltyNorm*excess), np.vstack([np.dot(J, dProjected), penaltyNorm*dExcess])
+
+    ## Residual and Jacobian are produced together: cache the last evaluation so that the Jacobian call at the same point does not re-render
+    evaluate = memoise_Last_Evaluation(get_Projected_Residual_Jacobian)
+    resid = lambda x: evaluate(x)[0]
+    jac = lambda x: evaluate(x)[1]
+
+    result = opt.least_squares(resid, x0, jac = jac, method = 'lm', xtol = xtol, max_nfev = maxEval)
+
+    ## As gradient_ML_Search, non-convergence is reported rather than raised, so that a single poorly-behaved realisation does not end a large run. The final point of the search is returned
+    if(not result.success and (verbose or debug)):
+        print 'least_Squares_ML_Search - least-squares search did not report convergence: ', result.message
+
+    ## Within the prior, the penalty terms (the last two rows of the Jacobian) are zero
+    maxima = project_Prior(result.x, pLabels, setParams)[0]
+    J = jac(maxima)[:-2]
+    return maxima, np.dot(J.T, J), evaluate.cache['nEval']
+
+###---------------- Catalogue (multi-stamp) fitting ----------------------------------------------###
+## Many postage stamps sharing a base model (but with different data, initial guesses and noise) are fit together, with a Levenberg-Marquardt step taken for all objects at once: the models and Jacobians of all objects are produced in a single batched call (model_Production.get_Pixelised_Model_Bundle_Batch), and the damped normal equations solved for all objects together.
+
+def least_Squares_ML_Search_Batch(x0, pLabels, images, setParams, noise = None, xtol = 1.e-8, ftol = 1.e-8, maxIter = 100):
+    """
+    Batched Levenberg-Marquardt search for the ML point of each of nGal images, using the analytic model Jacobian. Each object has its own damping, and is removed from the iteration once converged, or once its damping is exhausted (no improving step can be found). Trial points are projected onto the hard prior on size and ellipticity (see project_Prior), so that every object remains within the prior.
+
+    Requires:
+    x0: [nGal, nP] initial guesses for the parameters labelled pLabels
+    pLabels: labels of the fit parameters
+    images: [nGal, nPix] flattened images
+    setParams: model dictionary, giving the parameters not fit (shared by all objects)
+    noise: [nGal] pixel noise (std) for each object, or scalar. If None, setParams['noise'] is used
+    xtol, ftol: relative tolerance on the step, and on the reduction in chi^2 for an accepted, weakly damped step. An object has converged when either is satisfied
+    maxIter: maximum number of iterations
+
+    Returns:
+    maxima: [nGal, nP] ML estimates
+    fisher: [nGal, nP, nP] Fisher matrix J^T J at the ML estimate of each object
+    converged: [nGal] boolean, True where the search converged within maxIter iterations. False where it did not, including where no improving step could be found before the damping reached 1e12
+    """
+    import model_Production as modPro
+    from surface_Brightness_Profiles import gaussian_SBProfile_CXX
+    import generalManipulation
+
+    pLabels = list(generalManipulation.makeIterableList(pLabels))
+    nP = len(pLabels)
+    images = np.asarray(images, dtype = float).reshape(np.shape(images)[0], -1)
+    nGal = images.shape[0]
+    x = np.array(x0, dtype = float).reshape(nGal, nP)
+    if(noise is None):
+        noise = setParams['noise']
+    invVar = np.ones(nGal)/np.power(noise, 2.)
+
+    x = project_Prior(x, pLabels, setParams)[0]
+
+    def evaluate(p):
+        ## Residual and Jacobian (model derivatives) for a set of objects
+        bundle = modPro.get_Pixelised_Model_Bundle_Batch(p, setParams, pLabels, order = 1, sbProfileFunc = gaussian_SBProfile_CXX)
+        bundle = bundle.reshape(bundle.shape[0], bundle.shape[1], -1)
+        return bundle[:,0], bundle[:,1:]
+
+    model, modDer = evaluate(x)
+    chi2 = invVar*np.power(images-model, 2.).sum(axis = 1)
+    damping = 1.e-3*np.ones(nGal); dampingFactor = 2.*np.ones(nGal)
+    active = np.ones(nGal, dtype = bool); converged = np.zeros(nGal, dtype = bool)
+    identity = np.identity(nP)
+
+    def solve_Damped(A, g, damping):
+        ## Damped normal equations (J^T J + lambda diag(J^T J)) dx = J^T r, for a set of objects
+        ADamped = A*(identity[None,:,:]*(1.+damping[:,None,None]) + (1.-identity[None,:,:]))
+        ## Singular systems (e.g. a parameter with no effect on the model) are not stepped
+        singular = np.abs(np.linalg.det(ADamped)) <= 1.e-300
+        ADamped[singular] = identity
+        step = np.linalg.solve(ADamped, g[:,:,None])[:,:,0]
+        step[singular] = 0.
+        return step
+
+    for it in range(maxIter):
+        index = np.where(active)[0]
+        if(index.shape[0] == 0):
+            break
+
+        A = np.einsum('npk,nqk->npq', modDer[index], modDer[index])
+        g = np.einsum('npk,nk->np', modDer[index], images[index]-model[index])
+        step = solve_Damped(A, g, damping[index])
+        xTrial, disc, excess, dExcess = project_Prior(x[index] + step, pLabels, setParams)
+
+        ## Where the step leaves the ellipticity prior from a point already on its boundary, it is retaken along the boundary: the outward (radial) direction u is removed from the normal equations, so that objects whose ML point lies on the boundary converge along it
+        out = np.where(excess[:,0] > 0.)[0]
+        if(out.shape[0] > 0):
+            out = out[project_Prior(x[index[out]] + 1.e-8*dExcess[out,0], pLabels, setParams)[2][:,0] > 0.]
+        if(out.shape[0] > 0):
+            u = dExcess[out,0]
+            outward = u[:,:,None]*u[:,None,:]
+            tangent = identity[None,:,:] - outward
+            ATangent = np.matmul(tangent, np.matmul(A[out], tangent)) + np.einsum('npp->n', A[out])[:,None,None]*outward
+            step = solve_Damped(ATangent, np.einsum('npq,nq->np', tangent, g[out]), damping[index[out]])
+            xTrial[out] = project_Prior(x[index[out]] + step, pLabels, setParams)[0]
+        mTrial, dTrial = evaluate(xTrial)
+        chi2Trial = invVar[index]*np.power(images[index]-mTrial, 2.).sum(axis = 1)
+
+        ## Ratio of actual to predicted reduction in chi^2 sets the damping for the next step (Nielsen 1999)
+        step = xTrial - x[index]
+        predicted = invVar[index]*(step*(g + damping[index,None]*np.diagonal(A, axis1 = 1, axis2 = 2)*step)).sum(axis = 1)
+        ## Clipped, as the predicted reduction may reach its floor, and only the range |gain| <~ 1 affects the damping update
+        gain = np.clip((chi2[index] - chi2Trial)/np.maximum(predicted, 1.e-300), -1.e3, 1.e3)
+        accept = chi2Trial <= chi2[index]
+        small = (np.abs(step) <= xtol*(np.abs(x[index]) + xtol)).all(axis = 1)
+        ## The chi^2 reduction is only a good test of convergence where the step is close to the Gauss-Newton step (weak damping)
+        small = np.logical_or(small, accept & (chi2[index] - chi2Trial <= ftol*chi2[index]) & (damping[index] <= 1.e-2))
+
+        aIndex = index[accept]; rIndex = index[~accept]
+        x[aIndex] = xTrial[accept]; model[aIndex] = mTrial[accept]; modDer[aIndex] = dTrial[accept]; chi2[aIndex] = chi2Trial[accept]
+        damping[aIndex] = np.maximum(damping[aIndex]*np.maximum(1./3., 1.-np.power(2.*gain[accept]-1., 3.)), 1.e-12); dampingFactor[aIndex] = 2.
+        damping[rIndex] *= dampingFactor[rIndex]; dampingFactor[rIndex] *= 2.
+
+        ## Converged where the step is negligible. The search is abandoned (not converged) where no improving step can be found
+        active[index[small]] = False; converged[index[small]] = True
+        active[index[damping[index] > 1.e12]] = False
+
+    fisher = invVar[:,None,None]*np.einsum('npk,nqk->npq', modDer, modDer)
+
+    return x, fisher, converged
+
+def find_ML_Estimator_Catalogue(images, fitParams, setParams = None, initialGuess = None, noise = None, biasCorrect = 0, error = 'Fisher', xtol = 1.e-8, ftol = 1.e-8, maxIter = 100, chunkSize = 1000):
+    """
+    Catalogue-level equivalent of find_ML_Estimator: fits all of nGal postage stamps, which share a base model (setParams), using a batched Levenberg-Marquardt search (least_Squares_ML_Search_Batch). This replaces a call of find_ML_Estimator per object. The objects are processed in chunks of chunkSize, to limit the memory used in storing the model Jacobians.
+
+    Requires:
+    -- images: [nGal, nPix] array of flattened postage stamps
+    -- fitParams: labels of the parameters fit
+    -- setParams: model dictionary defining the fixed parameters, and the initial guesses where initialGuess is None. If None, the default model dictionary is used.
+    -- initialGuess: [nGal, nP] (or [nP], shared by all objects) initial guesses for fitParams. If None, these are taken from setParams.
+    -- noise: [nGal] pixel noise (std) for each object, or scalar. If None, setParams['noise'] is used. May also be a noise estimation function (e.g. estimate_Noise), in which case the noise of each object is estimated from its postage stamp, as noise(stamps, centroid, batch = True).
+    -- biasCorrect: If 1, the first order analytic noise bias is evaluated at the ML point of each object and subtracted. The bias of all objects is evaluated together (see measure_Bias.analytic_GaussianLikelihood_Bias_Batch).
+    -- error: If `Fisher', the marginalised Fisher error is returned, evaluated from J^T J at the ML point. If None, no error is returned.
+    -- xtol, ftol, maxIter: convergence tolerances and maximum number of iterations, as least_Squares_ML_Search_Batch.
+    -- chunkSize: number of objects fit together.
+
+    Returns:
+    Returned: list, containing (in order) the [nGal, nP] ML estimates, the bias corrected estimates (if biasCorrect != 0) and the Fisher errors (if error is not None), as find_ML_Estimator.
+    """
+    import model_Production as modPro
+    import measure_Bias as mBias
+    from generalManipulation import makeIterableList
+
+    fitParams = list(makeIterableList(fitParams))
+    nP = len(fitParams)
+    images = np.asarray(images, dtype = float)
+    if(images.ndim != 2):
+        raise ValueError('find_ML_Estimator_Catalogue - images must be a [nGal, nPix] array of flattened postage stamps')
+    nGal = images.shape[0]
+
+    modelParams = modPro.default_ModelParameter_Dictionary()
+    if(setParams is not None):
+        modPro.update_Dictionary(modelParams, setParams)
+    if(images.shape[1] != np.array(modelParams['stamp_size']).prod()):
+        raise ValueError('find_ML_Estimator_Catalogue - Flattened image length does not correspond to model parameter dimensions')
+
+    if(initialGuess is None):
+        initialGuess = modPro.unpack_Dictionary(modelParams, requested_keys = fitParams)
+    x0 = np.ones((nGal, nP))*np.array(initialGuess, dtype = float).reshape(-1, nP)
+
+    if(noise is None):
+        noise = modelParams['noise']
+    elif(callable(noise)):
+        noise = noise(images.reshape((nGal,)+tuple(modelParams['stamp_size'])), modelParams['centroid'], batch = True)
+    noise = np.ones(nGal)*noise
+
+    if(error is not None and error.lower() != 'fisher'):
+        raise ValueError('find_ML_Estimator_Catalogue - Only Fisher errors are supported:'+str(error))
+    if(biasCorrect not in [0, 1]):
+        raise ValueError('find_ML_Estimator_Catalogue - biasCorrect(ion) value entered is not applicable:'+ str(biasCorrect))
+
+    maxima = np.zeros((nGal, nP)); err = np.zeros((nGal, nP)); converged = np.zeros(nGal, dtype = bool)
+    for c in range(0, nGal, chunkSize):
+        cSlice = slice(c, min(c+chunkSize, nGal))
+        maxima[cSlice], fisher, converged[cSlice] = least_Squares_ML_Search_Batch(x0[cSlice], fitParams, images[cSlice], modelParams, noise = noise[cSlice], xtol = xtol, ftol = ftol, maxIter = maxIter)
+        if(error is not None):
+            ## Marginalised Fisher error, from the eigen-decomposition of the (symmetric) Fisher matrix. Fisher matrices which are not (numerically) positive definite give an infinite error
+            diag = np.inf*np.ones((fisher.shape[0], nP))
+            finite = np.isfinite(fisher).all(axis = 2).all(axis = 1)
+            eigVal, eigVec = np.linalg.eigh(fisher[finite])
+            positive = (eigVal > nP*np.finfo(float).eps*np.abs(eigVal).max(axis = 1)[:,None]).all(axis = 1)
+            fIndex = np.flatnonzero(finite)[positive]
+            diag[fIndex] = (np.power(eigVec[positive], 2.)/eigVal[positive][:,None,:]).sum(axis = 2)
+            err[cSlice] = np.sqrt(diag)
+
+    if(np.isnan(maxima).sum() > 0):
+        raise ValueError('find_ML_Estimator_Catalogue - FATAL - NaNs found in maxima')
+    if(verbose and not converged.all()):
+        print 'find_ML_Estimator_Catalogue - ', (~converged).sum(), ' of ', nGal, ' objects did not converge'
+
+    Returned = [maxima]
+    if(biasCorrect == 1):
+        bc_maxima = maxima - mBias.analytic_GaussianLikelihood_Bias_Batch(maxima, fitParams, modelParams, noise = noise, chunkSize = chunkSize)
+        Returned.append(bc_maxima)
+    if(error is not None):
+        Returned.append(err)
+
+    return Returned
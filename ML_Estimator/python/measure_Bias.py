@@ -11,10 +11,9 @@ debug = False
 import numpy as np
 from copy import deepcopy
 
-def analytic_GaussianLikelihood_Bias(parameter_value, parameter_label, imageParams, order = 1, diffType = 'analytic'):
+def analytic_GaussianLikelihood_Bias(parameter_value, parameter_label, imageParams, order = 1, diffType = 'analytic', executor = None):
     import model_Production as modPro
     import surface_Brightness_Profiles as SBPro
-    from derivatives import finite_difference_derivative
     """
     Returns the theoretically motivated ML estimator bias due to finite data sample (noise bias) to first order (by default). First instance only calculates the linear bias. This is only applicable to the case where the estimate is taken as the ML point of a Gaussian Likelihood function, or minimising chi^2, and where the noise variance is uniform across the stamp.
 
@@ -32,7 +31,8 @@ def analytic_GaussianLikelihood_Bias(parameter_value, parameter_label, imagePara
     -- parameter_label: labels the parameter being varied. Must be of the form of the default model parameter dictionary.
     -- imageParams: parameters which define the image. Parameters which are not being varied must be set to default values. `noise` must be accurate.
     -- order: ONLY FIRST ORDER IS SUPPORTED. Defines to what order the bias is returned. Default is first order.
-    -- diffType: Accepted values are `analytic` or `ana`, and `numerical` and `num` (case-insensitive). If the former, then anaylic (exact) derivatives are used for the model as defined in modPro.differentiate_Pixelised_Model_Analytic in model_Production.py. If the latter, then finite difference is used.
+    -- diffType: Accepted values are `analytic` or `ana`, and `numerical` and `num` (case-insensitive). If the former, then anaylic (exact) derivatives are used for the model as defined in modPro.differentiate_Pixelised_Model_Analytic in model_Production.py. If the latter, then finite difference is used (modPro.differentiate_Pixelised_Model_Numerical), which is only supported for a single parameter.
+    -- executor: pool over which the model evaluations of the finite difference derivative are produced concurrently (see derivatives.finite_difference_derivative). Only used where diffType is numeric. If None, and the model can be rendered analytically, the models at each finite interval are instead produced in a single vectorised call.
 
     Side Effects: None
     
@@ -48,9 +48,19 @@ def analytic_GaussianLikelihood_Bias(parameter_value, parameter_label, imagePara
     ##-- Get the derivatives of the pixelised, noise-free model
     if diffType.lower() == 'numeric' or diffType.lower() == 'num':
         ##Get fully numeric derivative. This takes the derivative of the image as a whole: therefore note that this is likely to be more problematic in ensuring that derivative has converged. NOTE: 
-        diffIm = finite_difference_derivative(modPro.get_Pixelised_Model_wrapFunction, pVal, args = [iParams, pLab, 1, {'sbProfileFunc':SBPro.gaussian_SBProfile_Weave, 'noiseType':None, 'outputImage':False}], n = [1,2], dx = [0.001, 0.001], order = 5, eps = 1.e-3, convergenceType = 'sum', maxEval = 100)
+        if(len(pVal) != 1):
+            raise ValueError('analytic_GaussianLikelihood_Bias - Numerical derivatives are only supported for a single parameter:'+str(pLab))
+        batch = (executor is None and modPro.analytic_Render_Supported(iParams))
+        diffIm = modPro.differentiate_Pixelised_Model_Numerical(iParams, np.array(pVal, dtype = float), pLab, n = [1,2], order = 5, interval = [0.001, 0.001], eps = 1.e-3, maxEval = 100, executor = executor, batch = batch)
+        if(len(diffIm) != 2):
+            raise RuntimeError('analytic_GaussianLikelihood_Bias - Numerical derivative failed to converge')
+        ## Shape as the analytic derivatives: [nPar, nPix, nPix] and [nPar, nPar, nPix, nPix]
+        diffIm = [diffIm[0].reshape((1,)+diffIm[0].shape), diffIm[1].reshape((1,1)+diffIm[1].shape)]
     elif diffType.lower() == 'analytic' or diffType.lower() == 'ana':
-        diffIm = [modPro.differentiate_Pixelised_Model_Analytic(iParams, pVal, pLab, 1, permute = True), modPro.differentiate_Pixelised_Model_Analytic(iParams, pVal, pLab, 2, permute = True)]
+        ## First and second derivatives are evaluated together as a single model bundle
+        modPro.set_modelParameter(iParams, pLab, pVal)
+        model, der1, der2 = modPro.unpack_Model_Bundle(modPro.get_Pixelised_Model_Bundle(iParams, pLab, sbProfileFunc = SBPro.gaussian_SBProfile_CXX), len(pVal))
+        diffIm = [der1, der2]
     else:
         raise RuntimeError('analytic_GaussianLikelihood_Bias - Invalid differential type (diffType) entered:'+diffType)
 
@@ -91,6 +101,40 @@ def analytic_GaussianLikelihood_Bias(parameter_value, parameter_label, imagePara
     return bias
 
 
+def analytic_GaussianLikelihood_Bias_byNoise(parameter_value, parameter_label, imageParams, noise = None, SNR = None, diffType = 'analytic'):
+    """
+    Returns the first order analytic bias (see analytic_GaussianLikelihood_Bias) at a single point in parameter space, for a vector of noise levels or SNR values. The bias depends on the noise only through an overall factor of noise^2 (I, J and K each scale as 1/noise^2, and the bias as I^-1 (K/2 + J)), so the model derivatives and bias components are evaluated once, at unit noise, and rescaled for each noise level.
+
+    Requires:
+    -- parameter_value, parameter_label, diffType: as analytic_GaussianLikelihood_Bias
+    -- imageParams: parameters which define the image. The `noise' parameter is not used
+    -- noise: **Standard Deviation** of the pixel noise: scalar or [nNoise] array
+    -- SNR: Signal-to-noise (as defined in model_Production.SNR_Mapping): scalar or [nNoise] array. One of noise and SNR, but not both, must be passed.
+
+    Returns:
+    -- bias: [nNoise, nPar] first order bias for each noise level
+    -- noise: [nNoise] noise standard deviation for each bias (as set by SNR where SNR is passed)
+    """
+    import model_Production as modPro
+    import surface_Brightness_Profiles as SBPro
+
+    if((noise is None) == (SNR is None)):
+        raise ValueError('analytic_GaussianLikelihood_Bias_byNoise - One of noise or SNR (and not both) must be entered')
+
+    iParams = deepcopy(imageParams)
+    modPro.set_modelParameter(iParams, parameter_label, parameter_value)
+    iParams['noise'] = 1.
+
+    unitBias = np.ravel(analytic_GaussianLikelihood_Bias(parameter_value, parameter_label, iParams, diffType = diffType))
+
+    if(SNR is not None):
+        ## Noise is set by the SNR of the noise-free model at this point in parameter space
+        model, disc = modPro.user_get_Pixelised_Model(iParams, noiseType = None, sbProfileFunc = SBPro.gaussian_SBProfile_CXX)
+        noise = modPro.SNR_Mapping(model, SNR = np.asarray(SNR, dtype = float))
+    noise = np.atleast_1d(np.asarray(noise, dtype = float))
+
+    return np.power(noise, 2.)[:,None]*unitBias[None,:], noise
+
 def bias_components(parameter_derivatives, noise):
     """
     Returns the components needed to calculate the parameter bias (normally I <2D ndarray>[nPar,nPar], J <3D ndarray>, K <3D ndarray> in our notation, and also in Wikipedia defintition)
@@ -100,38 +144,100 @@ def bias_components(parameter_derivatives, noise):
     -- parameter_derivatives: 2-element list, where [0] contains a list of the first derivatives of the pixelised image across all parameters, and [1] contains the array of all permutations of second order derivatives of the pixelised image over all input parameters.
     -- noise: **Standard Deviation** of the noise on each pixel, assumed Gaussian around the underlying SB Profile.
 
-    Further Work:
-    -- Uses three-nested-loop. Investigation into how it could be made quicker (e.g. C++ background, or intelligent restructuring)
+    Single galaxy case of bias_components_Batch.
     """
+    I, K, J = bias_components_Batch(np.asarray(parameter_derivatives[0])[None], np.asarray(parameter_derivatives[1])[None], noise)
+    return I[0], K[0], J[0]
 
-    nPar = len(parameter_derivatives[0])
-
-    ##Copy input parameter derivatives list for ease of notation
-    pDer = list(parameter_derivatives)
+def bias_components_Batch(der1, der2, noise):
+    """
+    Batched version of bias_components: returns the bias components I, K and J for each of nGal galaxies. The derivatives are flattened over pixels, and the components are evaluated as matrix products over the pixel axis, so that there is no loop over parameters. With D the [nPar, nPix] first derivatives and H the [nPar, nPar, nPix] second derivatives, and T[a,b,c] = sum_pix D[a] H[b,c]:
+    -- I[i,j] = sum_pix D[i] D[j]
+    -- J[i,j,k] = T[j,i,k]
+    -- K[i,j,k] = T[k,i,j] + T[j,i,k] + T[i,j,k] (using the symmetry of H)
+    each divided by nPix*noise^2 (K by -nPix*noise^2).
 
-    s2 = noise*noise
+    Requires:
+    -- der1: [nGal, nPar, nPix, nPix] first derivatives of the pixelised image of each galaxy (or any pixel shape)
+    -- der2: [nGal, nPar, nPar, nPix, nPix] (symmetric) second derivatives
+    -- noise: **Standard Deviation** of the pixel noise: scalar, or [nGal]
 
-    I = np.zeros((nPar, nPar))
-    K = np.zeros((nPar, nPar, nPar))
-    J = np.zeros(K.shape)
+    Returns:
+    -- I: [nGal, nPar, nPar]
+    -- K, J: [nGal, nPar, nPar, nPar]
+    """
+    der1 = np.asarray(der1, dtype = float); der2 = np.asarray(der2, dtype = float)
+    nGal, nPar = der1.shape[:2]
+    nPix = np.prod(der1.shape[2:])
 
-    nPix = np.prod(pDer[0][0].shape)
+    D = der1.reshape(nGal, nPar, nPix)
 
-    ##Could this be made quicker: symmetry?, loop removal?
-    for i in range(nPar):
-        for j in range(nPar):
-            I[i,j] = (pDer[0][i]*pDer[0][j]).sum()
-            for k in range(nPar):
-                K[i,j,k] = (pDer[0][k]*pDer[1][i,j] + pDer[0][j]*pDer[1][i,k] + pDer[0][i]*pDer[1][j,k]).sum()
-                J[i,j,k] = (pDer[0][j]*pDer[1][i,k]).sum()
+    ## Contractions over pixels are (BLAS) matrix products
+    I = np.matmul(D, np.swapaxes(D, 1, 2))
+    T = np.matmul(D, np.swapaxes(der2.reshape(nGal, nPar*nPar, nPix), 1, 2)).reshape(nGal, nPar, nPar, nPar)
+    J = np.transpose(T, (0,2,1,3))
+    K = np.transpose(T, (0,2,3,1)) + J + T
 
     ###Add prefactors
-    I /= (nPix*s2)
-    K /= (-1.*nPix*s2)
-    J /= (nPix*s2)
+    s2 = (np.ones(nGal)*noise)**2.
+    norm = (nPix*s2)
+    I = I/norm[:,None,None]
+    K = K/(-1.*norm[:,None,None,None])
+    J = J/norm[:,None,None,None]
 
     return I, K, J
 
+def analytic_GaussianLikelihood_Bias_Batch(parameter_values, parameter_label, imageParams, noise = None, chunkSize = 1000, renderChunkSize = 8):
+    """
+    Batched version of analytic_GaussianLikelihood_Bias (analytic derivatives only): returns the first order noise bias at each of nGal points in parameter space, e.g. the ML points of a catalogue of galaxies. The model bundles of each chunk of galaxies are produced together (see model_Production.get_Pixelised_Model_Bundle_Batch), and the bias components evaluated by bias_components_Batch.
+
+    Requires:
+    -- parameter_values: [nGal, nPar] parameter values, with columns labelled by parameter_label
+    -- parameter_label: labels of the nPar parameters. Must be of the form of the default model parameter dictionary.
+    -- imageParams: parameters which define the image, for those parameters not labelled by parameter_label
+    -- noise: **Standard Deviation** of the pixel noise: scalar or [nGal]. If None, imageParams[`noise'] is used.
+    -- chunkSize: maximum number of galaxies evaluated together
+    -- renderChunkSize: maximum number of model bundles rendered together. Rendering of second order bundles is limited by memory bandwidth, and is fastest in small chunks
+
+    Returns:
+    -- bias: [nGal, nPar]. NaN for galaxies where I is singular
+    """
+    import model_Production as modPro
+    import surface_Brightness_Profiles as SBPro
+    from generalManipulation import makeIterableList
+
+    pLab = list(makeIterableList(parameter_label))
+    nPar = len(pLab)
+    pVal = np.array(parameter_values, dtype = float).reshape(-1, nPar)
+    nGal = pVal.shape[0]
+
+    if(noise is None):
+        noise = imageParams['noise']
+    noise = np.ones(nGal)*noise
+
+    bias = np.zeros((nGal, nPar))
+    for c in range(0, nGal, chunkSize):
+        cSlice = slice(c, min(c+chunkSize, nGal))
+
+        bundles = modPro.get_Pixelised_Model_Bundle_Batch(pVal[cSlice], imageParams, pLab, order = 2, chunkSize = renderChunkSize, sbProfileFunc = SBPro.gaussian_SBProfile_CXX)
+        ## unpack_Model_Bundle is applied with the galaxy axis after the bundle terms, and then moved to the front
+        model, der1, der2 = modPro.unpack_Model_Bundle(np.swapaxes(bundles, 0, 1), nPar)
+        der1 = np.swapaxes(der1, 0, 1); der2 = np.moveaxis(der2, 2, 0)
+        nPix = np.prod(der1.shape[2:])
+
+        I, K, J = bias_components_Batch(der1, der2, noise[cSlice])
+
+        ## bias = I^-1 . (I^-1 : (K/2 + J)) / nPix, as analytic_GaussianLikelihood_Bias. Singular I give a NaN bias
+        Iin = np.nan*np.ones(I.shape)
+        invertible = np.abs(np.linalg.det(I)) > 0.
+        Iin[invertible] = np.linalg.inv(I[invertible])
+
+        KJ = 0.5*K + J
+        IKJ = np.einsum('nab,niab->ni', Iin, KJ)
+        bias[cSlice] = np.einsum('nsi,ni->ns', Iin, IKJ)/nPix
+
+    return bias
+
 def return_numerical_ML_Bias(parameter_value, parameter_label, imageParams, order = 1, maxEval = 1000):
     import model_Production as modPro
     """
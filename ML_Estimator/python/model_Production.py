@@ -80,9 +80,9 @@ def unpack_Dictionary(dic, requested_keys = None):
     ## Set SB Keys
     rescount = 0; res = ['F']*len(requested_keys)
     for k in requested_keys:
-        if((np.array(dic['SB'].keys()) == k).sum() > 0): #SB Parameter
+        if(k in dic['SB']): #SB Parameter
             res[rescount] = dic['SB'][k]; rescount += 1
-        elif((np.array(dic['PSF'].keys()) == k).sum() > 0): #PSF Parameter
+        elif(k in dic['PSF']): #PSF Parameter
             res[rescount] = dic['PSF'][k]; rescount += 1
         #elif( (np.array(dic.keys()) == k).sum() > 0): #Other Parameter
         #    res[rescount] = dic[k]; rescount += 1
@@ -116,8 +116,59 @@ def update_Dictionary(d, u):
     return d
 
 
+## Map between each parameter label and the sub-dictionary (SB or PSF) in which it is stored in the default model dictionary. Constructed once, on first use (see get_Parameter_Groups)
+_parameterGroups = None
+
+def get_Parameter_Groups():
+    """
+    Returns a dictionary mapping each SB and PSF parameter label of the default model dictionary to the sub-dictionary (`SB' or `PSF') holding it. This is constructed once, so that parameters can be located without reconstructing the default dictionary on every call.
+    """
+    global _parameterGroups
+    if(_parameterGroups is None):
+        Params = default_ModelParameter_Dictionary()
+        groups = dict([[k, 'SB'] for k in Params['SB'].keys()])
+        ## PSF takes precedence, as in seperate_Keys_byModel
+        groups.update(dict([[k, 'PSF'] for k in Params['PSF'].keys()]))
+        _parameterGroups = groups
+    return _parameterGroups
+
+def copy_ModelParameters(Params):
+    """
+    Returns a copy of the model dictionary Params which can be modified (through set_modelParameter, or by setting any key of Params, Params[`SB'] or Params[`PSF']) without affecting Params. The SB and PSF sub-dictionaries are copied, but their values are shared, as these are never modified in place. This is much cheaper than deepcopy, and is used wherever a model dictionary is copied per likelihood evaluation.
+    """
+    iParams = dict(Params)
+    for sub in ['SB', 'PSF']:
+        if(sub in iParams):
+            iParams[sub] = dict(iParams[sub])
+    return iParams
+
+def compile_ModelParameters(Params, labels):
+    """
+    Compiles the locations of the parameters labelled by labels within the model dictionary Params, so that they can be repeatedly set in place (set_Compiled_Parameters) without locating each label on every call. The label to location map is constructed once (e.g. once per fit), and the values are then set from a flat parameter array.
+
+    Requires:
+    -- Params: model dictionary, which will be modified by set_Compiled_Parameters
+    -- labels: list of SB and PSF parameter labels
+
+    Returns:
+    -- compiled: list of [sub-dictionary, key] for each label, in labels order
+    """
+    groups = get_Parameter_Groups()
+    compiled = []
+    for l in labels:
+        if(l not in groups):
+            raise ValueError('compile_ModelParameters - Parameter not recognised:'+str(l))
+        compiled.append([Params[groups[l]], l])
+    return compiled
+
+def set_Compiled_Parameters(compiled, values):
+    """
+    Sets, in place, the parameters compiled by compile_ModelParameters to values (flat list or array, in the compiled labels order).
+    """
+    for c, v in zip(compiled, values):
+        c[0][c[1]] = v
+
 def seperate_Keys_byModel(der, vals = None, refParam = None):
-    from copy import deepcopy
     """
     Takes as input a list which contains the labels of all the parameters considered, and seperates into two lists corresponding to SurfaceBrightness (SB), and PSF models (PSF)
     Ignores *others* for now (anything not PSF or SB)
@@ -130,37 +181,25 @@ def seperate_Keys_byModel(der, vals = None, refParam = None):
 
     if(refParam is None):
         ##Use default dictionary
-        Params = default_ModelParameter_Dictionary()
+        groups = get_Parameter_Groups()
+        refPSF = [k for k in groups if groups[k] == 'PSF']
+        refSB = [k for k in groups if groups[k] == 'SB']
     else:
-        Params = deepcopy(refParam)
+        refPSF = refParam['PSF']
+        refSB = refParam['SB']
 
-    ##Get Reference PSF Keys
-    refPSF = np.array(Params['PSF'].keys())
-    ##Get Reference SB Keys
-    refSB = np.array(Params['SB'].keys())
-
-    PSFDer, SBDer = ['F']*len(der), ['F']*len(der)
-    PSFVal, SBVal = ['F']*len(der), ['F']*len(der)
-    PSFcount, SBcount = 0, 0
+    PSFDer, SBDer = [], []
+    PSFVal, SBVal = [], []
     for dd in range(len(der)):
-        if( sum((refPSF == der[dd])) > 0):
+        if(der[dd] in refPSF):
             ##der is a PSF parameter
-            PSFDer[PSFcount] = der[dd]
+            PSFDer.append(der[dd])
             if(vals is not None):
-                PSFVal[PSFcount] = vals[dd]
-            PSFcount += 1
-        elif( sum((refSB == der[dd])) > 0):
-            SBDer[SBcount] = der[dd]
+                PSFVal.append(vals[dd])
+        elif(der[dd] in refSB):
+            SBDer.append(der[dd])
             if(vals is not None):
-                SBVal[SBcount] = vals[dd]
-            SBcount += 1
-
-    ##Isolate those subsets of der which have been assigned
-    PSFDer = PSFDer[:PSFcount]
-    SBDer = SBDer[:SBcount]
-    PSFVal = PSFVal[:PSFcount]
-    SBVal = SBVal[:SBcount]
-    
+                SBVal.append(vals[dd])
 
     if(vals is not None):
         return SBDer, PSFDer, SBVal, PSFVal
@@ -169,7 +208,6 @@ def seperate_Keys_byModel(der, vals = None, refParam = None):
 
 
 def set_modelParameter(Dict, param_labels, param_values):
-    from copy import deepcopy
     from generalManipulation import isIterableList, makeIterableList
     """
     Sets model Parameters (as defined above) by input lists. As opposed to update_Dictionary, this routine allows for the keys to be put in without defining which sub-dictionary they belong to, as seperate_Keys_byModel seperates out into sub-dictionaries specified in the default declaration
@@ -188,13 +226,11 @@ def set_modelParameter(Dict, param_labels, param_values):
     if(len(iparam_labels) != len(iparam_values)):
         raise RuntimeError('set_modelParameter - labels and lists not conformal')
 
-    ## Seperate out into respective parts (SB/PSF)
-    SBLab, PSFLab, SBVals, PSFVals = seperate_Keys_byModel(iparam_labels, iparam_values, refParam = default_ModelParameter_Dictionary())
-
-    for i, s in enumerate(SBLab):
-        Dict['SB'][s] = SBVals[i]
-    for i, s in enumerate(PSFLab):
-        Dict['SB'][s] = PSFVals[i]
+    ## Set in respective parts (SB/PSF), as identified in the default dictionary. Labels which are in neither are ignored
+    groups = get_Parameter_Groups()
+    for i, s in enumerate(iparam_labels):
+        if(s in groups):
+            Dict[groups[s]][s] = iparam_values[i]
 
 ##-------------------------Model Production-----------------------------------------##
 def get_Pixelised_Model_wrapFunction(x, Params, xKey, returnOrder = 1, **kwargs):
@@ -239,13 +275,93 @@ def get_Pixelised_Model_wrapFunction(x, Params, xKey, returnOrder = 1, **kwargs)
 
 #    image, Params =
     result = user_get_Pixelised_Model(Params, **kwargs)
-    image = result[0]; Params = deepcopy(result[1])
+    image = result[0]; Params = copy_ModelParameters(result[1])
 
     if returnOrder == 1:
         return image
     else:
         return image, Params
 
+def get_Pixelised_Model_Batch(values, Params, labels, chunkSize = 500, **kwargs):
+    """
+    Batched version of get_Pixelised_Model_wrapFunction: returns the stack of model images produced according to Params, where the parameters labelled by `labels' are set to each row of values in turn. Where the model can be produced analytically (see analytic_Render_Supported), all models in a chunk are evaluated in a single vectorised call of gaussian_Pixelised_Model_Analytic, otherwise user_get_Pixelised_Model is called for each parameter set.
+
+    Requires:
+    --values: [N, nParam] array of parameter values. Where a single parameter is varied, a 1D array of length N is accepted.
+    --Params: model dictionary used to specify the fixed model parameters. Not modified.
+    --labels: list of nParam labels, corresponding to the columns of values. Must be defined as in default dictionary.
+    --chunkSize: maximum number of models evaluated together in the vectorised case. Limits the memory used, as each model requires [nQuad*stamp_size]^2 sized intermediate arrays.
+    --kwargs: arguments passed to user_get_Pixelised_Model (e.g. der, sbProfileFunc, renderMethod). noiseType and inputImage are not supported in the vectorised case.
+
+    Returns:
+    -- images: [N, nPix, nPix] array of model images, ordered as the rows of values. As in user_get_Pixelised_Model, a model of zeros is returned for parameter sets which are unphysical (|e| >= 1 or size <= 0).
+    """
+    from generalManipulation import makeIterableList
+
+    labels = makeIterableList(labels)
+    values = np.array(values, dtype = float)
+    if(values.ndim == 1):
+        if(len(labels) == 1):
+            values = values.reshape(-1,1)
+        else:
+            values = values.reshape(1,-1)
+    if(values.ndim != 2 or values.shape[1] != len(labels)):
+        raise ValueError('get_Pixelised_Model_Batch - values must be [N, nParam], with nParam labels:'+str(labels))
+
+    nModel = values.shape[0]
+    nPix = tuple(np.array(Params['stamp_size']).astype(int))
+    images = np.zeros((nModel,)+nPix)
+
+    ## Assign values to SB and PSF sub-dictionaries. Labels not in either are not varied, as in set_modelParameter
+    group = []
+    for l in labels:
+        if(l in Params['SB']):
+            group.append('SB')
+        elif(l in Params['PSF']):
+            group.append('PSF')
+        else:
+            group.append(None)
+
+    def column(sub, key):
+        ## Values taken by parameter `key' across the batch
+        for i, l in enumerate(labels):
+            if(group[i] == sub and l == key):
+                return values[:,i]
+        return np.ones(nModel)*Params[sub][key]
+
+    ## Unphysical models are left as zero
+    e1, e2, size = column('SB', 'e1'), column('SB', 'e2'), column('SB', 'size')
+    valid = np.logical_and(e1*e1 + e2*e2 < 1., size > 0.)
+
+    ## Decide whether the vectorised analytic renderer can be used
+    renderMethod = kwargs.get('renderMethod', 'auto')
+    vectorise = kwargs.get('inputImage', None) is None and kwargs.get('noiseType', None) is None
+    if(renderMethod == 'auto'):
+        vectorise = vectorise and analytic_Render_Supported(Params, kwargs.get('sbProfileFunc', None))
+    else:
+        vectorise = vectorise and renderMethod == 'analytic'
+    vectorise = vectorise and all([l in _SBShapeLabels+_PSFShapeLabels+['flux', 'bg'] for l in labels])
+
+    index = np.where(valid)[0]
+    if(vectorise):
+        anaArgs = dict([[k, kwargs[k]] for k in kwargs if k in ['der', 'nQuad']])
+        bParams = copy_ModelParameters(Params)
+        for c in range(0, index.shape[0], chunkSize):
+            cIndex = index[c:c+chunkSize]
+            for i, l in enumerate(labels):
+                bParams[group[i]][l] = values[cIndex,i]
+            images[cIndex] = gaussian_Pixelised_Model_Analytic(bParams, **anaArgs)
+    else:
+        ## Parameter locations are compiled once, and set in place for each model
+        iParams = copy_ModelParameters(Params)
+        cols = [i for i in range(len(labels)) if group[i] is not None]
+        compiled = compile_ModelParameters(iParams, [labels[i] for i in cols])
+        for n in index:
+            set_Compiled_Parameters(compiled, values[n, cols])
+            images[n] = user_get_Pixelised_Model(iParams, **kwargs)[0]
+
+    return images
+
 
 def SNR_Mapping(model, var = None, SNR = None):
     """
@@ -260,39 +376,44 @@ def SNR_Mapping(model, var = None, SNR = None):
 
 ### ---------------------------------------------------------------- Model Production - Lookup Table --------------------------------------------------------------------------------------------------------- ###
 
-def get_Model_Lookup(setParams, pLabel, pRange, dP, **modelFuncArgs):
+## Version of the on-disk lookup table format: cached tables with a different version are rebuilt
+lookupFileVersion = 1
+
+def get_Model_Lookup(setParams, pLabel, pRange, dP, cacheDirectory = None, interp = None, **modelFuncArgs):
     """
-    Create a lookup table for the model creation - Useful only for the 1D or 2D case, where this corresponds to a significant decrease in run-time (or any case where range/dP < nEval*nGal [nEval - function evaluations to get ML point; nGal - number of ML points] 
+    Create a lookup table for the model creation - Useful where this corresponds to a significant decrease in run-time (any case where range/dP < nEval*nGal [nEval - function evaluations to get ML point; nGal - number of ML points]. The table is a regular grid over any number of parameters (e.g. size, e1, e2, flux), stored as a single contiguous ndarray, from which models and their derivatives are interpolated by return_Model_Lookup and return_Model_Lookup_Bundle.
+
+    If cacheDirectory is set, the table is stored on disk (see save_Model_Lookup) under a filename set by a hash of the configuration (setParams, pLabel, pRange, dP, modelFuncArgs). If a table with an identical configuration has already been stored, it is reused rather than re-rendered. In either case, the images are returned as a read-only np.memmap of the stored file, so that any number of processes using the same table share one physical copy.
 
     Requires:
     --- setParams - dictionary containign the default value for all other model parameters
-    --- pLabel - string labelling the parameter being fit (that which the lookup grid is evaluated
-    --- pRange - the range over which the model is evaluated
-    --- dP - the step size of the evaluation
+    --- pLabel - string (or list of strings) labelling the parameter(s) being fit (that which the lookup grid is evaluated
+    --- pRange - the range over which the model is evaluated: [min, max] for a single parameter, or a list of [min, max] for each parameter
+    --- dP - the step size of the evaluation (list for more than one parameter)
+    --- cacheDirectory: Directory in which lookup tables are stored. If None, the table is constructed in memory and not stored.
+    --- interp: Interpolation used to return models from the table (see return_Model_Lookup): None (nearest grid point), `linear' or `cubic'. Can be changed after construction by setting lookup[`interp'].
     --- modelFuncArgs: input dictionary of arguements required of the model image production routine.
 
     Returns:
     --- lookup dictionary: Dictionary containing details of the lookup table. Includes:
     ___useLookup: Default True. If true, use the information contained in the lookup construct
-    ___Grid: list of grid arrays specifying the parameter values on which the lookup was constructed
-    ___Images: [[nGrid]*nPar, [nPix, nPix]] <ndarray> the constructed model images evaluated over set parameter grid
+    ___Grid: list of grid arrays specifying the parameter values on which the lookup was constructed (a single array for nP = 1)
+    ___Images: [nGrid_1, ..., nGrid_nPar, nPix, nPix] <ndarray> the constructed model images evaluated over set parameter grid
     ___width: list of widths over which parameter grids are constructed (corresponding to image)
     ___nP: number of free parameters over which the lookup is constructed
-    ___interp: Sets whether index matching or linear interpolation is used in returning model. Interpolation is only implemented for nP = 1.
+    ___interp: Sets whether index matching (None), linear or cubic interpolation is used in returning model.
+    ___labels: list of parameter labels, in the order of the grid dimensions
+    ___baseFlux, baseBg: flux and background of the models in the table (where not lookup parameters), used to rescale the table to unit flux where the flux is profiled (see image_measurement_ML.get_Profiled_Model)
+    ___filename: File in which the lookup is stored (None if cacheDirectory is None)
 
     Note: If one cares, this and return Model lookup could be defined in a class.
     -- Code is not set up to use models outside the range specified by the lookup table
     """
-
-    print '\n Constructing Model Lookup Table \n'
-
-    Params = deepcopy(setParams)
+    import os
 
     nPar = 1
     if isinstance(pLabel, list):
         nPar = len(pLabel)
-    if(nPar > 2):
-        raise RuntimeError('get_Model_Lookup - Maximum of 2 parameters are allowed as part of a lookup')
 
     ##Create lists where appropriate
     if(isinstance(dP, list) == False):
@@ -303,81 +424,613 @@ def get_Model_Lookup(setParams, pLabel, pRange, dP, **modelFuncArgs):
     if(len(idP) != nPar):
         raise RuntimeError('get_Model_Lookup - dP (parameter width) is not conformal with number of parameters to vary', str(dP), ':', str(nPar))
 
-    ## Create the actual lookup table
+    ## Images can be indexed as [pp] or [pp][qq] for nPar = 1, 2 respectively
+    if(nPar == 1 and not isinstance(pLabel, list)):
+        pLabel = [pLabel]
+
+    filename = None
+    if(cacheDirectory is not None):
+        filename = os.path.join(cacheDirectory, 'modelLookup_'+get_Model_Lookup_Hash(setParams, pLabel, pRange, idP, **modelFuncArgs)+'.dat')
+        if(os.path.exists(filename)):
+            try:
+                print '\n Using stored Model Lookup Table:', filename, '\n'
+                lookup = load_Model_Lookup(filename)
+                lookup['interp'] = interp
+                return lookup
+            except ValueError:
+                print 'get_Model_Lookup - Stored lookup table', filename, 'could not be read, and will be reconstructed'
+
+    print '\n Constructing Model Lookup Table \n'
+
+    Params = deepcopy(setParams)
+
+    ## Create the actual lookup table. All grid points are produced in a single batched call
     if nPar == 1:
-        pGrid = np.arange(pRange[0], pRange[1]+(0.5*idP[0]), idP[0])
-
-        images = [1.]*pGrid.shape[0]
-        for pp in range(pGrid.shape[0]):
-            set_modelParameter(Params, pLabel[0], pGrid[pp])
-            #Deprecated Params[pLabel[0]] = pGrid[pp]
-            images[pp] = user_get_Pixelised_Model(Params, **modelFuncArgs)[0]
-    elif nPar == 2:
-        pGrid = []
-        for gg in range(nPar):
-            pGrid.append(np.arange(pRange[gg][0], pRange[gg][1]+(0.5*idP[gg]), idP[gg]))
-                
-        images = [[1.]*pGrid[1].shape[0] for i in range(pGrid[0].shape[0])]
-        for pp in range(pGrid[0].shape[0]):
-            for qq in range(pGrid[1].shape[0]):
-                set_modelParameter(Params, [pLabel[0], pLabel[1]], [pGrid[0][pp], pGrid[1][qq]])
-                #Deprecated Params[pLabel[0]] = pGrid[0][pp]; Params[pLabel[1]] = pGrid[1][qq]
-            
-                images[pp][qq] = user_get_Pixelised_Model(Params, **modelFuncArgs)[0]
+        iRange = [pRange]
+    else:
+        iRange = pRange
+    if(len(iRange) != nPar):
+        raise RuntimeError('get_Model_Lookup - pRange is not conformal with number of parameters to vary', str(pRange), ':', str(nPar))
+    pGrid = []
+    for gg in range(nPar):
+        pGrid.append(np.arange(iRange[gg][0], iRange[gg][1]+(0.5*idP[gg]), idP[gg]))
+    gridValues = np.array([g.flatten() for g in np.meshgrid(*pGrid, indexing = 'ij')]).T
+    gridShape = tuple([g.shape[0] for g in pGrid])
+    if nPar == 1:
+        pGrid = pGrid[0]
+
+    images = get_Pixelised_Model_Batch(gridValues, Params, pLabel, **modelFuncArgs)
+    images = images.reshape(gridShape+images.shape[1:])
 
     ### Pack up into a dictionary
-    return dict(useLookup = True, Grid = pGrid, Images = images, width = idP, nP = nPar, interp = None)
+    lookup = dict(useLookup = True, Grid = pGrid, Images = images, width = idP, nP = nPar, interp = interp, labels = pLabel, filename = None, baseFlux = Params['SB']['flux'], baseBg = Params['SB'].get('bg', 0.))
+
+    if(filename is not None):
+        save_Model_Lookup(lookup, filename, setParams)
+        lookup = load_Model_Lookup(filename)
+        lookup['interp'] = interp
+
+    return lookup
+
+def get_Model_Lookup_Hash(setParams, pLabel, pRange, dP, **modelFuncArgs):
+    """
+    Returns the hash identifying a lookup table configuration, used to name stored lookup tables. Parameters as for get_Model_Lookup.
+    If the models are noise-free (noiseType is None), the noise and SNR of setParams do not affect the table, and are not included. Nor are the values in setParams of the gridded parameters (pLabel), which are set by the grid: runs differing only in these (e.g. in the input values of a bias run) share a table.
+    """
+    from IO import hash_Configuration
+    from generalManipulation import makeIterableList
+
+    base = deepcopy(setParams)
+    if(modelFuncArgs.get('noiseType', None) is None):
+        base.pop('noise', None)
+        base.pop('SNR', None)
+    for c in compile_ModelParameters(base, makeIterableList(pLabel)):
+        c[0].pop(c[1], None)
+
+    return hash_Configuration(dict(version = lookupFileVersion, setParams = base, labels = pLabel, range = pRange, width = dP, modelFuncArgs = modelFuncArgs))
+
+def save_Model_Lookup(lookup, filename, setParams = None):
+    """
+    Stores a lookup table (as returned by get_Model_Lookup) to filename, as a binary file (see IO.write_Binary_Array) whose header contains the grid, the base parameters setParams and the hash of the configuration.
 
+    Requires:
+    -- lookup: lookup dictionary
+    -- filename
+    -- setParams: base model parameters used to construct the lookup (stored for reference only)
+    """
+    import os
+    from IO import write_Binary_Array
+
+    grid = lookup['Grid']
+    if(lookup['nP'] == 1):
+        grid = [grid]
+    header = dict(version = lookupFileVersion, Grid = grid, width = lookup['width'], nP = lookup['nP'], labels = lookup.get('labels', None), setParams = setParams, hash = os.path.basename(filename).replace('modelLookup_','').replace('.dat',''))
+
+    return write_Binary_Array(filename, lookup['Images'], header)
+
+def load_Model_Lookup(filename, mode = 'r'):
+    """
+    Opens a lookup table stored by save_Model_Lookup. The images are returned as a np.memmap of the file, so are not read into memory.
+
+    Requires:
+    -- filename
+    -- mode: np.memmap mode (default read-only)
+
+    Returns:
+    -- lookup dictionary, as get_Model_Lookup
+    """
+    from IO import load_Binary_Array
+
+    images, header = load_Binary_Array(filename, mode = mode)
+    if(header.get('version', None) != lookupFileVersion):
+        raise ValueError('load_Model_Lookup - '+filename+' was written with an incompatible lookup version:'+str(header.get('version', None)))
+
+    grid = [np.array(g) for g in header['Grid']]
+    if(header['nP'] == 1):
+        grid = grid[0]
+
+    baseSB = (header.get('setParams', None) or {}).get('SB', {})
+    return dict(useLookup = True, Grid = grid, Images = images, width = header['width'], nP = header['nP'], interp = None, labels = header['labels'], filename = filename, baseFlux = baseSB.get('flux', None), baseBg = baseSB.get('bg', 0.))
+
+
+def get_Lookup_Weights(x, grid0, width, nGrid, interp = None):
+    """
+    Returns the grid indices and interpolation weights used to interpolate a lookup table along a single parameter dimension, to parameter value x. The interpolated model (and its derivatives) are sum_k weight[k]*Images[index[k]], where weights are given for the model, and its first and second derivative with respect to x.
+
+    Interpolation types (interp):
+    -- None or `nearest': Nearest grid point. Derivatives are zero.
+    -- `lin' or `linear': Linear interpolation between the bounding grid points. Second derivatives are zero.
+    -- `cubic': Cubic (Catmull-Rom) spline through the four nearest grid points, which is continuous in value and first derivative. At the edges of the grid, the table is linearly extrapolated by one grid point.
+
+    Requires:
+    -- x: Parameter value
+    -- grid0: First grid point
+    -- width: Grid spacing
+    -- nGrid: Number of grid points
+    -- interp: Interpolation type
+
+    Returns:
+    -- index: Integer array of grid indices
+    -- weights: [3, len(index)] array of weights, for the value, and the first and second derivative
+    """
+
+    u = (x-grid0)/width
+    if(u < -0.5 or u > nGrid-0.5):
+        raise RuntimeError('return_Model_Lookup - Error with returning model lookup index - outside grid - Check entered range: '+str(x))
+
+    if(interp is None or interp.lower() == 'nearest'):
+        return np.array([int(round(u))]), np.array([[1.], [0.], [0.]])
+
+    if(interp.lower() == 'lin' or interp.lower() == 'linear'):
+        if(nGrid < 2):
+            raise ValueError('get_Lookup_Weights - Linear interpolation requires at least two grid points')
+        i = min(max(int(np.floor(u)), 0), nGrid-2)
+        t = u-i
+        return np.array([i, i+1]), np.array([[1.-t, t], [-1./width, 1./width], [0., 0.]])
+
+    if(interp.lower() == 'cubic'):
+        if(nGrid < 3):
+            raise ValueError('get_Lookup_Weights - Cubic interpolation requires at least three grid points')
+        i = min(max(int(np.floor(u)), 0), nGrid-2)
+        t = u-i
+        t2 = t*t; t3 = t2*t
+        weights = 0.5*np.array([[-t3+2.*t2-t, 3.*t3-5.*t2+2., -3.*t3+4.*t2+t, t3-t2],
+                                [(-3.*t2+4.*t-1.)/width, (9.*t2-10.*t)/width, (-9.*t2+8.*t+1.)/width, (3.*t2-2.*t)/width],
+                                [(-6.*t+4.)/(width*width), (18.*t-10.)/(width*width), (-18.*t+8.)/(width*width), (6.*t-2.)/(width*width)]])
+        index = np.arange(i-1, i+3)
+        ## Points outside the grid are linear extrapolations, Images[-1] = 2*Images[0] - Images[1] (and similarly at the upper edge), so their weights are folded onto the grid
+        if(index[0] < 0):
+            weights[:,1] += 2.*weights[:,0]; weights[:,2] -= weights[:,0]
+            index = index[1:]; weights = weights[:,1:]
+        if(index[-1] > nGrid-1):
+            weights[:,-2] += 2.*weights[:,-1]; weights[:,-3] -= weights[:,-1]
+            index = index[:-1]; weights = weights[:,:-1]
+        return index, weights
+
+    raise ValueError('get_Lookup_Weights - Interpolation type not recognised:'+str(interp))
+
+def interpolate_Model_Lookup(lookup, P, terms = [[]]):
+    """
+    Interpolates the lookup table to parameter values P, returning the model image and/or its derivatives with respect to the lookup parameters. Interpolation is separable across the parameter dimensions, and uses only the neighbouring grid points in each dimension (see get_Lookup_Weights for the interpolation types set by lookup[`interp']), so the cost is independent of the size of the table.
+
+    Requires:
+    -- lookup: Dictionary defined as in get_Model_Lookup
+    -- P: parameter values, in the order of the lookup dimensions (lookup[`labels'])
+    -- terms: list of derivatives to return, where each is a list of integer dimension indices (e.g. [] for the model, [0] for the derivative in the first dimension, [0,1] for the mixed second derivative in the first and second). Derivatives of at most second order in any one dimension are supported.
+
+    Returns:
+    -- result: [len(terms), nPix, nPix] <ndarray>
+    -- index: list of the lower (or nearest) grid index in each dimension
+    """
+    from generalManipulation import makeIterableList
+
+    P = makeIterableList(P)
+    nP = lookup['nP']
+    if(len(P) != nP):
+        raise ValueError('interpolate_Model_Lookup - Number of parameters entered does not match the lookup dimension:'+str(len(P))+':'+str(nP))
+    grid = lookup['Grid']
+    if(nP == 1):
+        grid = [grid]
+    width = makeIterableList(lookup['width'])
+
+    indices = []; weights = []
+    for k in range(nP):
+        index, weight = get_Lookup_Weights(P[k], grid[k][0], width[k], len(grid[k]), lookup['interp'])
+        indices.append(index); weights.append(weight)
+
+    ## Only the neighbouring grid points are extracted from the table
+    block = np.asarray(lookup['Images'][np.ix_(*indices)])
+
+    result = np.zeros((len(terms),)+block.shape[nP:])
+    for t, term in enumerate(terms):
+        res = block
+        for k in range(nP):
+            res = np.tensordot(weights[k][list(term).count(k)], res, axes = (0,0))
+        result[t] = res
+
+    ## Index of the nearest (interp None) or lower bounding grid point to P
+    if(lookup['interp'] is None or lookup['interp'].lower() == 'nearest'):
+        index = [int(indices[k][0]) for k in range(nP)]
+    else:
+        index = [min(max(int(np.floor((P[k]-grid[k][0])/width[k])), 0), len(grid[k])-2) for k in range(nP)]
+    return result, index
 
 def return_Model_Lookup(lookup, P):
     """
-    Returns the lookup model image and integer index corresponding to parameter values P.
+    Returns the lookup model image and integer index corresponding to parameter values P. The model is interpolated as set by lookup[`interp'] (see get_Lookup_Weights).
 
     Requires:
     -- lookup: Dictionary defined as in get_Model_Lookup
-    -- P <single element list/array>: parameter lookup value
+    -- P <list/array>: parameter lookup value, one for each lookup dimension
+
+    Returns:
+    -- model image
+    -- index: grid index of the nearest (interp None) or lower bounding (otherwise) grid point. This is an integer for a single parameter lookup, a list of integers otherwise
     """
 
-    ##
-    if(lookup['interp'] is None):
-        if(lookup['nP'] == 1):
-            index = int(round((P[0]-lookup['Grid'][0])/lookup['width']))
-        elif lookup['nP'] == 2:
-            index = [int(round((P[0]-lookup['Grid'][0][0])/lookup['width'][0])), int(round((P[1]-lookup['Grid'][1][0])/lookup['width'][1]))]
-        else:
-            raise RuntimeError('return_Model_Lookup - Lookup can only support up to 2 parameters')
-    elif(lookup['interp'].lower() == 'lin' or lookup['interp'].lower() == 'linear'):
-        if(lookup['nP'] == 1):
-            index = int((P[0]-lookup['Grid'][0])/lookup['width'])
-        elif lookup['nP'] == 2:
-            index = [int((P[0]-lookup['Grid'][0][0])/lookup['width'][0]), int((P[1]-lookup['Grid'][1][0])/lookup['width'][1])]
+    model, index = interpolate_Model_Lookup(lookup, P)
+    if(lookup['nP'] == 1):
+        index = index[0]
+    return model[0], index
+
+def return_Model_Lookup_Bundle(lookup, P, pLabels = None, order = 2):
+    """
+    Returns the interpolated model bundle (model, first, and second derivatives, as get_Pixelised_Model_Bundle) from the lookup table, so that gradient based minimisation and Fisher errors can be evaluated from the table alone.
+    The lookup must use interpolation (lookup[`interp'] set to `linear' or `cubic'): note that under linear interpolation, second derivatives with respect to the same parameter are zero.
+
+    Requires:
+    -- lookup: Dictionary defined as in get_Model_Lookup
+    -- P: parameter values, in pLabels order
+    -- pLabels: labels of parameters to be differentiated, setting the order of P and of the bundle. Must contain every lookup parameter (lookup[`labels']), in any order, as the table is interpolated over all of its dimensions. If None, the lookup parameters are used, in lookup order.
+    -- order: 1 or 2, as get_Pixelised_Model_Bundle
+
+    Returns:
+    -- bundle: [1 + nP (+ nP(nP+1)/2), nPix, nPix] <ndarray>, ordered as get_Bundle_Terms(pLabels, order)
+    """
+    from generalManipulation import makeIterableList
+
+    if(lookup['interp'] is None or lookup['interp'].lower() == 'nearest'):
+        raise ValueError('return_Model_Lookup_Bundle - Derivatives require an interpolated lookup (set lookup[interp] to linear or cubic)')
+
+    labels = makeIterableList(lookup.get('labels', None))
+    if(pLabels is None):
+        pLabels = labels
+    pLabels = makeIterableList(pLabels)
+    P = makeIterableList(P)
+    if(len(pLabels) != lookup['nP'] or sorted(pLabels) != sorted(labels)):
+        raise ValueError('return_Model_Lookup_Bundle - Labels entered do not match the lookup parameters:'+str(pLabels)+':'+str(labels))
+
+    ## Reorder to lookup dimensions
+    LP = [P[list(pLabels).index(l)] for l in labels]
+    terms = [[labels.index(l) for l in term] for term in get_Bundle_Terms(pLabels, order)]
+
+    return interpolate_Model_Lookup(lookup, LP, terms)[0]
+
+### ---------------------------------------------------------------- END Model Production - Lookup Table ----------------------------------------------------------------------------------------------------- ###
+
+### ---------------------------------------------------------------- Model Production - Analytic Pixel-Integrated Gaussian ------------------------------------------------------------------------------------ ###
+
+## Default number of Gauss-Legendre nodes per pixel (per dimension) used in the analytic renderer
+nQuadDefault = 4
+## Store of Gauss-Legendre nodes and weights over a unit-width pixel, keyed by number of nodes, so that these are only constructed once
+_pixelQuadrature = {}
+
+## Labels of the parameters which set the covariance of the SB profile and PSF respectively, in order [size, e1, e2]
+_SBShapeLabels = ['size', 'e1', 'e2']
+_PSFShapeLabels = ['PSF_size', 'PSF_Gauss_e1', 'PSF_Gauss_e2']
+
+def get_Pixel_Quadrature(nQuad):
+    """
+    Returns the Gauss-Legendre nodes and weights for integration over a pixel of unit width, centred on zero. Nodes lie in [-0.5,0.5] and weights sum to one.
+    """
+    if(nQuad not in _pixelQuadrature):
+        nodes, weights = np.polynomial.legendre.leggauss(nQuad)
+        _pixelQuadrature[nQuad] = (0.5*nodes, 0.5*weights)
+    return _pixelQuadrature[nQuad]
+
+def analytic_Render_Supported(Params, sbProfileFunc = None):
+    """
+    Returns True if the model described by Params can be produced using the analytic pixel-integrated renderer (gaussian_Pixelised_Model_Analytic): this requires a Gaussian SB profile, and either no PSF or a Gaussian PSF. If sbProfileFunc is passed, this must also be the C++ Gaussian SB profile, which is the profile the analytic renderer reproduces.
+    """
+    import surface_Brightness_Profiles as SBPro
+
+    if(sbProfileFunc is not None and sbProfileFunc is not SBPro.gaussian_SBProfile_CXX):
+        return False
+    if(str(Params['SB']['modelType']).lower() != 'gaussian'):
+        return False
+    if(Params['PSF']['PSF_Type'] and not (Params['PSF']['PSF_Type'] == 1 or str(Params['PSF']['PSF_Type']).lower() == 'gaussian')):
+        return False
+    return True
+
+def gaussian_Covariance_Derivative(size, e1, e2, der = []):
+    """
+    Returns the derivative of the covariance Q = size^2*[[1-e1, e2],[e2, 1+e1]] of an elliptical Gaussian profile, as the three independent components [Qxx, Qxy, Qyy]. der is a list (up to length two) of the labels `size', `e1' and `e2' to differentiate with respect to. If der is empty, Q itself is returned.
+    """
+
+    nSize = der.count('size')
+    if(len(der) > 2):
+        raise ValueError('gaussian_Covariance_Derivative - Only derivatives up to second order are supported')
+    if(len(der) == 2 and nSize == 0):
+        ##Q is linear in e1, e2
+        return [0., 0., 0.]
+
+    if(nSize == 0):
+        pre = size*size
+    elif(nSize == 1):
+        pre = 2.*size
+    else:
+        pre = 2.
+
+    eDer = [d for d in der if d != 'size']
+    if(len(eDer) == 0):
+        return [pre*(1.-e1), pre*e2, pre*(1.+e1)]
+    elif(eDer[0] == 'e1'):
+        return [-pre, 0., pre]
+    elif(eDer[0] == 'e2'):
+        return [0., pre, 0.]
+    else:
+        raise ValueError('gaussian_Covariance_Derivative - Derivative label not recognised:'+str(eDer[0]))
+
+def gaussian_Pixelised_Model_Analytic(Params, der = None, nQuad = nQuadDefault):
+    """
+    Returns the pixelised, PSF-convolved elliptical Gaussian model (or its derivative) defined by Params, evaluated directly on the postage stamp.
+
+    As the convolution of two Gaussians is a Gaussian whose covariance is the sum of the two covariances, the PSF convolution is done analytically, and the integration of the resulting profile over each pixel is done using an [nQuad x nQuad] Gauss-Legendre quadrature. This replaces the evaluation on an enlarged, sub-pixelised grid followed by FFT convolution with the PSF and pixel response function used in user_get_Pixelised_Model, and the result is a model integrated over the full profile (i.e. no enlargementFactor is required). As there, pixel centres lie on integer values [1, stamp_size] in each dimension.
+
+    Derivatives are taken analytically: for M = flux*exp(-0.5 r^T Q^-1 r)/(2 pi sqrt(detQ)), and any parameter p which enters Q,
+    dM/dp = M*g_p, where g_p = -0.5*Tr(Q^-1 Q,p) + 0.5*u^T Q,p u and u = Q^-1 r, and
+    d2M/dpdq = M*(g_p*g_q + h_pq), where h_pq = 0.5*Tr(Q^-1 Q,q Q^-1 Q,p) - 0.5*Tr(Q^-1 Q,pq) - (Q,p u)^T Q^-1 (Q,q u) + 0.5 u^T Q,pq u.
+
+    Requires:
+    -- Params: dictionary specifying model. SB profile must be Gaussian, and the PSF must be either off (PSF_Type == 0) or Gaussian. Any of the SB (size, e1, e2, flux, bg) or PSF (PSF_size, PSF_Gauss_e1, PSF_Gauss_e2) parameters can be entered as a 1D array of N values, in which case all N models are evaluated together.
+    -- der: List of parameters specifying the derivative returned, as in user_get_Pixelised_Model. Accepted labels are size, e1, e2, flux, bg, PSF_size, PSF_Gauss_e1 and PSF_Gauss_e2. Derivatives up to second order are supported.
+    -- nQuad: number of Gauss-Legendre nodes used per pixel, in each dimension.
+
+    Returns:
+    -- Res: [nPix, nPix] pixelised model image, or its derivative where der is set. The background is only added in the former case. Where parameters are entered as arrays, a [N, nPix, nPix] stack is returned.
+    """
+
+    if(der is None):
+        der = []
+
+    return gaussian_Pixelised_Model_Analytic_Terms(Params, [der], nQuad = nQuad)[0]
+
+def gaussian_Pixelised_Model_Analytic_Terms(Params, terms, nQuad = nQuadDefault):
+    """
+    Returns the pixelised model and/or its derivatives for a list of derivative labels (terms), as gaussian_Pixelised_Model_Analytic, in a single pass. The exponential, inverse covariance and first derivative factors (g_p) are evaluated once and shared between all terms.
+
+    Requires:
+    -- Params: dictionary specifying model, as gaussian_Pixelised_Model_Analytic.
+    -- terms: list of derivative label lists, each as der in gaussian_Pixelised_Model_Analytic, e.g. [[], ['e1'], ['e1','e1']] gives the model, and first and second derivatives wrt e1.
+    -- nQuad: number of Gauss-Legendre nodes used per pixel, in each dimension.
+
+    Returns:
+    -- Res: [nTerms, nPix, nPix] array (or [nTerms, N, nPix, nPix] where parameters are entered as arrays), ordered as terms.
+    """
+    from math import pi
+
+    for der in terms:
+        if(len(der) > 2):
+            raise ValueError('gaussian_Pixelised_Model_Analytic - Only derivatives up to second order are supported')
+
+    nPix = np.array(Params['stamp_size']).astype(int)
+
+    ## Parameters may be entered as arrays of length N (see get_Pixelised_Model_Batch), in which case a stack of N images is produced
+    batchShape = ()
+    for sub, labels in [['SB', _SBShapeLabels+['flux', 'bg']], ['PSF', _PSFShapeLabels]]:
+        for k in labels:
+            if(np.ndim(Params[sub][k]) > 0):
+                batchShape = (np.size(Params[sub][k]),)
+    outShape = batchShape + tuple(nPix)
+    def bParam(value):
+        if(len(batchShape) > 0 and np.ndim(value) > 0):
+            return np.asarray(value, dtype = float).reshape(-1,1,1)
+        return value
+
+    ## Identify whether each derivative acts on the SB profile, or PSF
+    def group(d):
+        if(d in _SBShapeLabels):
+            return 'SB', d
+        elif(d in _PSFShapeLabels):
+            return 'PSF', _SBShapeLabels[_PSFShapeLabels.index(d)]
+        raise RuntimeError('gaussian_Pixelised_Model_Analytic - Analytic model not coded up for derivative:'+str(d))
+
+    ## Covariance of the model: Galaxy and PSF contributions are additive
+    shape = dict(SB = [bParam(Params['SB'][k]) for k in _SBShapeLabels])
+    Q = gaussian_Covariance_Derivative(*shape['SB'])
+    usePSF = bool(Params['PSF']['PSF_Type'])
+    if(usePSF):
+        if(not (Params['PSF']['PSF_Type'] == 1 or str(Params['PSF']['PSF_Type']).lower() == 'gaussian')):
+            raise ValueError('gaussian_Pixelised_Model_Analytic - PSF_Type entered not known:'+str(Params['PSF']['PSF_Type']))
+        if(np.any(np.array(Params['PSF']['PSF_size']) <= 0.)):
+            raise ValueError('gaussian_Pixelised_Model_Analytic - PSF Size is invalid (Zero or negative)')
+        shape['PSF'] = [bParam(Params['PSF'][k]) for k in _PSFShapeLabels]
+        Qpsf = gaussian_Covariance_Derivative(*shape['PSF'])
+        Q = [Q[i]+Qpsf[i] for i in range(3)]
+
+    ##Inverse covariance
+    detQ = Q[0]*Q[2] - Q[1]*Q[1]
+    A = [Q[2]/detQ, -Q[1]/detQ, Q[0]/detQ]
+
+    ## Gauss-Legendre nodes for all pixels, as distance from centroid. Pixel i is centred on i+1
+    nodes, weights = get_Pixel_Quadrature(nQuad)
+    dx = ((np.arange(nPix[0])+1.)[:,None] + nodes[None,:]).flatten() - Params['centroid'][0]
+    dy = ((np.arange(nPix[1])+1.)[:,None] + nodes[None,:]).flatten() - Params['centroid'][1]
+    dx = dx[:,None]; dy = dy[None,:]
+
+    ux = A[0]*dx + A[1]*dy
+    uy = A[1]*dx + A[2]*dy
+
+    ## Unit-flux profile, evaluated at all nodes
+    unitSB = (1./(2.*pi*np.sqrt(detQ)))*np.exp(-0.5*(dx*ux + dy*uy))
+    flux = bParam(Params['SB']['flux'])
+
+    ## Store of first derivative factors (g_p), and Q,p, so that these are shared between terms
+    gStore = {}
+    def gFactor(d):
+        if(d not in gStore):
+            dQ = gaussian_Covariance_Derivative(*shape[group(d)[0]], der = [group(d)[1]])
+            trAQ = A[0]*dQ[0] + 2.*A[1]*dQ[1] + A[2]*dQ[2]
+            gStore[d] = [-0.5*trAQ + 0.5*(dQ[0]*ux*ux + 2.*dQ[1]*ux*uy + dQ[2]*uy*uy), dQ]
+        return gStore[d]
+
+    ## Terms known without evaluating the profile are set seperately, others are integrated over pixels together
+    Res = np.zeros((len(terms),)+outShape)
+    nodeTerms = []; nodeIndex = []
+    for t, der in enumerate(terms):
+        ## The model is linear in bg and flux, so these derivatives are known directly
+        if('bg' in der):
+            if(len(der) == 1):
+                Res[t] = 1.
+            continue
+        nFlux = der.count('flux')
+        if(nFlux > 1):
+            continue
+        shapeDer = [d for d in der if d != 'flux']
+        if(not usePSF and any([group(d)[0] == 'PSF' for d in shapeDer])):
+            continue
+
+        if(len(shapeDer) == 0):
+            SB = unitSB
+        elif(len(shapeDer) == 1):
+            SB = unitSB*gFactor(shapeDer[0])[0]
         else:
-            raise RuntimeError('return_Model_Lookup - Lookup can only support up to 2 parameters')
+            (g0, dQ0), (g1, dQ1) = gFactor(shapeDer[0]), gFactor(shapeDer[1])
+            (g0Group, lab0), (g1Group, lab1) = group(shapeDer[0]), group(shapeDer[1])
+            if(g0Group == g1Group):
+                ddQ = gaussian_Covariance_Derivative(*shape[g0Group], der = [lab0, lab1])
+            else:
+                ddQ = [0., 0., 0.]
+            ## Q^-1 Q,p as a general 2x2 matrix [00, 01, 10, 11]
+            AQ = [[A[0]*q[0]+A[1]*q[1], A[0]*q[1]+A[1]*q[2], A[1]*q[0]+A[2]*q[1], A[1]*q[1]+A[2]*q[2]] for q in [dQ0, dQ1]]
+            trAQAQ = AQ[1][0]*AQ[0][0] + AQ[1][1]*AQ[0][2] + AQ[1][2]*AQ[0][1] + AQ[1][3]*AQ[0][3]
+            trAddQ = A[0]*ddQ[0] + 2.*A[1]*ddQ[1] + A[2]*ddQ[2]
+            ## Q,p u
+            vx = [q[0]*ux + q[1]*uy for q in [dQ0, dQ1]]
+            vy = [q[1]*ux + q[2]*uy for q in [dQ0, dQ1]]
+            h = 0.5*trAQAQ - 0.5*trAddQ - (A[0]*vx[0]*vx[1] + A[1]*(vx[0]*vy[1] + vy[0]*vx[1]) + A[2]*vy[0]*vy[1]) \
+                + 0.5*(ddQ[0]*ux*ux + 2.*ddQ[1]*ux*uy + ddQ[2]*uy*uy)
+            SB = unitSB*(g0*g1 + h)
+        if(nFlux == 0):
+            SB = flux*SB
+        nodeTerms.append(np.broadcast_to(SB, batchShape + SB.shape[-2:])); nodeIndex.append(t)
+
+    ## Integrate over each pixel
+    if(len(nodeTerms) > 0):
+        SB = np.array(nodeTerms).reshape((len(nodeTerms),) + batchShape + (nPix[0], nQuad, nPix[1], nQuad))
+        pixSB = np.dot(SB, weights)
+        Res[nodeIndex] = np.tensordot(weights, pixSB, axes = ([0],[pixSB.ndim-2]))
+
+    if(Params['SB']['bg'] is not None):
+        for t, der in enumerate(terms):
+            if(len(der) == 0):
+                Res[t] += bParam(Params['SB']['bg'])
+
+    return Res
+
+def gaussian_Pixelised_Model_Analytic_Bundle(Params, labels, nQuad = nQuadDefault):
+    """
+    Returns the bundle of pixelised model, its first derivatives and the upper triangle of its second derivatives for parameters labelled by labels (see get_Bundle_Terms), evaluated in a single pass using gaussian_Pixelised_Model_Analytic_Terms.
+    """
+    return gaussian_Pixelised_Model_Analytic_Terms(Params, get_Bundle_Terms(labels), nQuad = nQuad)
+
+### ---------------------------------------------------------------- END Model Production - Analytic Pixel-Integrated Gaussian -------------------------------------------------------------------------------- ###
+
+
+def get_Grid_Setup(iParams, Verbose = False):
+    """
+    Sets up the enlarged, sub-pixelised grid on which the SB profile is evaluated in the grid method of user_get_Pixelised_Model.
+
+    Requires:
+    --- iParams: dictionary specifying model.
+    --- Verbose: If true, more is output to screen.
+
+    Returns:
+    --- xy, cen, boundary, fineGridFactor: grid [x,y] on which the SB profile is evaluated, centroid on that grid, lower index of the region of the (pixelised) enlarged grid corresponding to the postage stamp, and number of grid points per pixel in each dimension.
+    """
+
+    ###Get Surface Brightness image on enlarged grid. This is to take into account that the surface brightness profile may be non-zero outside the Postage Stamp boundaries set.
+    ## Ideally, enlargement factor should be set to n*sigma along the major axis of the image. 0.7 accounts for the fact that cos(theta) is at maximum 0.7, and that enlargement should occur equally in x- and y- direction. Larger enlargement factors wil slow down the process, and this can be turned off by setting enlargementFactor = 1.
+    if(iParams['PSF']['PSF_Type']):
+        if(iParams['PSF']['PSF_size'] <= 0.):
+            raise ValueError('user_get_Pixelised_Model - PSF Size is invalid (Zero or negative)')
+        enlargementFactor = int(5*np.amax([iParams['SB']['size'],iParams['PSF']['PSF_size']])/(np.amin(iParams['stamp_size'])*0.7)+1)
+    else:
+        enlargementFactor = int(5*iParams['SB']['size']/(np.amin(iParams['stamp_size'])*0.7)+1)
+    tempStampSize = enlargementFactor*np.array(iParams['stamp_size'])
+    if(Verbose):
+        print 'enlargement factor is:', enlargementFactor, tempStampSize
         
-    if((np.array(index) < 0).sum() > 0):
-        raise RuntimeError('return_Model_Lookup - Error with returning model lookup index - negative - Check entered range')
-    if((np.array(index) > len(lookup['Images'])).sum() > 0):
-        raise RuntimeError('return_Model_Lookup - Error with returning model lookup index - Larger than grid - Check entered range')
-
-    if(lookup['interp'] is None):
-        if(lookup['nP'] == 1):
-            return lookup['Images'][index], index
-        else:
-            return lookup['Images'][index[0]][index[1]], index
-    elif(lookup['interp'].lower() == 'lin' or lookup['interp'].lower() == 'linear'):
-        ## Not tested (15th Sept 2015 cajd)
-        if(lookup['nP'] == 1):
-            grad = (lookup['Images'][index+1]-lookup['Images'][index])/(lookup['Grid'][index+1]-lookup['Grid'][index])
-            rImage = grad*(P[0]-lookup['Grid'][index]) + lookup['Images'][index]
-            return rImage, index
+        
+    ##Evaluate user-defined function on a fine grid to account for sub-Pixel variation
+    ## Use only an odd number here. Increasing fineGridFactor imporves accuracy, but limits speed
+    fineGridFactor = 5
+    xy = [np.arange(1.-int(0.5*(fineGridFactor))/fineGridFactor, 1+tempStampSize[0]+int(0.5*fineGridFactor)/fineGridFactor, 1./fineGridFactor), \
+          np.arange(1.-int(0.5*(fineGridFactor))/fineGridFactor, 1+tempStampSize[1]+int(0.5*fineGridFactor)/fineGridFactor, 1./fineGridFactor)]
+      
+    ##Set the centroid for the image. This instance is a special case, where the centroid is assumed always to be at the centre.
+    #cen = [(np.amax(xy[0])+1)/2., (np.amax(xy[1])+1)/2.]
+    
+    cen = iParams['centroid'].copy()
+
+    ## Adjust centroid so it lies in the same relative region of the enlarged Grid, so that returned image can be produced by isolating central part of total image
+    ## This could also be done dy readjusting according to distance from centre.
+
+    lOffset = 0.5*((enlargementFactor-1)*iParams['stamp_size'][0]); rOffset = 0.5*((enlargementFactor-1)*iParams['stamp_size'][1])
+    cen[0] = cen[0] + lOffset
+    cen[1] = cen[1] + rOffset
+
+    ## Boundary stores the sub-section of the enlarged PS which contains the input stamp
+    boundary = np.array(0.5*(enlargementFactor-1)*np.array(iParams['stamp_size'])).astype(int)
+
+    return xy, cen, boundary, fineGridFactor
+
+def pixelise_Grid_Profile(sb, iParams, xy, boundary, fineGridFactor, PSFDer = [], Verbose = False):
+    """
+    Convolves the SB profile evaluated on the grid set up by get_Grid_Setup with the PSF (where set) and the pixel response function, and returns the part of the pixelised image corresponding to the postage stamp. No background is added. As each step is linear, this applies equally to derivatives of the SB profile.
+
+    Requires:
+    --- sb: SB profile (or its derivative) evaluated on grid xy
+    --- iParams: dictionary specifying model.
+    --- xy, boundary, fineGridFactor: as returned by get_Grid_Setup
+    --- PSFDer: List of PSF parameters specifying the derivative of the PSF used in the convolution.
+    --- Verbose: If true, more is output to screen.
+
+    Returns:
+    --- Res: [nPix, nPix] pixelised image.
+    """
+
+    ''' Get the PSF model and convolve (if appropriate) '''
+    ## Default PSF parameters: this would eventually be passed in
+    ## Future edits to this code would require the PSF model to be passed (or determined by dictionary values)
+
+    if(iParams['PSF']['PSF_Type']):
+        import PSF_Models
+
+        if(Verbose):
+            print 'Convolving with a PSF'
+        
+        psfCen = [xy[0][0] + 0.5*(xy[0][-1]-xy[0][0]), xy[1][0] + 0.5*(xy[1][-1]-xy[1][0])]
+        if(iParams['PSF']['PSF_Type'] == 1 or str(iParams['PSF']['PSF_Type']).lower() == 'gaussian'):
+            ## Use definition of elliptical SB profile, with total_flux == 1. so that integral(PSF) = 1
+            #psf = gaussian_SBProfile(xy, psfCen,  iParams['PSF_Parameters'][0],  iParams['PSF_Parameters'][1],  iParams['PSF_Parameters'][2], 1.0)
+            from PSF_Models import PSFModel_CXX
+            psf = PSFModel_CXX(xy, psfCen, iParams['PSF'], der = PSFDer)
         else:
-            raise ValueError('lookup - 2D interpolation not yet coded...')
-            grad = (lookup['Images'][index+1]-lookup['Images'][index])/(lookup['Grid'][index+1]-lookup['Grid'][index])
+            raise ValueError('user_get_Pixelised_Model - PSF_Type entered not known:'+str(iParams['PSF_Type']))
 
-### ---------------------------------------------------------------- END Model Production - Lookup Table ----------------------------------------------------------------------------------------------------- ###
+        ##Convolve the PSF and SBProfile
+        ### Note: Where the PSF model has a well defined fourier transform (as with the Gaussian), this could be sped ip by using the analytic form of the transform
+        import scipy.signal
+        sb = scipy.signal.fftconvolve(sb, psf, 'same')
+
+    ''' Do the PIXELISATION of the image '''
+    
+    ## Set up pixel response function
+    ##Pixel Response must account for the fineGridFactor, i.e. that in the sotred sb profile, each point is sub-pixel by a factor given by the parameter `fineGridFactor'
+    ## Thus: Set pixel response function to encompass f grid points, bounded by single box of zeros on the outside
+    PixResponse = np.zeros((fineGridFactor + 2, fineGridFactor + 2))
+    PixResponse[1:-1, 1:-1] = 1./(fineGridFactor*fineGridFactor)
+
+    ## Convolve with pixel response function
+    import scipy.signal
+    Pixelised = scipy.signal.fftconvolve(sb, PixResponse, 'same')
+    #Pixelised = scipy.signal.convolve2d(sb, PixResponse, 'same')
+    #import astropy.convolution as ast
+    #ast.convolve(sb, PixResponse)
+
+    ##Isolate the middle value as the central pixel value
+    Res = Pixelised[::fineGridFactor, ::fineGridFactor]
+    #Res = Pixelised[fineGridFactor/2::fineGridFactor, fineGridFactor/2::fineGridFactor]
+
+    ##Isolate part of postage stamp which corresponds to the 'unenlarged' input array
+    Res = Res[boundary[0]:boundary[0]+iParams['stamp_size'][0], \
+              boundary[1]:boundary[1]+iParams['stamp_size'][1]]
+    ## Q: Could this be done earlier/quicker?
 
+    return Res
 
-def user_get_Pixelised_Model(Params, inputImage = None, Verbose = False, noiseType = None, outputImage = False, sbProfileFunc = None, der = None, **sbFuncArgs):
+def user_get_Pixelised_Model(Params, inputImage = None, Verbose = False, noiseType = None, outputImage = False, sbProfileFunc = None, der = None, renderMethod = 'auto', **sbFuncArgs):
     """
     Native method of image construction using a pixel response function and PSF model, for specified surface brightness profile (10Jul2015)
 
@@ -395,14 +1048,14 @@ def user_get_Pixelised_Model(Params, inputImage = None, Verbose = False, noiseTy
     --- outputImage: IGNORED.
     --- sbProfileFunc: link to function which specifies the SB profile
     --- der: List of parameters specifying the derivative wrt which the image is produced. Length of der sets the order of the derivative, and each element specifies parameter: e.g. [size, e1] gives d^2(SB)/(dTde1). Derivatives are taken around values specified in Params. Only analytic derivative are coded up at this stage.
-    -- sbFuncArgs: Dictionary of argements not specifed otherwise which can be passed to the SB profile function.
+    --- renderMethod: `analytic' produces the image using the closed-form pixel-integrated Gaussian (gaussian_Pixelised_Model_Analytic), `grid' uses the fine-grid and FFT convolution method with sbProfileFunc. `auto' (default) uses the analytic method wherever the model is supported by it (Gaussian SB profile, and Gaussian or no PSF), and the grid method otherwise.
+    -- sbFuncArgs: Dictionary of argements not specifed otherwise which can be passed to the SB profile function (or to gaussian_Pixelised_Model_Analytic where used, e.g. nQuad).
 
     Returns:
     image, iParams: Pixelised model image as [nPix, nPix] array, as defined by input, and dictionary of model parameters including any modifications (e.g. update to noise etc).
     """
 
-    import copy
-    iParams = copy.deepcopy(Params)
+    iParams = copy_ModelParameters(Params)
 
     if(der is not None):
         SBDer, PSFDer = seperate_Keys_byModel(der,refParam =  iParams)
@@ -414,94 +1067,26 @@ def user_get_Pixelised_Model(Params, inputImage = None, Verbose = False, noiseTy
     if(iParams['SB']['e1']*iParams['SB']['e1'] + iParams['SB']['e2']*iParams['SB']['e2'] >= 1. or iParams['SB']['size'] <= 0):
         return np.zeros(iParams['stamp_size'])
 
-    if(inputImage is None):
-        ###Get Surface Brightness image on enlarged grid. This is to take into account that the surface brightness profile may be non-zero outside the Postage Stamp boundaries set.
-        ## Ideally, enlargement factor should be set to n*sigma along the major axis of the image. 0.7 accounts for the fact that cos(theta) is at maximum 0.7, and that enlargement should occur equally in x- and y- direction. Larger enlargement factors wil slow down the process, and this can be turned off by setting enlargementFactor = 1.
-        if(iParams['PSF']['PSF_Type']):
-            if(iParams['PSF']['PSF_size'] <= 0.):
-                raise ValueError('user_get_Pixelised_Model - PSF Size is invalid (Zero or negative)')
-            enlargementFactor = int(5*np.amax([iParams['SB']['size'],iParams['PSF']['PSF_size']])/(np.amin(iParams['stamp_size'])*0.7)+1)
-        else:
-            enlargementFactor = int(5*iParams['SB']['size']/(np.amin(iParams['stamp_size'])*0.7)+1)
-        tempStampSize = enlargementFactor*np.array(iParams['stamp_size'])
-        if(Verbose):
-            print 'enlargement factor is:', enlargementFactor, tempStampSize
-            
-            
-        ##Evaluate user-defined function on a fine grid to account for sub-Pixel variation
-        ## Use only an odd number here. Increasing fineGridFactor imporves accuracy, but limits speed
-        fineGridFactor = 5
-        xy = [np.arange(1.-int(0.5*(fineGridFactor))/fineGridFactor, 1+tempStampSize[0]+int(0.5*fineGridFactor)/fineGridFactor, 1./fineGridFactor), \
-              np.arange(1.-int(0.5*(fineGridFactor))/fineGridFactor, 1+tempStampSize[1]+int(0.5*fineGridFactor)/fineGridFactor, 1./fineGridFactor)]
-          
-        ##Set the centroid for the image. This instance is a special case, where the centroid is assumed always to be at the centre.
-        #cen = [(np.amax(xy[0])+1)/2., (np.amax(xy[1])+1)/2.]
-        
-        cen = iParams['centroid'].copy()
-
-        ## Adjust centroid so it lies in the same relative region of the enlarged Grid, so that returned image can be produced by isolating central part of total image
-        ## This could also be done dy readjusting according to distance from centre.
+    if(renderMethod not in ['auto', 'grid', 'analytic']):
+        raise ValueError('user_get_Pixelised_Model - renderMethod not recognised:'+str(renderMethod))
+    if(renderMethod == 'auto'):
+        analytic = analytic_Render_Supported(iParams, sbProfileFunc)
+    else:
+        analytic = (renderMethod == 'analytic')
 
-        lOffset = 0.5*((enlargementFactor-1)*iParams['stamp_size'][0]); rOffset = 0.5*((enlargementFactor-1)*iParams['stamp_size'][1])
-        cen[0] = cen[0] + lOffset
-        cen[1] = cen[1] + rOffset
+    if(inputImage is None and analytic):
+        ## Gaussian SB profile with Gaussian (or no) PSF: produce the model directly at postage stamp resolution
+        Res = gaussian_Pixelised_Model_Analytic(iParams, der = der, **sbFuncArgs)
+    elif(inputImage is None):
+        xy, cen, boundary, fineGridFactor = get_Grid_Setup(iParams, Verbose = Verbose)
 
-        ## Boundary stores the sub-section of the enlarged PS which contains the input stamp
-        boundary = np.array(0.5*(enlargementFactor-1)*np.array(iParams['stamp_size'])).astype(int)
-        
         ''' Note: No recovery of final subarray is needed provided that xy is evaluated on the same scale as that of size *i.e using no intervals == (enlargmentFactor*stamp_size), as GALSIM only interpolates on this image '''
         if(sbProfileFunc is None):
             raise RuntimeError('user_get_Pixelised_Model - sbProfileFunc must be passed')
 
         sb = sbProfileFunc(xy, cen, iParams['SB']['size'], iParams['SB']['e1'], iParams['SB']['e2'], iParams['SB']['flux'], der = SBDer, **sbFuncArgs)
 
-        ''' Get the PSF model and convolve (if appropriate) '''
-        ## Default PSF parameters: this would eventually be passed in
-        ## Future edits to this code would require the PSF model to be passed (or determined by dictionary values)
-
-        if(iParams['PSF']['PSF_Type']):
-            import PSF_Models
-
-            if(Verbose):
-                print 'Convolving with a PSF'
-            
-            psfCen = [xy[0][0] + 0.5*(xy[0][-1]-xy[0][0]), xy[1][0] + 0.5*(xy[1][-1]-xy[1][0])]
-            if(iParams['PSF']['PSF_Type'] == 1 or str(iParams['PSF']['PSF_Type']).lower() == 'gaussian'):
-                ## Use definition of elliptical SB profile, with total_flux == 1. so that integral(PSF) = 1
-                #psf = gaussian_SBProfile(xy, psfCen,  iParams['PSF_Parameters'][0],  iParams['PSF_Parameters'][1],  iParams['PSF_Parameters'][2], 1.0)
-                from PSF_Models import PSFModel_CXX
-                psf = PSFModel_CXX(xy, psfCen, iParams['PSF'], der = PSFDer)
-            else:
-                raise ValueError('user_get_Pixelised_Model - PSF_Type entered not known:'+str(iParams['PSF_Type']))
-
-            ##Convolve the PSF and SBProfile
-            ### Note: Where the PSF model has a well defined fourier transform (as with the Gaussian), this could be sped ip by using the analytic form of the transform
-            import scipy.signal
-            sb = scipy.signal.fftconvolve(sb, psf, 'same')
-
-        ''' Do the PIXELISATION of the image '''
-        
-        ## Set up pixel response function
-        ##Pixel Response must account for the fineGridFactor, i.e. that in the sotred sb profile, each point is sub-pixel by a factor given by the parameter `fineGridFactor'
-        ## Thus: Set pixel response function to encompass f grid points, bounded by single box of zeros on the outside
-        PixResponse = np.zeros((fineGridFactor + 2, fineGridFactor + 2))
-        PixResponse[1:-1, 1:-1] = 1./(fineGridFactor*fineGridFactor)
-
-        ## Convolve with pixel response function
-        import scipy.signal
-        Pixelised = scipy.signal.fftconvolve(sb, PixResponse, 'same')
-        #Pixelised = scipy.signal.convolve2d(sb, PixResponse, 'same')
-        #import astropy.convolution as ast
-        #ast.convolve(sb, PixResponse)
-    
-        ##Isolate the middle value as the central pixel value
-        Res = Pixelised[::fineGridFactor, ::fineGridFactor]
-        #Res = Pixelised[fineGridFactor/2::fineGridFactor, fineGridFactor/2::fineGridFactor]
-
-        ##Isolate part of postage stamp which corresponds to the 'unenlarged' input array
-        Res = Res[boundary[0]:boundary[0]+iParams['stamp_size'][0], \
-                  boundary[1]:boundary[1]+iParams['stamp_size'][1]]
-        ## Q: Could this be done earlier/quicker?
+        Res = pixelise_Grid_Profile(sb, iParams, xy, boundary, fineGridFactor, PSFDer = PSFDer, Verbose = Verbose)
 
         #Add a background
         if(iParams['SB']['bg'] is not None):
@@ -729,6 +1314,173 @@ def get_Pixelised_Model(Params, noiseType = None, Verbose = False, outputImage =
 
 ##---------------------------- Differentiation Methods --------------------------------------------##
 
+### ---------------------------------------------------------------- Model Production - Derivative Bundle --------------------------------------------------------------------------------------------------------- ###
+
+def get_Bundle_Terms(labels, order = 2):
+    """
+    Returns the list of derivative labels (each as der in user_get_Pixelised_Model) which make up a model bundle for parameters labelled by labels. The bundle is ordered as: the model; the first derivatives for each parameter in labels order; the upper triangle of second derivatives [labels[i], labels[j]] for j >= i, in row-major order. A bundle therefore has length 1 + nP + nP(nP+1)/2. If order == 1, the second derivatives are omitted.
+    """
+    nP = len(labels)
+    terms = [[]] + [[l] for l in labels]
+    if(order == 2):
+        for i in range(nP):
+            for j in range(i, nP):
+                terms.append([labels[i], labels[j]])
+    elif(order != 1):
+        raise ValueError('get_Bundle_Terms - Only bundles to first or second order are supported')
+    return terms
+
+def unpack_Model_Bundle(bundle, nP):
+    """
+    Splits a model bundle (as returned by get_Pixelised_Model_Bundle) for nP parameters into the model image, first derivatives [nP, nPix, nPix] and full (symmetric) second derivatives [nP, nP, nPix, nPix]. The latter is None for a first order bundle.
+    """
+    model = bundle[0]
+    der1 = bundle[1:1+nP]
+    if(bundle.shape[0] == 1 + nP):
+        return model, der1, None
+    if(bundle.shape[0] != 1 + nP + (nP*(nP+1))/2):
+        raise ValueError('unpack_Model_Bundle - bundle length not conformal with number of parameters:'+str(bundle.shape[0])+':'+str(nP))
+
+    der2 = np.zeros((nP, nP)+bundle.shape[1:])
+    index = 1+nP
+    for i in range(nP):
+        for j in range(i, nP):
+            der2[i,j] = bundle[index]
+            der2[j,i] = bundle[index]
+            index += 1
+    return model, der1, der2
+
+def get_Pixelised_Model_Bundle(Params, labels, sbProfileFunc = None, renderMethod = 'auto', order = 2, **sbFuncArgs):
+    """
+    Returns the pixelised model, its first derivatives and the upper triangle of its second derivatives wrt the parameters labelled by labels, as a single [1 + nP + nP(nP+1)/2, nPix, nPix] array ordered as get_Bundle_Terms. This is the bundle required in Fisher errors and the analytic bias, and is evaluated in a single pass rather than through a seperate call of user_get_Pixelised_Model for each derivative:
+    -- Analytic rendering (see user_get_Pixelised_Model): all terms are evaluated together using gaussian_Pixelised_Model_Analytic_Terms
+    -- Grid rendering with sbProfileFunc = gaussian_SBProfile_CXX, and SB parameters (size, e1, e2, flux) only: the fused C++ kernel is used to evaluate all SB profile derivatives on the fine grid in one pass (gaussian_SBProfile_CXX_Bundle), and each is then pixelised.
+    -- Otherwise, each term is produced using user_get_Pixelised_Model.
+    The background is only added to the model (bundle[0]).
+
+    Requires:
+    --- Params: dictionary specifying model. Not modified.
+    --- labels: list of nP parameter labels, defined as in default dictionary.
+    --- sbProfileFunc, renderMethod, sbFuncArgs: as user_get_Pixelised_Model.
+    --- order: If 1, only the model and first derivatives are returned, as a [1 + nP, nPix, nPix] array.
+
+    Returns:
+    --- bundle: [1 + nP + nP(nP+1)/2, nPix, nPix] array. Use unpack_Model_Bundle to obtain the model, gradient and Hessian seperately.
+    """
+    import surface_Brightness_Profiles as SBPro
+    from generalManipulation import makeIterableList
+
+    labels = list(makeIterableList(labels))
+    terms = get_Bundle_Terms(labels, order = order)
+    nPix = tuple(np.array(Params['stamp_size']).astype(int))
+
+    ##Unphysical/invalid parameters give a zero model (and derivatives), as in user_get_Pixelised_Model
+    if(Params['SB']['e1']*Params['SB']['e1'] + Params['SB']['e2']*Params['SB']['e2'] >= 1. or Params['SB']['size'] <= 0):
+        return np.zeros((len(terms),)+nPix)
+
+    if(renderMethod not in ['auto', 'grid', 'analytic']):
+        raise ValueError('get_Pixelised_Model_Bundle - renderMethod not recognised:'+str(renderMethod))
+    if(renderMethod == 'auto'):
+        analytic = analytic_Render_Supported(Params, sbProfileFunc)
+    else:
+        analytic = (renderMethod == 'analytic')
+
+    if(analytic):
+        return gaussian_Pixelised_Model_Analytic_Terms(Params, terms, **sbFuncArgs)
+
+    if(sbProfileFunc is SBPro.gaussian_SBProfile_CXX and len(sbFuncArgs) == 0 and all([l in SBPro.bundleLabels_CXX+['flux'] for l in labels])):
+        ## Fused evaluation of the unit-flux profile and its derivatives on the fine grid. The model is linear in flux
+        xy, cen, boundary, fineGridFactor = get_Grid_Setup(Params)
+        sbBundle = SBPro.gaussian_SBProfile_CXX_Bundle(xy, cen, Params['SB']['size'], Params['SB']['e1'], Params['SB']['e2'], 1.)
+        sbTerms = get_Bundle_Terms(SBPro.bundleLabels_CXX)
+
+        bundle = np.zeros((len(terms),)+nPix)
+        for t, der in enumerate(terms):
+            nFlux = der.count('flux')
+            if(nFlux > 1):
+                continue
+            shapeDer = sorted([d for d in der if d != 'flux'], key = SBPro.bundleLabels_CXX.index)
+            bundle[t] = pixelise_Grid_Profile(sbBundle[sbTerms.index(shapeDer)], Params, xy, boundary, fineGridFactor)
+            if(nFlux == 0):
+                bundle[t] *= Params['SB']['flux']
+    else:
+        bundle = np.zeros((len(terms),)+nPix)
+        for t, der in enumerate(terms):
+            bundle[t] = user_get_Pixelised_Model(Params, sbProfileFunc = sbProfileFunc, der = (der if len(der) > 0 else None), renderMethod = renderMethod, **sbFuncArgs)[0]
+            if(len(der) > 0 and Params['SB']['bg'] is not None):
+                bundle[t] -= Params['SB']['bg']
+        return bundle
+
+    if(Params['SB']['bg'] is not None):
+        bundle[0] += Params['SB']['bg']
+
+    return bundle
+
+def get_Pixelised_Model_Bundle_Batch(values, Params, labels, order = 2, chunkSize = 500, **kwargs):
+    """
+    Batched version of get_Pixelised_Model_Bundle: returns the model bundle (model and derivatives wrt labels) for each of N sets of values of the parameters labelled by labels. Where the model can be produced analytically (see analytic_Render_Supported), all bundles in a chunk are evaluated in a single vectorised call of gaussian_Pixelised_Model_Analytic_Terms, otherwise get_Pixelised_Model_Bundle is called for each parameter set.
+
+    Requires:
+    --values: [N, nP] array of parameter values, with columns labelled by labels.
+    --Params: model dictionary used to specify the fixed model parameters. Not modified.
+    --labels: list of nP labels, with respect to which the derivatives are taken.
+    --order: order of the bundle, as get_Pixelised_Model_Bundle.
+    --chunkSize: maximum number of bundles evaluated together in the vectorised case.
+    --kwargs: arguments passed to get_Pixelised_Model_Bundle (e.g. sbProfileFunc, renderMethod, nQuad).
+
+    Returns:
+    -- bundles: [N, nTerms, nPix, nPix] array, ordered as the rows of values, where each bundle is ordered as get_Bundle_Terms. Parameter sets which are unphysical (|e| >= 1 or size <= 0) give a bundle of zeros.
+    """
+    from generalManipulation import makeIterableList
+
+    labels = list(makeIterableList(labels))
+    values = np.array(values, dtype = float).reshape(-1, len(labels))
+    terms = get_Bundle_Terms(labels, order = order)
+    nModel = values.shape[0]
+    nPix = tuple(np.array(Params['stamp_size']).astype(int))
+    bundles = np.zeros((nModel, len(terms))+nPix)
+
+    groups = get_Parameter_Groups()
+    for l in labels:
+        if(l not in groups):
+            raise ValueError('get_Pixelised_Model_Bundle_Batch - Parameter label not recognised:'+str(l))
+
+    def column(sub, key):
+        ## Values taken by parameter `key' across the batch
+        if(key in labels and groups[key] == sub):
+            return values[:,labels.index(key)]
+        return np.ones(nModel)*Params[sub][key]
+
+    ## Unphysical models are left as zero
+    e1, e2, size = column('SB', 'e1'), column('SB', 'e2'), column('SB', 'size')
+    index = np.where(np.logical_and(e1*e1 + e2*e2 < 1., size > 0.))[0]
+
+    renderMethod = kwargs.get('renderMethod', 'auto')
+    if(renderMethod == 'auto'):
+        vectorise = analytic_Render_Supported(Params, kwargs.get('sbProfileFunc', None))
+    else:
+        vectorise = (renderMethod == 'analytic')
+    vectorise = vectorise and all([l in _SBShapeLabels+_PSFShapeLabels+['flux', 'bg'] for l in labels])
+
+    if(vectorise):
+        anaArgs = dict([[k, kwargs[k]] for k in kwargs if k in ['nQuad']])
+        bParams = copy_ModelParameters(Params)
+        for c in range(0, index.shape[0], chunkSize):
+            cIndex = index[c:c+chunkSize]
+            for i, l in enumerate(labels):
+                bParams[groups[l]][l] = values[cIndex,i]
+            bundles[cIndex] = np.swapaxes(gaussian_Pixelised_Model_Analytic_Terms(bParams, terms, **anaArgs), 0, 1)
+    else:
+        iParams = copy_ModelParameters(Params)
+        compiled = compile_ModelParameters(iParams, labels)
+        for n in index:
+            set_Compiled_Parameters(compiled, values[n])
+            bundles[n] = get_Pixelised_Model_Bundle(iParams, labels, order = order, **kwargs)
+
+    return bundles
+
+### ---------------------------------------------------------------- END Model Production - Derivative Bundle ----------------------------------------------------------------------------------------------------- ###
+
 def differentiate_Pixelised_Model_Analytic(modelParams, pVal, pLab, n, permute = False):
     import surface_Brightness_Profiles as SBPro
     from generalManipulation import makeIterableList
@@ -756,21 +1508,13 @@ def differentiate_Pixelised_Model_Analytic(modelParams, pVal, pLab, n, permute =
     nP = len(pVal)
     nPix = modelParams['stamp_size']
     if permute:
-        ##Consider all permutations of entered parameters. Use numpy array
+        ##Consider all permutations of entered parameters. All derivatives are produced together as a bundle
+        set_modelParameter(modelParams, pLab, pVal)
+        model, der1, der2 = unpack_Model_Bundle(get_Pixelised_Model_Bundle(modelParams, pLab, sbProfileFunc = SBPro.gaussian_SBProfile_CXX), nP)
         if n == 1:
-            Res = np.zeros((nP, nPix[0], nPix[1]))
-            for i in range(nP):
-                der = [pLab[i]]
-                Res[i,:,:] = get_Pixelised_Model_wrapFunction(pVal, modelParams, pLab,  noiseType = None, outputImage = False, sbProfileFunc = SBPro.gaussian_SBProfile_CXX, der = der)
-        
+            Res = der1
         elif n == 2:
-            Res = np.zeros((nP, nP, nPix[0], nPix[1]))
-            
-            for i in range(nP):
-                for j in range(i, nP):
-                    der = [pLab[i], pLab[j]]
-                    Res[i,j,:,:] = get_Pixelised_Model_wrapFunction(pVal, modelParams, pLab,  noiseType = None, outputImage = False, sbProfileFunc = SBPro.gaussian_SBProfile_CXX, der = der)
-                    Res[j,i,:,:] = Res[i,j] #Enforce symmetry
+            Res = der2
 
     else:
         ## Consider the derivative to given order for each parameter entered
@@ -788,7 +1532,7 @@ def differentiate_Pixelised_Model_Analytic(modelParams, pVal, pLab, n, permute =
     return Res
 
 
-def differentiate_Pixelised_Model_Numerical(modelParams, pVal, pLab, n = [1], order = 3, interval = 0.1, eps = 1.e-3, maxEval = 100):
+def differentiate_Pixelised_Model_Numerical(modelParams, pVal, pLab, n = [1], order = 3, interval = 0.1, eps = 1.e-3, maxEval = 100, extrapolate = False, executor = None, batch = False):
     from derivatives import finite_difference_derivative
     """
     28/5/15
@@ -805,10 +1549,18 @@ def differentiate_Pixelised_Model_Numerical(modelParams, pVal, pLab, n = [1], or
     --- interval: step size used in finite difference method. As defined in finite_difference_derivative()
     --- eps: Tolerance for convergence.  As defined in finite_difference_derivative()
     --- maxEval: Maximum number of derivative evaluations (and step-size intervals) considered in testing for convergence.
+    --- extrapolate: If True, Richardson extrapolation is applied across step-size intervals. As defined in finite_difference_derivative()
+    --- executor: pool (e.g. multiprocessing.Pool or multiprocessing.pool.ThreadPool) over which the models at each step-size interval are produced concurrently. As defined in finite_difference_derivative(). As the C++ SB kernels release the GIL, a thread pool is usually sufficient.
+    --- batch: If True, all models at each step-size interval are produced in a single call to get_Pixelised_Model_Batch (in which case modelParams is not modified). This is fastest where the model can be rendered analytically (see analytic_Render_Supported).
 
     """
 
-    result = finite_difference_derivative(get_Pixelised_Model_wrapFunction, pVal, args = [modelParams, pLab, 1], n = n, order = order, dx = interval, eps = eps, convergenceType = 'sum', maxEval = maxEval)
+    if(batch):
+        batchFun = get_Pixelised_Model_Batch
+    else:
+        batchFun = None
+
+    result = finite_difference_derivative(get_Pixelised_Model_wrapFunction, pVal, args = [modelParams, pLab, 1], n = n, order = order, dx = interval, eps = eps, convergenceType = 'sum', maxEval = maxEval, extrapolate = extrapolate, executor = executor, batchFun = batchFun, batchArgs = [modelParams, pLab])
 
     return result
 
@@ -7,6 +7,7 @@ import numpy as np;
 import scipy;
 import scipy.stats as scist;
 import scipy.interpolate as sciInterp;
+import collections
 from scipy.stats import poisson, norm, uniform;
 import pylab as pl
 
@@ -44,24 +45,25 @@ def pdf_conv_dis_cont(D,C):
 
 # In[ ]:
 
-def pdf_conv_dis_cont_full(D,C):
-    #Works, likely slow
+def pdf_conv_dis_cont_full(D,C, chunkSize = 100):
+    #Convolution of discrete D with continuous C, evaluated on a grid of 1000 points. For each grid point, the discrete entries within the support of C are summed: the PMF is evaluated once over the support of D, and the sum for chunkSize grid points at a time is taken as a single masked matrix product
     intC = C.interval(.999999);
     intD = D.interval(.999999);
     grid = np.linspace(intD[0]+intC[0],intD[1]+intC[1],1000);
-    
+
+    dGrid = np.arange(intD[0],intD[1])
+    Dpmf = D.pmf(dGrid)
+
+    #Discrete entries summed for each grid point
+    Dlow = np.maximum(intD[0], np.trunc(grid+intC[0]))
+    Dhi = np.minimum(intD[1], np.trunc(grid+intC[1]+1))
+
     conv = np.zeros(grid.shape[0])
-    for i in range(grid.shape[0]):
-        Dlow = max(intD[0],int(grid[i]+intC[0]))
-        Dhi = min(intD[1], int(grid[i]+intC[1]+1))
-            
-        dGrid = np.arange(Dlow,Dhi)
-         
-        Dpmf = D.pmf(dGrid)
-        
-        #Convolve by summing all discrete non-zero entries
-        toSum = Dpmf*C.pdf((grid[i]*np.ones(dGrid.shape[0]))-dGrid)
-        conv[i] = toSum.sum()
+    for c in range(0, grid.shape[0], chunkSize):
+        g = slice(c, c+chunkSize)
+        inSupport = (dGrid[None,:] >= Dlow[g,None]) & (dGrid[None,:] < Dhi[g,None])
+        toSum = np.where(inSupport, C.pdf(grid[g,None]-dGrid[None,:]), 0.)
+        conv[g] = np.dot(toSum, Dpmf)
         
     #Manually edit limits to zero
     conv[0] = 0.;
@@ -98,42 +100,85 @@ def PN_Likelihood(phot, spec):
 
 # In[ ]:
 
-def inverse_Sample(xt,ft, nSamples = 1):
+def N_Sample(phot, spec, nSamples = 1, random = np.random):
+    #Draws nSamples realisations of counts directly from the distribution of N_Likelihood, for all pixels at once. phot may be an array of any shape (e.g. a flattened image), and the result has shape [nSamples]+phot.shape
+    if "sigma" in spec:
+        sig = spec["sigma"]
+    elif "readout" in spec and "ADUf" in spec:
+        sig = spec['readout']/spec['ADUf']
+    else:
+        raise ValueError("N_Sample: Sigma uncertainty not recognised in input specification dictionary")
+    phot = np.asarray(phot, dtype = float)
+
+    return phot + random.normal(0., sig, size = (nSamples,)+phot.shape)
+
+def PN_Sample(phot, spec, nSamples = 1, random = np.random):
+    #Draws nSamples realisations of counts directly from the distribution of PN_Likelihood (Poisson counts with rate phot*qe+charge, plus Gaussian read noise of width readout/ADUf), for all pixels at once. phot may be an array of any shape (e.g. a flattened image), and the result has shape [nSamples]+phot.shape. random may be np.random or a np.random.RandomState
+    lam = np.asarray(phot, dtype = float)*spec['qe'] + spec['charge']
+    if(np.any(lam < 0.)):
+        raise ValueError("PN_Sample: Poisson rate (phot*qe+charge) must be non-negative")
+
+    counts = random.poisson(lam, size = (nSamples,)+lam.shape).astype(float)
+    counts += random.normal(0., spec['readout']/spec['ADUf'], size = counts.shape)
+    return counts
+
+#Direct samplers for each likelihood, used in place of inverse sampling from the tabulated likelihood of each pixel (see produce_Data.produce_Realisations)
+directSamplers = {N_Likelihood:N_Sample, PN_Likelihood:PN_Sample}
+
+
+# In[ ]:
+
+def get_CDF(xt, ft):
+    #Returns the CDF of the PDF ft tabulated on xt, by the (cumulative) trapezium rule
     from math import fabs
 
-    #Construct CDF
-    CDF = np.zeros(ft.shape[0])
     if(fabs(ft[0]) > 1e-10 or fabs(ft[-1]) > 1e-10):
         print "PDF at limits:", ft[0], " :: ", ft[-1]
         raise ValueError("Inverse Sampling: PDF must be zero at limits")
-    CDF[0] = 0;
-    for i in range(1,CDF.shape[0]):
-        CDF[i] = CDF[i-1] + 0.5*(ft[i]+ft[i-1])*(xt[i]-xt[i-1])
+    CDF = np.zeros(ft.shape[0])
+    CDF[1:] = np.cumsum(0.5*(ft[1:]+ft[:-1])*np.diff(xt))
     
     if(CDF[-1] < 0.99 or CDF[-1] > 1.01):
         raise ValueError("Inverse Sampling: CDF does not sum to accepted tolerance")
     CDF[-1] = 1 #NOTE: This needs edited out
-    if(CDF[-1] != 1):
-        print "CDF sums to ", CDF[-1]
-        raise ValueError("Inverse sampling: CDF does not sum to one")
-    
-    #Invert CDF with interpolation
-    inv_cdf = sciInterp.interp1d(CDF, xt)
-    
+
+    return CDF
+
+def inverse_Sample(xt,ft, nSamples = 1):
+    #Construct CDF
+    CDF = get_CDF(xt, ft)
+
     #Generate Random Number
     r = np.random.rand(nSamples)
-    
-    try:
-        res = inv_cdf(r)
-    except ValueError:
-        print "Fatal Error in inverse sampling."
-        print "CDF has ", CDF[0], CDF[-1]
-        print "xt has ", xt[0], xt[-1]
-        print "Random limits ", np.amin(r), np.amax(r)
-        exit()
-
-    #Sample
-    return res
+
+    #Sample, inverting the CDF by linear interpolation
+    return np.interp(r, CDF, xt)
+
+
+# In[ ]:
+
+#Cache of inverse CDF tables of noise likelihoods, keyed by (likelihood, photon level, specification), holding at most inverseCDFCacheSize tables. The least recently used table is discarded first
+inverseCDFCacheSize = 1000
+_inverseCDFCache = collections.OrderedDict()
+
+def get_Inverse_CDF_Table(phot, spec, noiseFunc = PN_Likelihood):
+    #Returns the CDF, and the grid of counts on which it is tabulated, of the likelihood noiseFunc(phot, spec), for use in inverse sampling (see inverse_Sample_Table). Tables are cached, so that repeated photon levels (across pixels, images or runs in this process) reuse them
+    key = (noiseFunc, float(phot), tuple(sorted(spec.items())))
+    if(key in _inverseCDFCache):
+        table = _inverseCDFCache.pop(key)
+    else:
+        xt, ft = noiseFunc(phot, spec)
+        table = (get_CDF(xt, ft), xt)
+        while(len(_inverseCDFCache) >= inverseCDFCacheSize):
+            _inverseCDFCache.popitem(last = False)
+    _inverseCDFCache[key] = table
+
+    return table
+
+def inverse_Sample_Table(phot, spec, nSamples = 1, noiseFunc = PN_Likelihood, random = np.random):
+    #Draws nSamples from the likelihood noiseFunc(phot, spec) by inverse sampling, using the cached CDF table (see get_Inverse_CDF_Table)
+    CDF, xt = get_Inverse_CDF_Table(phot, spec, noiseFunc)
+    return np.interp(random.rand(nSamples), CDF, xt)
 
 
 # In[ ]:
@@ -0,0 +1,119 @@
+"""
+Module containing a streaming accumulator for the mean and variance of a set of measured parameters, used to summarise large numbers of realisations (e.g. in the bias runs) without storing each measurement. The accumulator is a dictionary holding the number of samples, the mean and the sum of squared deviations from the mean (M2) for each parameter, and is updated using Welford's algorithm (single samples) or the pairwise merge of Chan et al. (batches, or accumulators built elsewhere such as on separate processes), so that each update is O(1) per sample and independent of the number of samples already seen.
+
+Author: cajd
+"""
+import numpy as np
+
+def initialise_Running_Statistics(nPar):
+    """
+    Returns an empty running statistics accumulator for nPar parameters.
+
+    Requires:
+    -- nPar: number of parameters measured per sample
+
+    Returns:
+    -- stats: dictionary with keys `n` (number of samples), `mean` and `M2` (sum of squared deviations from mean), the latter being [nPar] arrays
+    """
+    return {'n':0, 'mean':np.zeros(nPar), 'M2':np.zeros(nPar)}
+
+def get_Batch_Running_Statistics(samples):
+    """
+    Returns a running statistics accumulator built from a batch of samples.
+
+    Requires:
+    -- samples: [nSample, nPar] array of measurements (or [nPar] for a single sample)
+
+    Returns:
+    -- stats: running statistics accumulator for the batch (see initialise_Running_Statistics)
+    """
+    samples = np.atleast_2d(np.asarray(samples, dtype = float))
+    if(samples.shape[0] == 0):
+        return initialise_Running_Statistics(samples.shape[1])
+
+    mean = samples.mean(axis = 0)
+    return {'n':samples.shape[0], 'mean':mean, 'M2':np.power(samples-mean, 2).sum(axis = 0)}
+
+def merge_Running_Statistics(stats, other):
+    """
+    Merges the accumulator other into stats, in place, so that stats summarises the samples of both. This is exact (up to rounding) regardless of how the samples were split between the two.
+
+    Requires:
+    -- stats: running statistics accumulator, updated in place
+    -- other: running statistics accumulator to merge in. Not modified
+
+    Returns:
+    -- stats: the updated accumulator
+    """
+    if(stats['mean'].shape != other['mean'].shape):
+        raise ValueError('merge_Running_Statistics - accumulators are over a different number of parameters: '+str(stats['mean'].shape)+' '+str(other['mean'].shape))
+
+    if(other['n'] == 0):
+        return stats
+
+    n = stats['n'] + other['n']
+    delta = other['mean'] - stats['mean']
+    stats['mean'] = stats['mean'] + delta*(float(other['n'])/n)
+    stats['M2'] = stats['M2'] + other['M2'] + delta*delta*(float(stats['n'])*other['n']/n)
+    stats['n'] = n
+    return stats
+
+def update_Running_Statistics(stats, samples):
+    """
+    Updates the accumulator stats, in place, with a single sample or a batch of samples.
+
+    Requires:
+    -- stats: running statistics accumulator, updated in place
+    -- samples: [nPar] array for a single sample, or [nSample, nPar] for a batch
+
+    Returns:
+    -- stats: the updated accumulator
+    """
+    samples = np.asarray(samples, dtype = float)
+    if(samples.ndim == 1):
+        ## Welford update for a single sample
+        stats['n'] += 1
+        delta = samples - stats['mean']
+        stats['mean'] = stats['mean'] + delta/stats['n']
+        stats['M2'] = stats['M2'] + delta*(samples - stats['mean'])
+        return stats
+
+    return merge_Running_Statistics(stats, get_Batch_Running_Statistics(samples))
+
+def get_Running_Statistics(stats, ddof = 0):
+    """
+    Returns the mean, standard deviation and error on the mean for each parameter of the accumulator.
+
+    Requires:
+    -- stats: running statistics accumulator
+    -- ddof: delta degrees of freedom used for the variance (as np.std). Default of 0 matches np.std.
+
+    Returns:
+    -- Mean, StD, MeanStD: [nPar] arrays. NaN where there are too few samples
+    """
+    n = stats['n']
+    if(n - ddof <= 0):
+        nan = np.nan*np.ones(stats['mean'].shape)
+        return (stats['mean'].copy() if n > 0 else nan), nan, nan
+
+    StD = np.sqrt(stats['M2']/(n - ddof))
+    return stats['mean'].copy(), StD, StD/np.sqrt(n)
+
+def percentError_Reached(stats, truth, percentError):
+    """
+    Stopping test used by the bias runs: returns True if the error on the mean of every parameter is below percentError percent of the bias (mean - truth).
+
+    Requires:
+    -- stats: running statistics accumulator
+    -- truth: [nPar] input parameter values, from which the bias is measured
+    -- percentError: required percentage error on the bias
+
+    Returns:
+    -- reached: boolean
+    -- Bias, MeanStD, percent: [nPar] arrays, for reporting
+    """
+    Mean, StD, MeanStD = get_Running_Statistics(stats)
+    Bias = Mean - np.asarray(truth)
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        percent = np.absolute(100.*(MeanStD/Bias))
+    return bool((percent < percentError).all()), Bias, MeanStD, percent
@@ -7,39 +7,19 @@ Touch Date: 16 June 2015
 
 import numpy as np
 
-def gaussian_SBProfile_Sympy(xy, cen, isigma, ie1, ie2, iItot, K = 0., g1 = 0., g2 = 0., der = [], printOnly = False, suppressLensing = True, printStyle = 'CPP'):
+def gaussian_SBProfile_Sympy_Expression(suppressLensing = True):
     import sympy as sp
     """
-    Uses symbolic python pacakge (SymPy) to evaluate function and its derivatives analytically, including symbolic output. As symbolic, this is noticably slow, so should not be used as part of main routine except to debug.
+    Returns the SymPy expression for the elliptical Gaussian surface brightness profile, and a dictionary of the SymPy symbols it depends upon (size, e1, e2, flux, dx, dy, K, g1, g2). Used by gaussian_SBProfile_Sympy, and as the definition from which the C++ kernels are generated (src/generate_SB_Kernels.py).
 
     Requires:
-    -- xy: Grid [x,y] over which SB profile is evaluated
-    -- cen: Centroid [x,y]
-    -- isigma: Size of SB profile
-    -- ie1, ie2: Ellipticity components of SB profile
-    -- iTOT: Total integrated flux, corresponding to amplitude of profile in Gaussian case.
-    -- K, g1, g2: Lensing Parameters
-    ---der: Sets the parameters to be differentiated with respect to. The size of each sub-list sets the order of differentiation. e.g. to return SB profile, use der = [] (or leave at default. To get d2I/dr2: der = ['size', 'size'], an To get d2I/drde1: der = ['size', 'e1'] etc.
-    -- printOnly: default False - If true, only output the symbolic result to screen. If false, evaluate and return the result
     --suppressLensing: default True -  if True, ignore the lensing contribution
-    -- printStyle: default CPP - If CPP, output to screen in C++ form
-
     """
-    ## Edit this to pass in model parameters
     from math import pi
 
-    ## Set up sympy definition of the profile
-
     #Symbols
-    size = sp.Symbol('size')
-    e1 = sp.Symbol('e1')
-    e2 = sp.Symbol('e2')
-    flux = sp.Symbol('flux')
-    dx = sp.Symbol('dx')
-    dy = sp.Symbol('dy')
-    K = sp.Symbol('K')
-    g1 = sp.Symbol('g1')
-    g2 = sp.Symbol('g2')
+    sym = dict([[k, sp.Symbol(k)] for k in ['size', 'e1', 'e2', 'flux', 'dx', 'dy', 'K', 'g1', 'g2']])
+    size, e1, e2, flux, dx, dy, K, g1, g2 = [sym[k] for k in ['size', 'e1', 'e2', 'flux', 'dx', 'dy', 'K', 'g1', 'g2']]
 
     ##Matrices
     Q = (size**2)*sp.Matrix([[(1-e1), e2],[e2, 1+e1]])
@@ -53,6 +33,31 @@ def gaussian_SBProfile_Sympy(xy, cen, isigma, ie1, ie2, iItot, K = 0., g1 = 0.,
     Pref = flux/(2.*pi*(Q.det()**0.5)) ##Sqrt detQ
     Surf = Pref*sp.exp(-0.5*rvec.transpose()*Q.inv()*rvec)
 
+    return Surf[0], sym
+
+def gaussian_SBProfile_Sympy(xy, cen, isigma, ie1, ie2, iItot, K = 0., g1 = 0., g2 = 0., der = [], printOnly = False, suppressLensing = True, printStyle = 'CPP'):
+    import sympy as sp
+    """
+    Uses symbolic python pacakge (SymPy) to evaluate function and its derivatives analytically, including symbolic output. As symbolic, this is noticably slow, so should not be used as part of main routine except to debug.
+
+    Requires:
+    -- xy: Grid [x,y] over which SB profile is evaluated
+    -- cen: Centroid [x,y]
+    -- isigma: Size of SB profile
+    -- ie1, ie2: Ellipticity components of SB profile
+    -- iTOT: Total integrated flux, corresponding to amplitude of profile in Gaussian case.
+    -- K, g1, g2: Lensing Parameters
+    ---der: Sets the parameters to be differentiated with respect to. The size of each sub-list sets the order of differentiation. e.g. to return SB profile, use der = [] (or leave at default. To get d2I/dr2: der = ['size', 'size'], an To get d2I/drde1: der = ['size', 'e1'] etc.
+    -- printOnly: default False - If true, only output the symbolic result to screen. If false, evaluate and return the result
+    --suppressLensing: default True -  if True, ignore the lensing contribution
+    -- printStyle: default CPP - If CPP, output to screen in C++ form
+
+    """
+    ## Set up sympy definition of the profile
+    Surf, sym = gaussian_SBProfile_Sympy_Expression(suppressLensing = suppressLensing)
+    dx, dy, size, e1, e2, flux = sym['dx'], sym['dy'], sym['size'], sym['e1'], sym['e2'], sym['flux']
+    Surf = sp.Matrix([Surf])
+
     ##Create function of surface brightness profile to specified order of differentiation
     dSurf = Surf
     for dd in range(len(der)):
@@ -270,7 +275,40 @@ def init_SRCPath():
 
     
 ### C++ implemnations of surface brightness profiles and derivatives
-def gaussian_SBProfile_CXX(xy, cen, isigma, ie1, ie2, iItot, der = []):
+def set_CXX_Threads(nThreads = 0):
+    """
+    Sets the number of threads over which the rows of the grid are split in the C++ SB kernels (gaussian_SBProfile_CXX and gaussian_SBProfile_CXX_Bundle). This is only effective if the C++ module was compiled with OpenMP (see src/swig_setup.py), and small grids are always evaluated serially.
+
+    The kernels release the GIL while they run, so models may also be rendered concurrently from Python threads: in that case, it is usually best to leave the kernels single-threaded (nThreads = 1).
+
+    Requires:
+    -- nThreads: Number of threads. nThreads <= 0 uses all available threads.
+
+    Returns:
+    -- The number of threads set (1 if the C++ module was compiled without OpenMP)
+    """
+    init_SRCPath()
+    import surface_Brightness_Profiles_CXX as cxxSB
+
+    return cxxSB.set_GaussSB_Threads(int(nThreads))
+
+def get_CXX_Threads():
+    """
+    Returns the number of threads used by the C++ SB kernels (see set_CXX_Threads)
+    """
+    init_SRCPath()
+    import surface_Brightness_Profiles_CXX as cxxSB
+
+    return cxxSB.get_GaussSB_Threads()
+
+## Map between derivative labels (sorted) and the C++ kernel used to evaluate them, and whether the flux is set to unity (for the Gaussian, d/dflux just takes flux -> 1 as SB is linear in flux)
+_CXXGaussSBKernels = {():('cxx_GaussSB_Array', False), ('flux',):('cxx_GaussSB_Array', True),
+                      ('size',):('cxx_GaussSB_dT_Array', False), ('e1',):('cxx_GaussSB_de1_Array', False), ('e2',):('cxx_GaussSB_de2_Array', False),
+                      ('e1','e1'):('cxx_GaussSB_dde1_Array', False), ('e2','e2'):('cxx_GaussSB_dde2_Array', False), ('size','size'):('cxx_GaussSB_ddT_Array', False),
+                      ('flux','size'):('cxx_GaussSB_dTdF_Array', False), ('e1','size'):('cxx_GaussSB_de1dT_Array', False), ('e2','size'):('cxx_GaussSB_de2dT_Array', False),
+                      ('e1','e2'):('cxx_GaussSB_de1de2_Array', False)}
+
+def gaussian_SBProfile_CXX(xy, cen, isigma, ie1, ie2, iItot, der = [], out = None):
     """
     Routine that produces the SB profile and its derivatives using C++ code..
 
@@ -278,6 +316,8 @@ def gaussian_SBProfile_CXX(xy, cen, isigma, ie1, ie2, iItot, der = []):
 
     The evaluation of the SB profile and its derivatives in the presence of a lensing field is involved using this method, therefore it has been neglected for now (The application of the method itself does not require lensing paramaters where the shear is taken as the average across a sample [e.g. ring test], however the simulation of sheared images may require this. In this case, only the lensed surface brightness profile itself is required, and this may be more easily implemented in the full matrix formalism of gaussian_SBProfile_Py in Python (numpy)
 
+    The C++ kernels are called through their numpy interface (cxx_GaussSB*_Array), which reads the grid in place and writes the result directly into the output array, so no copies are made between Python and C++.
+
     Required:
     -- xy: Grid [x,y] over which SB profile is evaluated
     -- cen: Centroid [x,y]
@@ -285,87 +325,94 @@ def gaussian_SBProfile_CXX(xy, cen, isigma, ie1, ie2, iItot, der = []):
     -- ie1, ie2: Ellipticity components of SB profile
     -- iTOT: Total integrated flux, corresponding to amplitude of profile in Gaussian case.
     ---der: Sets the parameters to be differentiated with respect to. The size of each sub-list sets the order of differentiation. e.g. to return SB profile, use der = [] (or leave at default. To get d2I/dr2: der = ['size', 'size'], an To get d2I/drde1: der = ['size', 'e1'] etc.
+    ---out: Optional [len(xy[0]), len(xy[1])] C-contiguous float64 array into which the result is written. If None, a new array is created.
 
     Returns:
-    --SB: surface brightness profile evaluated according to input parameters and derivative labels, on grid specified by xy.
+    --SB: surface brightness profile evaluated according to input parameters and derivative labels, on grid specified by xy. This is `out' where entered.
     """
     
     import numpy as np
 
-    dx = xy[0]-cen[0]
-    dy = xy[1]-cen[1]
+    dx = np.ascontiguousarray(xy[0]-cen[0], dtype = np.float64)
+    dy = np.ascontiguousarray(xy[1]-cen[1], dtype = np.float64)
 
     if(cen[0] > xy[0].max() or cen[0] < xy[0].min()):
         raise ValueError('gaussian_SBProfile_Weave - Centroid (x) lies outwith the range of the PS, FATAL :'+str(cen))
     if(cen[1] > xy[1].max() or cen[1] < xy[1].min()):
         raise ValueError('gaussian_SBProfile_Weave - Centroid (y) lies outwith the range of the PS, FATAL :'+str(cen))
 
+    if(out is None):
+        SB = np.empty((dx.shape[0], dy.shape[0]))
+    else:
+        SB = out
+        if(SB.shape != (dx.shape[0], dy.shape[0]) or SB.dtype != np.float64 or not SB.flags['C_CONTIGUOUS']):
+            raise ValueError('gaussian_SBProfile_CXX - out must be a C-contiguous float64 array of shape '+str((dx.shape[0], dy.shape[0])))
+
+    key = tuple(sorted(der))
+    if(key == ('flux', 'flux')):
+        #Do nothing as SB is zeros
+        SB[...] = 0.
+        return SB
+    if(key not in _CXXGaussSBKernels):
+        raise RuntimeError('CXX run not coded up for derivative:',str(der))
+    kernel, unitFlux = _CXXGaussSBKernels[key]
+
     ##Rename variables to fit in with Sympy output
     e1 = ie1
     e2 = ie2
     size = isigma
-    flux = iItot
-
-    #Depreacted?
-    Var = ['SB', 'flux', 'e1', 'e2', 'size', 'dx', 'dy']
-    Args = [float(flux), float(e1), float(e2), float(size), dx, dy]
+    if(unitFlux):
+        flux = 1.
+    else:
+        flux = iItot
 
     #-- NOTE : If this throws an exception, its likely that the addition of the src path to sys in init did not go well
     init_SRCPath()
     import surface_Brightness_Profiles_CXX as cxxSB
-    
-    if(len(der) == 0):
-        ##SB profile directly
-        SB = cxxSB.cxx_GaussSB(*Args)
-
-    elif(der == ['flux']):
-        Args[0] = 1.
-        SB = cxxSB.cxx_GaussSB(*Args)
 
-    elif(der == ['size']):
-        SB = cxxSB.cxx_GaussSB_dT(*Args)
+    getattr(cxxSB, kernel)(float(flux), float(e1), float(e2), float(size), dx, dy, SB)
 
-    elif(der == ['e1']):
-        SB = cxxSB.cxx_GaussSB_de1(*Args)
+    return SB
 
-    elif(der == ['e2']):
-        SB = cxxSB.cxx_GaussSB_de2(*Args)
+## Labels of the SB parameters held in the output of gaussian_SBProfile_CXX_Bundle, in order
+bundleLabels_CXX = ['size', 'e1', 'e2']
 
-    elif(der == ['e1','e1']):
-        SB = cxxSB.cxx_GaussSB_dde1(*Args)
+def gaussian_SBProfile_CXX_Bundle(xy, cen, isigma, ie1, ie2, iItot, out = None):
+    """
+    Routine that produces the SB profile, and all of its first and second derivatives with respect to [size, e1, e2], in a single pass over the grid using the fused C++ kernel (cxx_GaussSB_Bundle_Array). Subexpressions common to all derivatives (e.g. the exponential) are evaluated only once per grid point.
 
-    elif(der == ['e2','e2']):
-        SB = cxxSB.cxx_GaussSB_dde2(*Args)
+    Required:
+    -- xy, cen, isigma, ie1, ie2, iItot: as gaussian_SBProfile_CXX
+    ---out: Optional [10, len(xy[0]), len(xy[1])] C-contiguous float64 array into which the result is written. If None, a new array is created.
 
-    elif(der == ['size','size']):
-        SB = cxxSB.cxx_GaussSB_ddT(*Args)
+    Returns:
+    --SB: [10, len(xy[0]), len(xy[1])] array containing, in order: SB; the first derivatives wrt size, e1, e2; the upper triangle of second derivatives (size,size), (size,e1), (size,e2), (e1,e1), (e1,e2), (e2,e2).
+    """
 
-    elif(der == ['flux', 'flux']):
-        #Do nothing as SB is zeros
-        SB = np.zeros((dx.shape[0], dy.shape[0]))
+    import numpy as np
 
-    elif(der == ['size', 'flux'] or der == ['flux', 'size']):
-        #Use the fact that d/dflux just takes flux -> 1 (for guassian which is linear in flux)
-        Args[0] = 1.
-        SB = cxxSB.cxx_GaussSB_dT(*Args)
+    dx = np.ascontiguousarray(xy[0]-cen[0], dtype = np.float64)
+    dy = np.ascontiguousarray(xy[1]-cen[1], dtype = np.float64)
 
-    elif(der == ['size','e1'] or der == ['e1','size'] ):
-        SB = cxxSB.cxx_GaussSB_de1dT(*Args)
+    if(cen[0] > xy[0].max() or cen[0] < xy[0].min()):
+        raise ValueError('gaussian_SBProfile_CXX_Bundle - Centroid (x) lies outwith the range of the PS, FATAL :'+str(cen))
+    if(cen[1] > xy[1].max() or cen[1] < xy[1].min()):
+        raise ValueError('gaussian_SBProfile_CXX_Bundle - Centroid (y) lies outwith the range of the PS, FATAL :'+str(cen))
 
-    elif(der == ['size','e2'] or der == ['e2','size'] ):
-        SB = cxxSB.cxx_GaussSB_de2dT(*Args)
+    nBundle = 1 + len(bundleLabels_CXX) + (len(bundleLabels_CXX)*(len(bundleLabels_CXX)+1))/2
+    if(out is None):
+        SB = np.empty((nBundle, dx.shape[0], dy.shape[0]))
+    else:
+        SB = out
+        if(SB.shape != (nBundle, dx.shape[0], dy.shape[0]) or SB.dtype != np.float64 or not SB.flags['C_CONTIGUOUS']):
+            raise ValueError('gaussian_SBProfile_CXX_Bundle - out must be a C-contiguous float64 array of shape '+str((nBundle, dx.shape[0], dy.shape[0])))
 
-    elif(der == ['e1','e2'] or der == ['e2','e1'] ):
-        SB = cxxSB.cxx_GaussSB_de1de2(*Args)
+    init_SRCPath()
+    import surface_Brightness_Profiles_CXX as cxxSB
 
-    else:
-        raise RuntimeError('CXX run not coded up for derivative:',str(der))
+    cxxSB.cxx_GaussSB_Bundle_Array(float(iItot), float(ie1), float(ie2), float(isigma), dx, dy, SB)
 
-    #Cast into numpy form
-    SB = np.array(SB)
-    SB = SB.reshape((dx.shape[0], dy.shape[0]))
-    
-    return SB.copy()
+    return SB
 
 
 
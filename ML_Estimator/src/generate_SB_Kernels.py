@@ -0,0 +1,276 @@
+"""
+Generates the C++ surface brightness kernels (surface_Brightness_Profiles_CXX.cxx and .h) from the SymPy definition of the SB profile (gaussian_SBProfile_Sympy_Expression in python/surface_Brightness_Profiles.py).
+
+Each kernel is reduced using SymPy common subexpression elimination (cse), and the subexpressions are hoisted to the outermost loop level at which they can be evaluated: those depending only on the model parameters are evaluated once per call, those depending on dx only once per row, and only the remainder per pixel. Integer and half-integer powers are written as multiplications (and sqrt) rather than pow. When compiled with OpenMP, the rows of each kernel are split across threads (see set_GaussSB_Threads). The fused kernel (cxx_GaussSB_Bundle_Array) is reduced jointly across the profile and all its first and second derivatives, so that subexpressions shared between these are evaluated once.
+
+Usage (from src/, see Makefile target `kernels'):
+python generate_SB_Kernels.py
+
+To add a profile derivative, add an entry to `kernels' below and regenerate, then declare the new routine in surface_Brightness_Profiles_CXX.i and re-run swig.
+
+Author: cajd
+"""
+import os
+import sys
+import sympy as sp
+
+try:
+    from sympy.printing.ccode import C89CodePrinter as _CPrinter
+except ImportError:
+    from sympy.printing.ccode import CCodePrinter as _CPrinter
+from sympy.printing.precedence import PRECEDENCE
+
+srcPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(1, os.path.join(srcPath, '..', 'python'))
+from surface_Brightness_Profiles import gaussian_SBProfile_Sympy_Expression
+
+## Kernel name and derivative labels for each seperate kernel generated
+kernels = [['cxx_GaussSB', []],
+           ['cxx_GaussSB_dT', ['size']], ['cxx_GaussSB_de1', ['e1']], ['cxx_GaussSB_de2', ['e2']],
+           ['cxx_GaussSB_dde1', ['e1', 'e1']], ['cxx_GaussSB_dde2', ['e2', 'e2']], ['cxx_GaussSB_ddT', ['size', 'size']],
+           ['cxx_GaussSB_de1dT', ['e1', 'size']], ['cxx_GaussSB_de2dT', ['e2', 'size']], ['cxx_GaussSB_de1de2', ['e1', 'e2']],
+           ['cxx_GaussSB_dTdF', ['size', 'flux']]]
+
+## Parameters included in the fused kernel: output is ordered as SB, first derivatives, then upper triangle of second derivatives. Must match bundleLabels_CXX in surface_Brightness_Profiles.py
+bundleLabels = ['size', 'e1', 'e2']
+
+arguments = 'double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY'
+bundleArguments = 'double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSB, int nSBX, int nSBY'
+vectorArguments = 'double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy'
+
+
+class KernelPrinter(_CPrinter):
+    """
+    C printer which writes dx, dy as the current grid points, and integer and half-integer powers as products (and sqrt) rather than calls to pow.
+    """
+
+    def _print_Symbol(self, expr):
+        if(expr.name == 'dx'):
+            return 'dx[i]'
+        elif(expr.name == 'dy'):
+            return 'dy[j]'
+        return _CPrinter._print_Symbol(self, expr)
+
+    def _print_Pow(self, expr):
+        exponent = expr.exp
+        if(exponent.is_Number and (2*exponent).is_Number and float(2*exponent) == int(float(2*exponent))):
+            twice = int(float(2*exponent))
+            nInt = abs(twice)//2
+            base = self.parenthesize(expr.base, PRECEDENCE['Mul'])
+            factors = [base]*nInt
+            if(abs(twice)%2 == 1):
+                factors.append('sqrt(%s)' % self._print(expr.base))
+            if(len(factors) == 0):
+                return '1.0'
+            product = '*'.join(factors)
+            if(len(factors) > 1):
+                product = '(%s)' % product
+            if(twice > 0):
+                return product
+            return '(1.0/%s)' % product
+        return _CPrinter._print_Pow(self, expr)
+
+printer = KernelPrinter()
+
+def hoist(replacements, reduced, loopSymbols):
+    """
+    Sorts the cse replacements into those evaluated per call (level 0), per row (level 1: depends on dx) and per pixel (level 2: depends on dy). Any subexpression of a per-row or per-pixel term which can be evaluated at an outer level is further removed to that level, so that e.g. the normalisation of the profile is evaluated once per call.
+    Returns levels, a list of the [symbol, expression] assignments at each level, and the per-pixel output expressions
+    """
+    level = dict([[loopSymbols[0], 1], [loopSymbols[1], 2]])
+    levels = [[], [], []]
+    newSymbols = sp.numbered_symbols('h')
+
+    def get_Level(expr):
+        return max([0]+[level.get(f, 0) for f in expr.free_symbols])
+
+    def extract(expr, lev):
+        ## Replaces maximal subtrees of expr which are of a lower level than lev with new symbols, assigned at that level
+        if(expr.is_Atom):
+            return expr
+        exprLev = get_Level(expr)
+        if(exprLev < lev):
+            symbol = next(newSymbols)
+            level[symbol] = exprLev
+            levels[exprLev].append([symbol, extract(expr, exprLev)])
+            return symbol
+        if(expr.is_Add or expr.is_Mul):
+            outer = [a for a in expr.args if get_Level(a) < lev]
+            inner = [extract(a, lev) for a in expr.args if get_Level(a) == lev]
+            if(len(outer) > 1):
+                outer = [extract(expr.func(*outer), lev)]
+            else:
+                outer = [extract(a, lev) for a in outer]
+            return expr.func(*(outer+inner))
+        return expr.func(*[extract(a, lev) for a in expr.args])
+
+    for symbol, expr in replacements:
+        lev = get_Level(expr)
+        expr = extract(expr, lev)
+        level[symbol] = lev
+        levels[lev].append([symbol, expr])
+    reduced = [extract(expr, 2) for expr in reduced]
+    return levels, reduced
+
+def write_Assignments(assignments, indent):
+    return ''.join(['%sconst double %s = %s;\n' % (indent, printer.doprint(s), printer.doprint(e)) for s, e in assignments])
+
+def write_Kernel(name, args, expressions, outIndex, check):
+    """
+    Returns the C++ source of a kernel evaluating expressions at each grid point, with output written to SB[outIndex[k]].
+    """
+    replacements, reduced = sp.cse(expressions, symbols = sp.numbered_symbols('x'), optimizations = 'basic')
+    levels, reduced = hoist(replacements, reduced, loopSym)
+
+    code = 'void %s(%s)\n{\n' % (name, args)
+    code += check
+    code += write_Assignments(levels[0], '  ')
+    code += '#ifdef _OPENMP\n  const int nThreads = get_GaussSB_Loop_Threads(nX, nY);\n  #pragma omp parallel for num_threads(nThreads) if(nThreads > 1)\n#endif\n'
+    code += '  for (int i = 0; i < nX; i++){\n'
+    code += write_Assignments(levels[1], '    ')
+    code += '    for (int j = 0; j < nY; j++){\n'
+    code += write_Assignments(levels[2], '      ')
+    for k, expr in enumerate(reduced):
+        code += '      SB[%s] = %s;\n' % (outIndex[k], printer.doprint(expr))
+    code += '    }\n  }\n}\n'
+    return code
+
+def write_Vector_Wrapper(name):
+    return '''std::vector<double> %(name)s(%(args)s)
+{
+  std::vector<double> SB(dx.size()*dy.size(), 0.);
+  %(name)s_Array(flux, e1, e2, size, &dx[0], dx.size(), &dy[0], dy.size(), &SB[0], dx.size(), dy.size());
+  return SB;
+}
+''' % dict(name = name, args = vectorArguments)
+
+
+Surf, symbols = gaussian_SBProfile_Sympy_Expression()
+loopSym = [symbols['dx'], symbols['dy']]
+
+def differentiate(der):
+    """
+    Returns the derivative of the SB profile with respect to the parameters labelled in der. Integral floats are replaced with integers, so that terms such as (e1 + 1) and (e1 + 1.0) are identified as common by cse.
+    """
+    dSurf = Surf
+    for d in der:
+        dSurf = sp.diff(dSurf, symbols[d])
+    return dSurf.xreplace(dict([(f, sp.Integer(int(f))) for f in dSurf.atoms(sp.Float) if f == int(f)]))
+
+if __name__ == "__main__":
+
+    header = '''// ---- GENERATED by generate_SB_Kernels.py from the SymPy definition of the SB profile (surface_Brightness_Profiles.gaussian_SBProfile_Sympy_Expression). Do not edit by hand: edit the generator and run `make kernels'.
+
+'''
+
+    cxx = header + '''#include <vector>
+#include <cmath>
+#include <cstddef>
+#include <stdexcept>
+#include "surface_Brightness_Profiles_CXX.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+//---------- GAUSSIAN Surface Brightness Profiles (Flattened). In all of the below, the arguments list goes as:
+// flux (scalar)
+// e1 - Component of ellipticty along x,y axis
+// e2 - Component of ellipticity along x+y, x-y axis
+// size  - Width of gaussian (scales as sigma^2 = size^2*(|e|^2 - 1)
+// dx: std::vector of doubles giving the distance from the centroid (of each pixel)
+// dy: as dx, in y-direction
+// - NOTE: Uses only size, e1, e2 --> NO implementation of mag, shear
+//
+// Each profile is implemented as a pointer-based kernel (suffix _Array), which reads dx [nX] and dy [nY] in place and writes into the caller-provided, row-major SB [nSBX, nSBY] array (which must have nSBX == nX, nSBY == nY).
+// These are exposed to Python through the numpy.i typemaps in surface_Brightness_Profiles_CXX.i, so that numpy arrays are passed without copying.
+// The std::vector versions are retained as thin wrappers around these.
+//
+// If compiled with OpenMP (-fopenmp, see swig_setup.py), the rows of each grid are split across set_GaussSB_Threads(n) threads. The Python interface releases the GIL while the kernels run.
+
+
+//---------- Output dimension check, used by all kernels
+
+void check_GaussSB_Dimensions(int nX, int nY, int nSBX, int nSBY)
+{
+  if(nSBX != nX || nSBY != nY){
+    throw std::invalid_argument("cxx_GaussSB - output array dimensions do not match [len(dx), len(dy)]");
+  }
+}
+
+//---------- Thread control. Default is single-threaded; grids with fewer than minParallelPixels_GaussSB pixels are always evaluated in serial, as the thread overhead outweighs the gain
+
+static int nThreads_GaussSB = 1;
+static const int minParallelPixels_GaussSB = 4096;
+
+int set_GaussSB_Threads(int nThreads)
+{
+#ifdef _OPENMP
+  if(nThreads <= 0){
+    nThreads = omp_get_max_threads();
+  }
+  nThreads_GaussSB = nThreads;
+#else
+  nThreads_GaussSB = 1;
+#endif
+  return nThreads_GaussSB;
+}
+
+int get_GaussSB_Threads()
+{
+  return nThreads_GaussSB;
+}
+
+int get_GaussSB_Loop_Threads(int nX, int nY)
+{
+  if(static_cast<long>(nX)*nY < minParallelPixels_GaussSB){
+    return 1;
+  }
+  return (nThreads_GaussSB < nX ? nThreads_GaussSB : nX);
+}
+
+'''
+    h = header + '''#include <vector>
+#include <cmath>
+
+//----------------- Output dimension check for pointer-based (_Array) kernels
+void check_GaussSB_Dimensions(int nX, int nY, int nSBX, int nSBY);
+
+//----------------- Thread control (OpenMP): nThreads <= 0 uses all available threads. Returns the number of threads set, which is always 1 if compiled without OpenMP
+int set_GaussSB_Threads(int nThreads);
+int get_GaussSB_Threads();
+int get_GaussSB_Loop_Threads(int nX, int nY);
+
+'''
+
+    check = '  check_GaussSB_Dimensions(nX, nY, nSBX, nSBY);\n'
+    for name, der in kernels:
+        print 'Generating', name, der
+        cxx += '//---------- %s: %s\n\n' % (name, ('SB profile' if len(der) == 0 else 'd^%dSB/d%s' % (len(der), 'd'.join(der))))
+        cxx += write_Kernel(name+'_Array', arguments, [differentiate(der)], ['i*nY + j'], check) + '\n'
+        cxx += write_Vector_Wrapper(name) + '\n'
+        h += 'std::vector<double> %s(%s);\n' % (name, vectorArguments)
+        h += 'void %s_Array(%s);\n\n' % (name, arguments)
+
+    ## Fused kernel
+    print 'Generating fused kernel for', bundleLabels
+    nB = len(bundleLabels)
+    bundleDer = [[]] + [[l] for l in bundleLabels] + [[bundleLabels[i], bundleLabels[j]] for i in range(nB) for j in range(i, nB)]
+    bundleCheck = check + '''  if(nSB != %d){
+    throw std::invalid_argument("cxx_GaussSB_Bundle - output array must contain %d planes [SB, first derivatives, upper triangle of second derivatives]");
+  }
+  const std::size_t plane(static_cast<std::size_t>(nX)*nY);
+''' % (len(bundleDer), len(bundleDer))
+    cxx += '''//---------- Fused SB profile, first and second derivatives
+// Output SB [%d, nX, nY] holds, in order: %s
+// Common subexpressions across all of these are evaluated once.
+
+''' % (len(bundleDer), ', '.join(['SB' if len(d) == 0 else 'd(%s)' % ','.join(d) for d in bundleDer]))
+    cxx += write_Kernel('cxx_GaussSB_Bundle_Array', bundleArguments, [differentiate(d) for d in bundleDer], ['%d*plane + i*nY + j' % k if k > 0 else 'i*nY + j' for k in range(len(bundleDer))], bundleCheck)
+    h += '//----------------- Fused SB profile, 1st and 2nd order derivatives, written into SB [%d, nX, nY]\n' % len(bundleDer)
+    h += 'void cxx_GaussSB_Bundle_Array(%s);\n' % bundleArguments
+
+    with open(os.path.join(srcPath, 'surface_Brightness_Profiles_CXX.cxx'), 'w') as f:
+        f.write(cxx)
+    with open(os.path.join(srcPath, 'surface_Brightness_Profiles_CXX.h'), 'w') as f:
+        f.write(h)
+    print 'Written surface_Brightness_Profiles_CXX.cxx, surface_Brightness_Profiles_CXX.h'
@@ -1,8 +1,13 @@
+// ---- GENERATED by generate_SB_Kernels.py from the SymPy definition of the SB profile (surface_Brightness_Profiles.gaussian_SBProfile_Sympy_Expression). Do not edit by hand: edit the generator and run `make kernels'.
+
 #include <vector>
 #include <cmath>
-
-//Internal defintion of size_t
-typedef unsigned int size_t;
+#include <cstddef>
+#include <stdexcept>
+#include "surface_Brightness_Profiles_CXX.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 
 //---------- GAUSSIAN Surface Brightness Profiles (Flattened). In all of the below, the arguments list goes as:
 // flux (scalar)
@@ -12,164 +17,945 @@ typedef unsigned int size_t;
 // dx: std::vector of doubles giving the distance from the centroid (of each pixel)
 // dy: as dx, in y-direction
 // - NOTE: Uses only size, e1, e2 --> NO implementation of mag, shear
+//
+// Each profile is implemented as a pointer-based kernel (suffix _Array), which reads dx [nX] and dy [nY] in place and writes into the caller-provided, row-major SB [nSBX, nSBY] array (which must have nSBX == nX, nSBY == nY).
+// These are exposed to Python through the numpy.i typemaps in surface_Brightness_Profiles_CXX.i, so that numpy arrays are passed without copying.
+// The std::vector versions are retained as thin wrappers around these.
+//
+// If compiled with OpenMP (-fopenmp, see swig_setup.py), the rows of each grid are split across set_GaussSB_Threads(n) threads. The Python interface releases the GIL while the kernels run.
 
 
-//---------- Direct SB profile
+//---------- Output dimension check, used by all kernels
 
-std::vector<double> cxx_GaussSB(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+void check_GaussSB_Dimensions(int nX, int nY, int nSBX, int nSBY)
 {
-  const size_t nX(dx.size());
-  const size_t nY(dy.size());
-  std::vector<double> SB(nX*nY, 0.);
-  for (size_t i = 0; i < nX; i++){
-    for (size_t j = 0; j < nY; j++){
-      SB[i*nX + j] = 0.159154943091895*flux*pow(-pow(e1,2)*pow(size,4) - pow(e2,2)*pow(size,4) + pow(size,4),-0.5)*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2) - 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2) + pow(e2,2) - 1.0)));
-    }
+  if(nSBX != nX || nSBY != nY){
+    throw std::invalid_argument("cxx_GaussSB - output array dimensions do not match [len(dx), len(dy)]");
   }
-  return SB;
 }
 
-//---------- First Order Derivatives
+//---------- Thread control. Default is single-threaded; grids with fewer than minParallelPixels_GaussSB pixels are always evaluated in serial, as the thread overhead outweighs the gain
 
-std::vector<double> cxx_GaussSB_dT(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+static int nThreads_GaussSB = 1;
+static const int minParallelPixels_GaussSB = 4096;
+
+int set_GaussSB_Threads(int nThreads)
+{
+#ifdef _OPENMP
+  if(nThreads <= 0){
+    nThreads = omp_get_max_threads();
+  }
+  nThreads_GaussSB = nThreads;
+#else
+  nThreads_GaussSB = 1;
+#endif
+  return nThreads_GaussSB;
+}
+
+int get_GaussSB_Threads()
 {
-  const size_t nX(dx.size());
-  const size_t nY(dy.size());
-  std::vector<double> SB(nX*nY, 0.);
-  for (size_t i = 0; i < nX; i++){
-    for (size_t j = 0; j < nY; j++){
-      SB[i*nX + j] = 0.159154943091895*flux*(2.0*pow(e1,2)*pow(size,3 )+ 2.0*pow(e2,2)*pow(size,3 )- 2.0*pow(size,3))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) - 0.159154943091895*flux*pow((-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4)),(-0.5))*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))/(pow(size,3)*(pow(e1,2 )+pow(e2,2 )- 1.0));
+  return nThreads_GaussSB;
+}
+
+int get_GaussSB_Loop_Threads(int nX, int nY)
+{
+  if(static_cast<long>(nX)*nY < minParallelPixels_GaussSB){
+    return 1;
+  }
+  return (nThreads_GaussSB < nX ? nThreads_GaussSB : nX);
+}
+
+//---------- cxx_GaussSB: SB profile
+
+void cxx_GaussSB_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY)
+{
+  check_GaussSB_Dimensions(nX, nY, nSBX, nSBY);
+  const double x0 = (e2*e2);
+  const double x1 = e1 + 1;
+  const double x2 = x1*(1 - e1);
+  const double x3 = -x0 + x2;
+  const double h0 = -e2;
+  const double h3 = (1.0/x3);
+  const double h4 = e1 - 1;
+  const double h6 = (1.0/(x0 - x2));
+  const double h7 = -0.5/(size*size);
+  const double h8 = 0.15915494309189535*flux*(1.0/sqrt((size*size*size*size)*x3));
+#ifdef _OPENMP
+  const int nThreads = get_GaussSB_Loop_Threads(nX, nY);
+  #pragma omp parallel for num_threads(nThreads) if(nThreads > 1)
+#endif
+  for (int i = 0; i < nX; i++){
+    const double h1 = dx[i]*x1;
+    const double h2 = dx[i]*h3;
+    const double h5 = dx[i]*e2;
+    for (int j = 0; j < nY; j++){
+      SB[i*nY + j] = h8*exp(h7*(dy[j]*h6*(dy[j]*h4 + h5) + h2*(dy[j]*h0 + h1)));
     }
   }
+}
+
+std::vector<double> cxx_GaussSB(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+{
+  std::vector<double> SB(dx.size()*dy.size(), 0.);
+  cxx_GaussSB_Array(flux, e1, e2, size, &dx[0], dx.size(), &dy[0], dy.size(), &SB[0], dx.size(), dy.size());
   return SB;
 }
 
-std::vector<double> cxx_GaussSB_de1(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+//---------- cxx_GaussSB_dT: d^1SB/dsize
+
+void cxx_GaussSB_dT_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY)
 {
-  const size_t nX(dx.size());
-  const size_t nY(dy.size());
-  std::vector<double> SB(nX*nY, 0.);
-  for (size_t i = 0; i < nX; i++){
-    for (size_t j = 0; j < nY; j++){
-      SB[i*nX + j] = 0.159154943091895*e1*flux*pow(size,4)*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))+ 0.159154943091895*flux*(-1.0*e1*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2) )+ 0.5*(pow(dx[i],2 )- pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-0.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) ;
+  check_GaussSB_Dimensions(nX, nY, nSBX, nSBY);
+  const double x1 = e1 - 1;
+  const double x3 = (e2*e2);
+  const double x4 = e1 + 1;
+  const double x5 = x4*(1 - e1);
+  const double x6 = x3 - x5;
+  const double x7 = (1.0/x6);
+  const double x12 = -x3 + x5;
+  const double x13 = (1.0/x12);
+  const double x15 = (size*size*size);
+  const double x16 = x1*x4 + x3;
+  const double x17 = (size*size*size*size)*x12;
+  const double x18 = 2.0*x16*x7;
+  const double x19 = 2.0*x13*x6;
+  const double h0 = -x19;
+  const double h3 = -0.15915494309189535*(1.0/sqrt(x17))/x15;
+  const double h4 = 0.31830988618379069*x15*x16*(1.0/(x17*sqrt(x17)));
+  const double h5 = -0.5/(size*size);
+#ifdef _OPENMP
+  const int nThreads = get_GaussSB_Loop_Threads(nX, nY);
+  #pragma omp parallel for num_threads(nThreads) if(nThreads > 1)
+#endif
+  for (int i = 0; i < nX; i++){
+    const double x0 = dx[i]*e2;
+    const double x10 = dx[i]*x4;
+    const double x14 = dx[i]*x13;
+    const double h1 = x10*x19;
+    const double h2 = x0*x18 - x0;
+    for (int j = 0; j < nY; j++){
+      const double x2 = dy[j]*x1;
+      const double x8 = dy[j]*x7;
+      const double x9 = dy[j]*e2;
+      const double x11 = x10 - x9;
+      SB[i*nY + j] = flux*(h3*(x14*(h0*x9 + h1 + x11) - x8*(h2 + x18*x2 - x2)) + h4)*exp(h5*(x11*x14 + x8*(x0 + x2)));
     }
   }
+}
+
+std::vector<double> cxx_GaussSB_dT(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+{
+  std::vector<double> SB(dx.size()*dy.size(), 0.);
+  cxx_GaussSB_dT_Array(flux, e1, e2, size, &dx[0], dx.size(), &dy[0], dy.size(), &SB[0], dx.size(), dy.size());
   return SB;
 }
 
+//---------- cxx_GaussSB_de1: d^1SB/de1
 
-std::vector<double> cxx_GaussSB_de2(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+void cxx_GaussSB_de1_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY)
 {
-  const size_t nX(dx.size());
-  const size_t nY(dy.size());
-  std::vector<double> SB(nX*nY, 0.);
-  for (size_t i = 0; i < nX; i++){
-    for (size_t j = 0; j < nY; j++){
-      SB[i*nX + j] = 0.159154943091895*e2*flux*pow(size,4)*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.159154943091895*flux*(-1.0*dx[i]*dy[j]/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)) - 1.0*e2*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2)))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-0.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)));
+  check_GaussSB_Dimensions(nX, nY, nSBX, nSBY);
+  const double x0 = (1.0/(size*size));
+  const double h0 = e1 - 1;
+  const double x3 = (e2*e2);
+  const double x4 = e1 + 1;
+  const double x5 = x4*(1 - e1);
+  const double x6 = (1.0/(x3 - x5));
+  const double x10 = -x3 + x5;
+  const double x11 = (1.0/x10);
+  const double x13 = (size*size*size*size);
+  const double x14 = x10*x13;
+  const double x15 = 1.0*e1;
+  const double x16 = x15*x6;
+  const double x17 = x11*x15;
+  const double h2 = -x17;
+  const double h5 = x0*(1.0/sqrt(x14));
+  const double h6 = e1*x13*(1.0/(x14*sqrt(x14)));
+  const double h7 = -0.5*x0;
+  const double h8 = 0.15915494309189535*flux;
+#ifdef _OPENMP
+  const int nThreads = get_GaussSB_Loop_Threads(nX, nY);
+  #pragma omp parallel for num_threads(nThreads) if(nThreads > 1)
+#endif
+  for (int i = 0; i < nX; i++){
+    const double x1 = dx[i]*e2;
+    const double x9 = dx[i]*x4;
+    const double x12 = dx[i]*x11;
+    const double h1 = x1*x16;
+    const double h3 = 0.5*dx[i] + x17*x9;
+    const double h4 = -x12;
+    for (int j = 0; j < nY; j++){
+      const double x2 = dy[j]*h0;
+      const double x7 = dy[j]*x6;
+      const double x8 = dy[j]*e2;
+      SB[i*nY + j] = h8*(h5*(h4*(h2*x8 + h3) + x7*(-0.5*dy[j] + h1 + x16*x2)) + h6)*exp(h7*(x12*(-x8 + x9) + x7*(x1 + x2)));
     }
   }
+}
+
+std::vector<double> cxx_GaussSB_de1(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+{
+  std::vector<double> SB(dx.size()*dy.size(), 0.);
+  cxx_GaussSB_de1_Array(flux, e1, e2, size, &dx[0], dx.size(), &dy[0], dy.size(), &SB[0], dx.size(), dy.size());
   return SB;
 }
-				
-//--------------------- 2nd Order Derivatives
-//__ Auto Terms
 
-std::vector<double> cxx_GaussSB_dde1(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+//---------- cxx_GaussSB_de2: d^1SB/de2
+
+void cxx_GaussSB_de2_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY)
 {
-  const size_t nX(dx.size());
-  const size_t nY(dy.size());
-  std::vector<double> SB(nX*nY, 0.);
-  for (size_t i = 0; i < nX; i++){
-    for (size_t j = 0; j < nY; j++){
-      SB[i*nX + j] = 0.477464829275686*pow(e1,2)*flux*pow(size,8)*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-2.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.318309886183791*e1*flux*pow(size,4)*(-1.0*e1*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2) )+ 0.5*(pow(dx[i],2 )- pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.159154943091895*flux*pow(size,4)*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.159154943091895*flux*pow(-1.0*e1*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2) )+ 0.5*(pow(dx[i],2 )- pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)),2)*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-0.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.159154943091895*flux*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-0.5))*(4.0*pow(e1,2)*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,3) )- 2.0*e1*(pow(dx[i],2 )- pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2) )- 1.0*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2)))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)));
+  check_GaussSB_Dimensions(nX, nY, nSBX, nSBY);
+  const double x0 = (1.0/(size*size));
+  const double x1 = e1 - 1;
+  const double x2 = (e2*e2);
+  const double x3 = e1 + 1;
+  const double x4 = x3*(1 - e1);
+  const double x5 = (1.0/(x2 - x4));
+  const double x9 = -x2 + x4;
+  const double x10 = (size*size*size*size);
+  const double x11 = x10*x9;
+  const double x12 = (1.0/(x1*x3 + x2));
+  const double h0 = x1*x12;
+  const double h2 = x12*x2;
+  const double h3 = -x2;
+  const double h5 = e2*x5;
+  const double h7 = -x5;
+  const double h8 = x0*(1.0/sqrt(x11));
+  const double h9 = e2*x10*(1.0/(x11*sqrt(x11)));
+  const double h12 = (1.0/x9);
+  const double h13 = -0.5*x0;
+  const double h14 = 0.15915494309189535*flux;
+#ifdef _OPENMP
+  const int nThreads = get_GaussSB_Loop_Threads(nX, nY);
+  #pragma omp parallel for num_threads(nThreads) if(nThreads > 1)
+#endif
+  for (int i = 0; i < nX; i++){
+    const double x8 = dx[i]*x3;
+    const double h1 = dx[i]*h2 - 0.5*dx[i];
+    const double h4 = h5*x8;
+    const double h6 = dx[i]*h7;
+    const double h10 = dx[i]*e2;
+    const double h11 = dx[i]*h12;
+    for (int j = 0; j < nY; j++){
+      const double x6 = dy[j]*x5;
+      const double x7 = dy[j]*e2;
+      SB[i*nY + j] = h14*(h8*(dy[j]*x12*(h0*x7 + h1) + h6*(0.5*dy[j] + h3*x6 + h4)) + h9)*exp(h13*(h11*(-x7 + x8) + x6*(dy[j]*x1 + h10)));
     }
   }
+}
+
+std::vector<double> cxx_GaussSB_de2(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+{
+  std::vector<double> SB(dx.size()*dy.size(), 0.);
+  cxx_GaussSB_de2_Array(flux, e1, e2, size, &dx[0], dx.size(), &dy[0], dy.size(), &SB[0], dx.size(), dy.size());
   return SB;
 }
 
-std::vector<double> cxx_GaussSB_dde2(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+//---------- cxx_GaussSB_dde1: d^2SB/de1de1
+
+void cxx_GaussSB_dde1_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY)
 {
-  const size_t nX(dx.size());
-  const size_t nY(dy.size());
-  std::vector<double> SB(nX*nY, 0.);
-  for (size_t i = 0; i < nX; i++){
-    for (size_t j = 0; j < nY; j++){
-      SB[i*nX + j] = 0.477464829275686*pow(e2,2)*flux*pow(size,8)*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-2.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.318309886183791*e2*flux*pow(size,4)*(-1.0*dx[i]*dy[j]/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)) - 1.0*e2*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2)))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.159154943091895*flux*pow(size,4)*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.159154943091895*flux*pow(-1.0*dx[i]*dy[j]/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)) - 1.0*e2*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2)),2)*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-0.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.159154943091895*flux*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-0.5))*(4.0*dx[i]*dy[j]*e2/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2) )+ 4.0*pow(e2,2)*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,3) )- 1.0*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2)))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)));
+  check_GaussSB_Dimensions(nX, nY, nSBX, nSBY);
+  const double x0 = (size*size);
+  const double x1 = (1.0/x0);
+  const double h0 = e1 - 1;
+  const double x5 = (e2*e2);
+  const double x6 = e1 + 1;
+  const double x7 = x6*(1 - e1);
+  const double x8 = x5 - x7;
+  const double x9 = (1.0/x8);
+  const double x14 = -x5 + x7;
+  const double x15 = (1.0/x14);
+  const double x17 = (size*size*size*size);
+  const double x18 = x14*x17;
+  const double x19 = (1.0/(x18*sqrt(x18)));
+  const double x20 = (e1*e1);
+  const double x21 = 1.0*e1;
+  const double x22 = x21*x9;
+  const double h1 = -x21;
+  const double x26 = 0.15915494309189535*(1.0/sqrt(x18));
+  const double x27 = 2*e1;
+  const double x28 = 4.0*x20;
+  const double x29 = x28*x9;
+  const double h4 = x26/x17;
+  const double h5 = -x28;
+  const double h7 = 4*x20;
+  const double h9 = (1.0/(x14*x14));
+  const double h10 = -x29;
+  const double h12 = -x29;
+  const double h13 = -1/(x8*x8);
+  const double h14 = -x1*x26;
+  const double h15 = -0.31830988618379069*e1*x0*x19;
+  const double h16 = 0.47746482927568601*(size*size*size*size*size*size*size*size)*(1.0/(x18*x18*sqrt(x18)))*x20 + 0.15915494309189535*x17*x19;
+  const double h17 = -0.5*x1;
+#ifdef _OPENMP
+  const int nThreads = get_GaussSB_Loop_Threads(nX, nY);
+  #pragma omp parallel for num_threads(nThreads) if(nThreads > 1)
+#endif
+  for (int i = 0; i < nX; i++){
+    const double x2 = dx[i]*e2;
+    const double x12 = dx[i]*x6;
+    const double x16 = dx[i]*x15;
+    const double x24 = x12*x15;
+    const double h2 = 0.5*dx[i] + x21*x24;
+    const double h3 = x2*x22;
+    const double h6 = dx[i]*x27 + h7*x24;
+    const double h8 = dx[i]*h9;
+    const double h11 = h12*x2;
+    for (int j = 0; j < nY; j++){
+      const double x3 = dy[j]*h0;
+      const double x4 = x2 + x3;
+      const double x10 = dy[j]*x9;
+      const double x11 = dy[j]*e2;
+      const double x13 = -x11 + x12;
+      const double x23 = x11*x15;
+      const double x25 = -x10*(-0.5*dy[j] + h3 + x22*x3) + x16*(h1*x23 + h2);
+      SB[i*nY + j] = flux*(h14*(dy[j]*h13*(dy[j]*x27 + h10*x3 + h11 + x4) + h8*(h5*x23 + h6 + x13)) + h15*x25 + h16 + h4*(x25*x25))*exp(h17*(x10*x4 + x13*x16));
     }
   }
+}
+
+std::vector<double> cxx_GaussSB_dde1(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+{
+  std::vector<double> SB(dx.size()*dy.size(), 0.);
+  cxx_GaussSB_dde1_Array(flux, e1, e2, size, &dx[0], dx.size(), &dy[0], dy.size(), &SB[0], dx.size(), dy.size());
   return SB;
 }
 
+//---------- cxx_GaussSB_dde2: d^2SB/de2de2
 
-std::vector<double> cxx_GaussSB_ddT(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+void cxx_GaussSB_dde2_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY)
 {
-  const size_t nX(dx.size());
-  const size_t nY(dy.size());
-  std::vector<double> SB(nX*nY, 0.);
-  for (size_t i = 0; i < nX; i++){
-    for (size_t j = 0; j < nY; j++){
-      SB[i*nX + j] = 0.159154943091895*flux*(6.0*pow(e1,2)*pow(size,2 )+ 6.0*pow(e2,2)*pow(size,2 )- 6.0*pow(size,2))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.159154943091895*flux*(2.0*pow(e1,2)*pow(size,3 )+ 2.0*pow(e2,2)*pow(size,3 )- 2.0*pow(size,3))*(6.0*pow(e1,2)*pow(size,3 )+ 6.0*pow(e2,2)*pow(size,3 )- 6.0*pow(size,3))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-2.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) - 0.318309886183791*flux*(2.0*pow(e1,2)*pow(size,3 )+ 2.0*pow(e2,2)*pow(size,3 )- 2.0*pow(size,3))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))/(pow(size,3)*(pow(e1,2 )+ pow(e2,2 )- 1.0)) + 0.477464829275686*flux*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-0.5))*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))/(pow(size,4)*(pow(e1,2 )+ pow(e2,2 )- 1.0)) + 0.159154943091895*flux*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-0.5))*pow(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2),2)*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))/(pow(size,6)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2));
+  check_GaussSB_Dimensions(nX, nY, nSBX, nSBY);
+  const double x0 = (size*size);
+  const double x1 = (1.0/x0);
+  const double x3 = e1 - 1;
+  const double x5 = (e2*e2);
+  const double x6 = e1 + 1;
+  const double x7 = x6*(1 - e1);
+  const double x8 = x5 - x7;
+  const double x9 = (1.0/x8);
+  const double x13 = -x5 + x7;
+  const double x14 = (1.0/x13);
+  const double x15 = (size*size*size*size);
+  const double x16 = x13*x15;
+  const double x17 = (1.0/(x16*sqrt(x16)));
+  const double x18 = (1.0/(x3*x6 + x5));
+  const double h0 = -x5;
+  const double h2 = e2*x9;
+  const double h4 = e2*x18;
+  const double h6 = x18*x5;
+  const double x21 = 0.15915494309189535*(1.0/sqrt(x16));
+  const double x22 = 4*(e2*e2*e2);
+  const double x23 = 4*x5;
+  const double h7 = x21/x15;
+  const double h8 = -x14*x22;
+  const double h10 = x14*x23;
+  const double h12 = (1.0/(x13*x13));
+  const double h13 = -x23*x9;
+  const double h15 = -x22;
+  const double h16 = -1/(x8*x8);
+  const double h17 = -x1*x21;
+  const double h18 = 0.31830988618379069*e2*x0*x17;
+  const double h19 = 0.47746482927568601*(size*size*size*size*size*size*size*size)*(1.0/(x16*x16*sqrt(x16)))*x5 + 0.15915494309189535*x15*x17;
+  const double h21 = -0.5*x1;
+#ifdef _OPENMP
+  const int nThreads = get_GaussSB_Loop_Threads(nX, nY);
+  #pragma omp parallel for num_threads(nThreads) if(nThreads > 1)
+#endif
+  for (int i = 0; i < nX; i++){
+    const double x2 = dx[i]*e2;
+    const double x12 = dx[i]*x6;
+    const double x19 = dx[i]*x9;
+    const double h1 = h2*x12;
+    const double h3 = -x19;
+    const double h5 = dx[i]*h6 - 0.5*dx[i];
+    const double h9 = h10*x12 + x12;
+    const double h11 = dx[i]*h12;
+    const double h14 = h15*x19 + 3*x2;
+    const double h20 = dx[i]*x14;
+    for (int j = 0; j < nY; j++){
+      const double x4 = dy[j]*x3;
+      const double x10 = dy[j]*x9;
+      const double x11 = dy[j]*e2;
+      const double x20 = dy[j]*x18*(h4*x4 + h5) + h3*(0.5*dy[j] + h0*x10 + h1);
+      SB[i*nY + j] = flux*(h17*(dy[j]*h16*(h13*x4 + h14 + x4) + h11*(dy[j]*h8 + h9 - 3*x11)) + h18*x20 + h19 + h7*(x20*x20))*exp(h21*(h20*(-x11 + x12) + x10*(x2 + x4)));
     }
   }
+}
+
+std::vector<double> cxx_GaussSB_dde2(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+{
+  std::vector<double> SB(dx.size()*dy.size(), 0.);
+  cxx_GaussSB_dde2_Array(flux, e1, e2, size, &dx[0], dx.size(), &dy[0], dy.size(), &SB[0], dx.size(), dy.size());
   return SB;
 }
 
-//__ Cross Terms
+//---------- cxx_GaussSB_ddT: d^2SB/dsizedsize
 
-std::vector<double> cxx_GaussSB_de1dT(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+void cxx_GaussSB_ddT_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY)
 {
-  const size_t nX(dx.size());
-  const size_t nY(dy.size());
-  std::vector<double> SB(nX*nY, 0.);
-  for (size_t i = 0; i < nX; i++){
-    for (size_t j = 0; j < nY; j++){
-      SB[i*nX + j] = 0.159154943091895*e1*flux*pow(size,4)*(6.0*pow(e1,2)*pow(size,3 )+ 6.0*pow(e2,2)*pow(size,3 )- 6.0*pow(size,3))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-2.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.636619772367581*e1*flux*pow(size,3)*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) - 0.159154943091895*e1*flux*size*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))/(pow(e1,2 )+ pow(e2,2 )- 1.0) + 0.159154943091895*flux*(2.0*e1*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,3)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2) )- 1.0*(pow(dx[i],2 )- pow(dy[j],2))/(pow(size,3)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-0.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.159154943091895*flux*(-1.0*e1*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2) )+ 0.5*(pow(dx[i],2 )- pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))*(2.0*pow(e1,2)*pow(size,3 )+ 2.0*pow(e2,2)*pow(size,3 )- 2.0*pow(size,3))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) - 0.159154943091895*flux*(-1.0*e1*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2) )+ 0.5*(pow(dx[i],2 )- pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-0.5))*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))/(pow(size,3)*(pow(e1,2 )+ pow(e2,2 )- 1.0));
+  check_GaussSB_Dimensions(nX, nY, nSBX, nSBY);
+  const double x0 = (size*size);
+  const double x2 = e1 - 1;
+  const double x4 = (e2*e2);
+  const double x5 = e1 + 1;
+  const double x6 = x5*(1 - e1);
+  const double x7 = x4 - x6;
+  const double x8 = (1.0/x7);
+  const double x13 = -x4 + x6;
+  const double x14 = (1.0/x13);
+  const double x16 = (size*size*size*size);
+  const double x17 = x13*x16;
+  const double x18 = x2*x5 + x4;
+  const double x19 = (1.0/(x17*sqrt(x17)))*x18;
+  const double x20 = (size*size*size*size*size*size);
+  const double x21 = (x18*x18);
+  const double x22 = x18*x8;
+  const double x23 = 2.0*x22;
+  const double x25 = x14*x7;
+  const double x26 = 2.0*x25;
+  const double h1 = -x26;
+  const double x28 = 0.15915494309189535*(1.0/sqrt(x17));
+  const double x29 = 14.0*x22;
+  const double x30 = (x7*x7);
+  const double x31 = 16.0*x21/x30;
+  const double x32 = 16.0*x30/(x13*x13);
+  const double x33 = 14.0*x25;
+  const double h4 = -0.63661977236758138*x19;
+  const double h5 = x28/x20;
+  const double h6 = -x32;
+  const double h7 = -x33;
+  const double h9 = -x31;
+  const double h11 = -x31;
+  const double h12 = -x28/x16;
+  const double h13 = 0.95492965855137202*x0*x19 + 1.909859317102744*(1.0/(x17*x17*sqrt(x17)))*x20*x21;
+  const double h14 = -0.5/x0;
+#ifdef _OPENMP
+  const int nThreads = get_GaussSB_Loop_Threads(nX, nY);
+  #pragma omp parallel for num_threads(nThreads) if(nThreads > 1)
+#endif
+  for (int i = 0; i < nX; i++){
+    const double x1 = dx[i]*e2;
+    const double x11 = dx[i]*x5;
+    const double x15 = dx[i]*x14;
+    const double h0 = -x1;
+    const double h2 = x11*x26;
+    const double h3 = x1*x23;
+    const double h8 = x11*x32 + x11*x33;
+    const double h10 = h11*x1 + x1*x29;
+    for (int j = 0; j < nY; j++){
+      const double x3 = dy[j]*x2;
+      const double x9 = dy[j]*x8;
+      const double x10 = dy[j]*e2;
+      const double x12 = -x10 + x11;
+      const double x24 = h0 - x3;
+      const double x27 = x15*(h1*x10 + h2 + x12) - x9*(h3 + x23*x3 + x24);
+      SB[i*nY + j] = flux*(h12*(x15*(h6*x10 + h7*x10 + h8 + x12) - x9*(h10 + h9*x3 + x24 + x29*x3)) + h13 + h4*x27 + h5*(x27*x27))*exp(h14*(x12*x15 + x9*(x1 + x3)));
     }
   }
+}
+
+std::vector<double> cxx_GaussSB_ddT(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+{
+  std::vector<double> SB(dx.size()*dy.size(), 0.);
+  cxx_GaussSB_ddT_Array(flux, e1, e2, size, &dx[0], dx.size(), &dy[0], dy.size(), &SB[0], dx.size(), dy.size());
   return SB;
 }
 
-std::vector<double> cxx_GaussSB_de2dT(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+//---------- cxx_GaussSB_de1dT: d^2SB/de1dsize
+
+void cxx_GaussSB_de1dT_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY)
 {
-  const size_t nX(dx.size());
-  const size_t nY(dy.size());
-  std::vector<double> SB(nX*nY, 0.);
-  for (size_t i = 0; i < nX; i++){
-    for (size_t j = 0; j < nY; j++){
-      SB[i*nX + j] = 0.159154943091895*e2*flux*pow(size,4)*(6.0*pow(e1,2)*pow(size,3 )+ 6.0*pow(e2,2)*pow(size,3 )- 6.0*pow(size,3))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-2.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.636619772367581*e2*flux*pow(size,3)*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) - 0.159154943091895*e2*flux*size*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))/(pow(e1,2 )+ pow(e2,2 )- 1.0) + 0.159154943091895*flux*(2.0*dx[i]*dy[j]/(pow(size,3)*(pow(e1,2 )+ pow(e2,2 )- 1.0)) + 2.0*e2*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,3)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2)))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-0.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.159154943091895*flux*(-1.0*dx[i]*dy[j]/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)) - 1.0*e2*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2)))*(2.0*pow(e1,2)*pow(size,3 )+ 2.0*pow(e2,2)*pow(size,3 )- 2.0*pow(size,3))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) - 0.159154943091895*flux*(-1.0*dx[i]*dy[j]/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)) - 1.0*e2*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2)))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-0.5))*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))/(pow(size,3)*(pow(e1,2 )+ pow(e2,2 )- 1.0));
+  check_GaussSB_Dimensions(nX, nY, nSBX, nSBY);
+  const double x1 = e1 - 1;
+  const double x3 = (e2*e2);
+  const double x4 = e1 + 1;
+  const double x5 = x4*(1 - e1);
+  const double x6 = x3 - x5;
+  const double x7 = (1.0/x6);
+  const double x12 = -x3 + x5;
+  const double x13 = (1.0/x12);
+  const double x15 = (size*size*size);
+  const double x16 = (size*size*size*size)*x12;
+  const double x17 = (1.0/(x16*sqrt(x16)));
+  const double x18 = e1*x17;
+  const double x19 = x1*x4 + x3;
+  const double x20 = e1*x19;
+  const double x22 = 1.0*e1;
+  const double x24 = x13*x22;
+  const double h1 = -x24;
+  const double x26 = 2.0*x19;
+  const double x27 = 2.0*x6;
+  const double x28 = x13*x27;
+  const double h5 = -x28;
+  const double x30 = 0.15915494309189535*(1.0/sqrt(x16));
+  const double x31 = 6.0*e1;
+  const double x32 = 8.0*x20/(x6*x6);
+  const double x33 = x13*x31;
+  const double x34 = 8.0*e1*x6/(x12*x12);
+  const double h8 = -x32;
+  const double h10 = -x32;
+  const double h11 = -x33;
+  const double h12 = -x34;
+  const double h15 = x30/x15;
+  const double h16 = 0.15915494309189535*size*x18;
+  const double h17 = x30/(size*size*size*size*size);
+  const double h18 = 0.31830988618379069*size*x17*x19;
+  const double h19 = 0.95492965855137202*(size*size*size*size*size*size*size)*(1.0/(x16*x16*sqrt(x16)))*x20 + 0.63661977236758138*x15*x18;
+  const double h20 = -0.5/(size*size);
+#ifdef _OPENMP
+  const int nThreads = get_GaussSB_Loop_Threads(nX, nY);
+  #pragma omp parallel for num_threads(nThreads) if(nThreads > 1)
+#endif
+  for (int i = 0; i < nX; i++){
+    const double x0 = dx[i]*e2;
+    const double x10 = dx[i]*x4;
+    const double x14 = dx[i]*x13;
+    const double x21 = x0*x7;
+    const double h0 = x21*x22;
+    const double h2 = 0.5*dx[i] + x10*x24;
+    const double h3 = -x14;
+    const double h4 = -x0 + x21*x26;
+    const double h6 = x10*x28;
+    const double h7 = -x14;
+    const double h9 = h10*x0 + x21*x31;
+    const double h13 = dx[i] + x10*x33 + x10*x34 + x14*x27;
+    const double h14 = -x14;
+    for (int j = 0; j < nY; j++){
+      const double x2 = dy[j]*x1;
+      const double x8 = dy[j]*x7;
+      const double x9 = dy[j]*e2;
+      const double x11 = x10 - x9;
+      const double x23 = x2*x7;
+      const double x25 = h3*(h1*x9 + h2) + x8*(-0.5*dy[j] + h0 + x22*x23);
+      const double x29 = h7*(h5*x9 + h6 + x11) + x8*(h4 - x2 + x23*x26);
+      SB[i*nY + j] = flux*(h15*(h14*(h11*x9 + h12*x9 + h13) + x8*(-dy[j] + h8*x2 + h9 + x23*x31 + x26*x8)) + h16*x29 + h17*x25*x29 + h18*x25 + h19)*exp(h20*(x11*x14 + x8*(x0 + x2)));
     }
   }
+}
+
+std::vector<double> cxx_GaussSB_de1dT(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+{
+  std::vector<double> SB(dx.size()*dy.size(), 0.);
+  cxx_GaussSB_de1dT_Array(flux, e1, e2, size, &dx[0], dx.size(), &dy[0], dy.size(), &SB[0], dx.size(), dy.size());
   return SB;
 }
 
+//---------- cxx_GaussSB_de2dT: d^2SB/de2dsize
 
-std::vector<double> cxx_GaussSB_de1de2(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+void cxx_GaussSB_de2dT_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY)
 {
-  const size_t nX(dx.size());
-  const size_t nY(dy.size());
-  std::vector<double> SB(nX*nY, 0.);
-  for (size_t i = 0; i < nX; i++){
-    for (size_t j = 0; j < nY; j++){
-      SB[i*nX + j] = 0.477464829275686*e1*e2*flux*pow(size,8)*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-2.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.159154943091895*e1*flux*pow(size,4)*(-1.0*dx[i]*dy[j]/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)) - 1.0*e2*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2)))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.159154943091895*e2*flux*pow(size,4)*(-1.0*e1*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2) )+ 0.5*(pow(dx[i],2 )- pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-1.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.159154943091895*flux*(-1.0*dx[i]*dy[j]/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)) - 1.0*e2*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2)))*(-1.0*e1*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2) )+ 0.5*(pow(dx[i],2 )- pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)))*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-0.5))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0))) + 0.159154943091895*flux*pow(-pow(e1,2)*pow(size,4 )- pow(e2,2)*pow(size,4 )+ pow(size,4),(-0.5))*(2.0*dx[i]*dy[j]*e1/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2) )+ 4.0*e1*e2*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,3) )- 1.0*e2*(pow(dx[i],2 )- pow(dy[j],2))/(pow(size,2)*pow(pow(e1,2 )+ pow(e2,2 )- 1.0,2)))*exp(0.5*(pow(dx[i],2)*e1 + pow(dx[i],2 )- 2.0*dx[i]*dy[j]*e2 - pow(dy[j],2)*e1 + pow(dy[j],2))/(pow(size,2)*(pow(e1,2 )+ pow(e2,2 )- 1.0)));
+  check_GaussSB_Dimensions(nX, nY, nSBX, nSBY);
+  const double x1 = e1 - 1;
+  const double x3 = (e2*e2);
+  const double x4 = e1 + 1;
+  const double x5 = x4*(1 - e1);
+  const double x6 = x3 - x5;
+  const double x7 = (1.0/x6);
+  const double x12 = -x3 + x5;
+  const double x13 = (1.0/x12);
+  const double x15 = (size*size*size);
+  const double x16 = (size*size*size*size)*x12;
+  const double x17 = (1.0/(x16*sqrt(x16)));
+  const double x18 = e2*x17;
+  const double x19 = x1*x4 + x3;
+  const double x20 = (1.0/x19);
+  const double h1 = -x3;
+  const double x27 = 2.0*x19;
+  const double x28 = x27*x7;
+  const double x29 = 2.0*x13*x6;
+  const double h4 = -x29;
+  const double x31 = 8*x19/(x6*x6);
+  const double x32 = 0.15915494309189535*(1.0/sqrt(x16));
+  const double h7 = -2*x3;
+  const double h9 = 2*x20;
+  const double h10 = -6*x7;
+  const double h12 = -x27;
+  const double h13 = -6*x3;
+  const double h14 = x3*x31;
+  const double h15 = x32/x15;
+  const double h16 = -0.15915494309189535*size*x18;
+  const double h17 = -x32/(size*size*size*size*size);
+  const double h18 = 0.31830988618379069*size*x17*x19;
+  const double h19 = 0.95492965855137202*e2*(size*size*size*size*size*size*size)*(1.0/(x16*x16*sqrt(x16)))*x19 + 0.63661977236758138*x15*x18;
+  const double h20 = -0.5/(size*size);
+#ifdef _OPENMP
+  const int nThreads = get_GaussSB_Loop_Threads(nX, nY);
+  #pragma omp parallel for num_threads(nThreads) if(nThreads > 1)
+#endif
+  for (int i = 0; i < nX; i++){
+    const double x0 = dx[i]*e2;
+    const double x10 = dx[i]*x4;
+    const double x14 = dx[i]*x13;
+    const double x21 = dx[i]*x20;
+    const double x24 = e2*x10;
+    const double x25 = dx[i]*x7;
+    const double h0 = -0.5*dx[i] + x21*x3;
+    const double h2 = x24*x7;
+    const double h3 = -x25;
+    const double h5 = x10*x29;
+    const double h6 = x0*x28 - x0;
+    const double h8 = h9*x24;
+    const double h11 = dx[i]*h14 + dx[i] + h12*x25 + h13*x25;
+    for (int j = 0; j < nY; j++){
+      const double x2 = dy[j]*x1;
+      const double x8 = dy[j]*x7;
+      const double x9 = dy[j]*e2;
+      const double x11 = x10 - x9;
+      const double x22 = x1*x9;
+      const double x23 = dy[j]*x20;
+      const double x26 = h3*(0.5*dy[j] + h1*x8 + h2) + x23*(h0 + x20*x22);
+      const double x30 = x14*(h4*x9 + h5 + x11) - x8*(h6 + x2*x28 - x2);
+      SB[i*nY + j] = flux*(h15*(x21*(1.0*dy[j] + h7*x23 + h8) - x8*(h10*x22 + h11 + x22*x31)) + h16*x30 + h17*x26*x30 + h18*x26 + h19)*exp(h20*(x11*x14 + x8*(x0 + x2)));
     }
   }
+}
+
+std::vector<double> cxx_GaussSB_de2dT(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+{
+  std::vector<double> SB(dx.size()*dy.size(), 0.);
+  cxx_GaussSB_de2dT_Array(flux, e1, e2, size, &dx[0], dx.size(), &dy[0], dy.size(), &SB[0], dx.size(), dy.size());
   return SB;
 }
 
-std::vector<double> cxx_GaussSB_dTdF(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+//---------- cxx_GaussSB_de1de2: d^2SB/de1de2
+
+void cxx_GaussSB_de1de2_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY)
 {
-  //THIS NEEDS WRITTEN
-  const size_t nX(dx.size());
-  const size_t nY(dy.size());
-  std::vector<double> SB(nX*nY, 0.);
-  for (size_t i = 0; i < nX; i++){
-    for (size_t j = 0; j < nY; j++){
-      SB[i*nX + j] = 0.;
+  check_GaussSB_Dimensions(nX, nY, nSBX, nSBY);
+  const double x0 = (size*size);
+  const double x1 = (1.0/x0);
+  const double x3 = e1 - 1;
+  const double x5 = (e2*e2);
+  const double x6 = e1 + 1;
+  const double x7 = x6*(1 - e1);
+  const double x8 = x5 - x7;
+  const double x9 = (1.0/x8);
+  const double x13 = -x5 + x7;
+  const double x14 = (1.0/x13);
+  const double x16 = (size*size*size*size);
+  const double x17 = x13*x16;
+  const double x18 = 0.15915494309189535*x0*(1.0/(x17*sqrt(x17)));
+  const double h0 = x5*x9;
+  const double h1 = x3*x9;
+  const double h3 = -x6;
+  const double x25 = 1.0*e1;
+  const double x26 = x14*x25;
+  const double h5 = x25*x9;
+  const double h7 = -x26;
+  const double x28 = 4*e1;
+  const double x29 = x14*x28;
+  const double x30 = 0.15915494309189535*(1.0/sqrt(x17));
+  const double h10 = e1*x18;
+  const double h11 = e2*x18;
+  const double h12 = -x28;
+  const double h14 = -x28;
+  const double h15 = (1.0/(x8*x8));
+  const double h16 = -x25;
+  const double h17 = -x29*x5;
+  const double h19 = x29*x6;
+  const double h21 = -1/(x13*x13);
+  const double h22 = x1*x30;
+  const double h23 = x30/x16;
+  const double h24 = 0.47746482927568601*e1*e2*(size*size*size*size*size*size*size*size)*(1.0/(x17*x17*sqrt(x17)));
+  const double h25 = -0.5*x1;
+#ifdef _OPENMP
+  const int nThreads = get_GaussSB_Loop_Threads(nX, nY);
+  #pragma omp parallel for num_threads(nThreads) if(nThreads > 1)
+#endif
+  for (int i = 0; i < nX; i++){
+    const double x2 = dx[i]*e2;
+    const double x12 = dx[i]*x6;
+    const double x15 = dx[i]*x14;
+    const double x19 = 0.5*dx[i];
+    const double x20 = dx[i]*h0;
+    const double x23 = x2*x9;
+    const double h2 = h3*x23;
+    const double h4 = -x19 + x20;
+    const double h6 = x23*x25;
+    const double h8 = x12*x26 + x19;
+    const double h9 = -x15;
+    const double h13 = dx[i]*x25 + h14*x20;
+    const double h18 = h19*x2 + x2;
+    const double h20 = dx[i]*h21;
+    for (int j = 0; j < nY; j++){
+      const double x4 = dy[j]*x3;
+      const double x10 = dy[j]*x9;
+      const double x11 = dy[j]*e2;
+      const double x21 = h1*x11;
+      const double x22 = -0.5*dy[j];
+      const double x24 = x9*(dx[i]*(h2 + x10*x5 + x22) + dy[j]*(h4 + x21));
+      const double x27 = h9*(h7*x11 + h8) + x10*(h5*x4 + h6 + x22);
+      SB[i*nY + j] = flux*(h10*x24 + h11*x27 + h22*(dy[j]*h15*(h12*x21 + h13 + x11) + h20*(dy[j]*h16 + dy[j]*h17 + h18)) + h23*x24*x27 + h24)*exp(h25*(x10*(x2 + x4) + x15*(-x11 + x12)));
     }
   }
+}
+
+std::vector<double> cxx_GaussSB_de1de2(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+{
+  std::vector<double> SB(dx.size()*dy.size(), 0.);
+  cxx_GaussSB_de1de2_Array(flux, e1, e2, size, &dx[0], dx.size(), &dy[0], dy.size(), &SB[0], dx.size(), dy.size());
   return SB;
 }
 
+//---------- cxx_GaussSB_dTdF: d^2SB/dsizedflux
 
+void cxx_GaussSB_dTdF_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY)
+{
+  check_GaussSB_Dimensions(nX, nY, nSBX, nSBY);
+  const double x1 = e1 - 1;
+  const double x3 = (e2*e2);
+  const double x4 = e1 + 1;
+  const double x5 = x4*(1 - e1);
+  const double x6 = x3 - x5;
+  const double x7 = (1.0/x6);
+  const double x12 = -x3 + x5;
+  const double x13 = (1.0/x12);
+  const double x15 = (size*size*size);
+  const double x16 = x1*x4 + x3;
+  const double x17 = (size*size*size*size)*x12;
+  const double x18 = 2.0*x16*x7;
+  const double x19 = 2.0*x13*x6;
+  const double h0 = -x19;
+  const double h3 = -0.15915494309189535*(1.0/sqrt(x17))/x15;
+  const double h4 = 0.31830988618379069*x15*x16*(1.0/(x17*sqrt(x17)));
+  const double h5 = -0.5/(size*size);
+#ifdef _OPENMP
+  const int nThreads = get_GaussSB_Loop_Threads(nX, nY);
+  #pragma omp parallel for num_threads(nThreads) if(nThreads > 1)
+#endif
+  for (int i = 0; i < nX; i++){
+    const double x0 = dx[i]*e2;
+    const double x10 = dx[i]*x4;
+    const double x14 = dx[i]*x13;
+    const double h1 = x10*x19;
+    const double h2 = x0*x18 - x0;
+    for (int j = 0; j < nY; j++){
+      const double x2 = dy[j]*x1;
+      const double x8 = dy[j]*x7;
+      const double x9 = dy[j]*e2;
+      const double x11 = x10 - x9;
+      SB[i*nY + j] = (h3*(x14*(h0*x9 + h1 + x11) - x8*(h2 + x18*x2 - x2)) + h4)*exp(h5*(x11*x14 + x8*(x0 + x2)));
+    }
+  }
+}
 
+std::vector<double> cxx_GaussSB_dTdF(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy)
+{
+  std::vector<double> SB(dx.size()*dy.size(), 0.);
+  cxx_GaussSB_dTdF_Array(flux, e1, e2, size, &dx[0], dx.size(), &dy[0], dy.size(), &SB[0], dx.size(), dy.size());
+  return SB;
+}
+
+//---------- Fused SB profile, first and second derivatives
+// Output SB [10, nX, nY] holds, in order: SB, d(size), d(e1), d(e2), d(size,size), d(size,e1), d(size,e2), d(e1,e1), d(e1,e2), d(e2,e2)
+// Common subexpressions across all of these are evaluated once.
 
+void cxx_GaussSB_Bundle_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSB, int nSBX, int nSBY)
+{
+  check_GaussSB_Dimensions(nX, nY, nSBX, nSBY);
+  if(nSB != 10){
+    throw std::invalid_argument("cxx_GaussSB_Bundle - output array must contain 10 planes [SB, first derivatives, upper triangle of second derivatives]");
+  }
+  const std::size_t plane(static_cast<std::size_t>(nX)*nY);
+  const double x0 = (size*size);
+  const double x1 = (1.0/x0);
+  const double x3 = e1 - 1;
+  const double x6 = (e2*e2);
+  const double x7 = e1 + 1;
+  const double x8 = x7*(1 - e1);
+  const double x9 = x6 - x8;
+  const double x10 = (1.0/x9);
+  const double x15 = -x6 + x8;
+  const double x16 = (1.0/x15);
+  const double h0 = -0.5*x1;
+  const double x19 = (size*size*size*size);
+  const double x20 = x15*x19;
+  const double x21 = (1.0/sqrt(x20));
+  const double x22 = 0.15915494309189535*x21;
+  const double x23 = (size*size*size);
+  const double x24 = (1.0/(x20*sqrt(x20)));
+  const double x25 = x3*x7 + x6;
+  const double x26 = x24*x25;
+  const double x27 = 0.31830988618379069*x26;
+  const double x28 = 2.0*x25;
+  const double x29 = x10*x28;
+  const double x32 = 2.0*x9;
+  const double x33 = x16*x32;
+  const double h3 = -x33;
+  const double x36 = x22/x23;
+  const double x37 = x19*x24;
+  const double x40 = 1.0*e1;
+  const double x41 = x10*x40;
+  const double x44 = x16*x40;
+  const double h6 = -x44;
+  const double x47 = x1*x21;
+  const double x50 = (1.0/x25);
+  const double x59 = (size*size*size*size*size*size);
+  const double x60 = (x25*x25);
+  const double x61 = (1.0/(x20*x20*sqrt(x20)));
+  const double x63 = 14.0*x25;
+  const double x65 = (x9*x9);
+  const double x66 = (1.0/x65);
+  const double x68 = 16.0*x60;
+  const double x70 = (1.0/(x15*x15));
+  const double x72 = 16.0*x65;
+  const double x74 = 14.0*x9;
+  const double x77 = x22/x19;
+  const double x78 = e1*x24;
+  const double x79 = 0.63661977236758138*x23;
+  const double x80 = e1*x25;
+  const double x81 = 0.95492965855137202*(size*size*size*size*size*size*size)*x61;
+  const double x82 = size*x27;
+  const double x84 = 0.15915494309189535*size;
+  const double x85 = x22/(size*size*size*size*size);
+  const double x86 = 6.0*e1;
+  const double x87 = 8.0*x80;
+  const double x88 = 8.0*e1*x9;
+  const double x89 = e2*x24;
+  const double x93 = 8*x25*x66;
+  const double x94 = 0.15915494309189535*x37;
+  const double x95 = (e1*e1);
+  const double x96 = 0.47746482927568601*(size*size*size*size*size*size*size*size)*x61;
+  const double x98 = 0.31830988618379069*x0;
+  const double x99 = 2*e1;
+  const double x100 = 4.0*x95;
+  const double x104 = 0.15915494309189535*x47;
+  const double x105 = 0.15915494309189535*x0;
+  const double x107 = 4*e1;
+  const double x109 = 4*(e2*e2*e2);
+  const double h12 = -x36;
+  const double h13 = x23*x27;
+  const double h14 = e1*x37;
+  const double h15 = e2*x37;
+  const double h16 = -x72;
+  const double h17 = -x74;
+  const double h19 = -x68;
+  const double h21 = -x68;
+  const double h22 = -x77;
+  const double h23 = -0.63661977236758138*x26;
+  const double h24 = x22/x59;
+  const double h25 = 0.95492965855137202*x0*x26 + 1.909859317102744*x59*x60*x61;
+  const double h26 = -x87;
+  const double h28 = -x87;
+  const double h29 = -x88;
+  const double h30 = -x86;
+  const double h33 = x78*x84;
+  const double h34 = x78*x79 + x80*x81;
+  const double h35 = -2*x6;
+  const double h37 = 2*x50;
+  const double h39 = -x28;
+  const double h40 = x6*x93;
+  const double h41 = -x85;
+  const double h42 = -x84*x89;
+  const double h43 = e2*x25*x81 + x79*x89;
+  const double h44 = -x100;
+  const double h46 = -x100;
+  const double h48 = -x100;
+  const double h49 = -x104;
+  const double h50 = -x78*x98;
+  const double h51 = x94 + x95*x96;
+  const double h52 = -x107;
+  const double h54 = -x107;
+  const double h55 = -e1;
+  const double h56 = -x107*x6;
+  const double h58 = x107*x16;
+  const double h60 = x105*x78;
+  const double h61 = x105*x89;
+  const double h62 = e1*e2*x96;
+  const double h63 = -x109;
+  const double h65 = -4*x6;
+  const double h67 = -x109;
+  const double h68 = -x104;
+  const double h69 = x89*x98;
+  const double h70 = x6*x96 + x94;
+#ifdef _OPENMP
+  const int nThreads = get_GaussSB_Loop_Threads(nX, nY);
+  #pragma omp parallel for num_threads(nThreads) if(nThreads > 1)
+#endif
+  for (int i = 0; i < nX; i++){
+    const double x2 = dx[i]*e2;
+    const double x13 = dx[i]*x7;
+    const double x17 = dx[i]*x16;
+    const double h1 = -x2;
+    const double h2 = x2*x29;
+    const double h4 = x13*x33;
+    const double h5 = x2*x41;
+    const double x43 = 0.5*dx[i];
+    const double h7 = x13*x44 + x43;
+    const double x49 = -x43;
+    const double x51 = dx[i]*x50;
+    const double x55 = e2*x13;
+    const double x56 = x10*x55;
+    const double x57 = dx[i]*x10;
+    const double h8 = x49 + x51*x6;
+    const double h9 = -x57;
+    const double x62 = x10*x2;
+    const double x67 = x2*x66;
+    const double x71 = x13*x70;
+    const double x73 = x13*x16;
+    const double x91 = x57*x6;
+    const double x102 = 4*x73;
+    const double x103 = dx[i]*x70;
+    const double h10 = -x56;
+    const double h11 = x49 + x91;
+    const double h18 = x71*x72 + x73*x74;
+    const double h20 = h21*x67 + x62*x63;
+    const double h27 = h28*x67 + x62*x86;
+    const double h31 = dx[i] + x17*x32 + x71*x88 + x73*x86;
+    const double h32 = -x17;
+    const double h36 = h37*x55;
+    const double h38 = dx[i]*h40 + dx[i] + h39*x57 - 6*x91;
+    const double h45 = dx[i]*x99 + x102*x95;
+    const double h47 = h48*x62;
+    const double h53 = dx[i]*x40 + h54*x91;
+    const double h57 = h58*x55 + x2;
+    const double h59 = -x103;
+    const double h64 = x102*x6 + x13;
+    const double h66 = h67*x57 + 3*x2;
+    for (int j = 0; j < nY; j++){
+      const double x4 = dy[j]*x3;
+      const double x5 = x2 + x4;
+      const double x11 = dy[j]*x10;
+      const double x12 = dy[j]*e2;
+      const double x14 = -x12 + x13;
+      const double x18 = flux*exp(h0*(x11*x5 + x14*x17));
+      const double x30 = h1 - x4;
+      const double x31 = x11*(h2 + x29*x4 + x30);
+      const double x34 = x17*(h3*x12 + h4 + x14);
+      const double x35 = -x31 + x34;
+      const double x38 = 0.5*dy[j];
+      const double x39 = -x38;
+      const double x42 = x11*(h5 + x39 + x4*x41);
+      const double x45 = x17*(h6*x12 + h7);
+      const double x46 = x42 - x45;
+      const double x48 = 0.15915494309189535*x18;
+      const double x52 = x12*x3;
+      const double x53 = dy[j]*x50;
+      const double x54 = x11*x6;
+      const double x58 = h9*(x38 - x54 + x56) + x53*(h8 + x50*x52);
+      const double x64 = x10*x4;
+      const double x69 = x4*x66;
+      const double x75 = x12*x70;
+      const double x76 = x12*x16;
+      const double x83 = x31 - x34;
+      const double x90 = 1.0*dy[j];
+      const double x92 = x10*x52;
+      const double x97 = -x42 + x45;
+      const double x101 = dy[j]*x66;
+      const double x106 = x10*(dx[i]*(h10 + x39 + x54) + dy[j]*(h11 + x92));
+      const double x108 = dy[j]*x16;
+      SB[i*nY + j] = x18*x22;
+      SB[1*plane + i*nY + j] = x18*(h12*x35 + h13);
+      SB[2*plane + i*nY + j] = x48*(h14 + x46*x47);
+      SB[3*plane + i*nY + j] = x48*(h15 + x47*x58);
+      SB[4*plane + i*nY + j] = x18*(h22*(-x11*(h19*x69 + h20 + x30 + x63*x64) + x17*(h16*x75 + h17*x76 + h18 + x14)) + h23*x35 + h24*(x35*x35) + h25);
+      SB[5*plane + i*nY + j] = x18*(h33*x83 + h34 + x36*(h32*(h29*x75 + h30*x76 + h31) + x11*(-dy[j] + h26*x69 + h27 + x11*x28 + x64*x86)) + x46*x82 + x46*x83*x85);
+      SB[6*plane + i*nY + j] = x18*(h41*x35*x58 + h42*x35 + h43 + x36*(-x11*(h38 + x52*x93 - 6*x92) + x51*(h35*x53 + h36 + x90)) + x58*x82);
+      SB[7*plane + i*nY + j] = x18*(h49*(-x101*(dy[j]*x99 + h46*x64 + h47 + x5) + x103*(h44*x76 + h45 + x14)) + h50*x97 + h51 + x77*(x97*x97));
+      SB[8*plane + i*nY + j] = x18*(h60*x106 + h61*x46 + h62 + x104*(h59*(h55*x90 + h56*x108 + h57) + x101*(h52*x92 + h53 + x12)) + x106*x46*x77);
+      SB[9*plane + i*nY + j] = x18*(h68*(-x101*(h65*x64 + h66 + x4) + x103*(h63*x108 + h64 - 3*x12)) + h69*x58 + h70 + (x58*x58)*x77);
+    }
+  }
+}
@@ -1,28 +1,48 @@
+// ---- GENERATED by generate_SB_Kernels.py from the SymPy definition of the SB profile (surface_Brightness_Profiles.gaussian_SBProfile_Sympy_Expression). Do not edit by hand: edit the generator and run `make kernels'.
+
 #include <vector>
 #include <cmath>
 
-//----------------- GAUSSIAN SB
-//-- Direct
+//----------------- Output dimension check for pointer-based (_Array) kernels
+void check_GaussSB_Dimensions(int nX, int nY, int nSBX, int nSBY);
+
+//----------------- Thread control (OpenMP): nThreads <= 0 uses all available threads. Returns the number of threads set, which is always 1 if compiled without OpenMP
+int set_GaussSB_Threads(int nThreads);
+int get_GaussSB_Threads();
+int get_GaussSB_Loop_Threads(int nX, int nY);
+
 std::vector<double> cxx_GaussSB(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);
+void cxx_GaussSB_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
 
-//-- 1st order derivatives
-std::vector<double> cxx_GaussSB_dT(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);				
+std::vector<double> cxx_GaussSB_dT(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);
+void cxx_GaussSB_dT_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
 
 std::vector<double> cxx_GaussSB_de1(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);
+void cxx_GaussSB_de1_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
 
 std::vector<double> cxx_GaussSB_de2(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);
+void cxx_GaussSB_de2_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
 
-//---2nd order derivatives
 std::vector<double> cxx_GaussSB_dde1(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);
+void cxx_GaussSB_dde1_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
 
 std::vector<double> cxx_GaussSB_dde2(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);
+void cxx_GaussSB_dde2_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
 
 std::vector<double> cxx_GaussSB_ddT(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);
+void cxx_GaussSB_ddT_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
 
-std::vector<double> cxx_GaussSB_de1dT(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);				
+std::vector<double> cxx_GaussSB_de1dT(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);
+void cxx_GaussSB_de1dT_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
 
 std::vector<double> cxx_GaussSB_de2dT(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);
+void cxx_GaussSB_de2dT_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
 
 std::vector<double> cxx_GaussSB_de1de2(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);
+void cxx_GaussSB_de1de2_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
+
+std::vector<double> cxx_GaussSB_dTdF(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);
+void cxx_GaussSB_dTdF_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
 
-std::vector<double> cxx_GaussSB_dTdF(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);				
+//----------------- Fused SB profile, 1st and 2nd order derivatives, written into SB [10, nX, nY]
+void cxx_GaussSB_Bundle_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSB, int nSBX, int nSBY);
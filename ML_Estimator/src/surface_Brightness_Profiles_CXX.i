@@ -1,18 +1,61 @@
 %module surface_Brightness_Profiles_CXX
 %include "std_vector.i"
 %include "std_string.i"
+%include "exception.i"
 
 %{
 #define SWIG_FILE_WITH_INIT
 #include "surface_Brightness_Profiles_CXX.h"
 %}
 
+// numpy.i typemaps: input grids are read in place, and output is written directly into a caller-provided (C-contiguous, float64) numpy array
+%include "numpy.i"
+%init %{
+import_array();
+%}
+
+%apply (double* IN_ARRAY1, int DIM1) {(double* dx, int nX), (double* dy, int nY)};
+%apply (double* INPLACE_ARRAY2, int DIM1, int DIM2) {(double* SB, int nSBX, int nSBY)};
+%apply (double* INPLACE_ARRAY3, int DIM1, int DIM2, int DIM3) {(double* SB, int nSB, int nSBX, int nSBY)};
+
+// Convert C++ exceptions (e.g. mismatched output dimensions) to Python ValueError
+%exception {
+  try {
+    $action
+  } catch (const std::exception& e) {
+    SWIG_exception(SWIG_ValueError, e.what());
+  }
+}
+
 // Instantiate templates used by example                                               
 namespace std {
    %template(IntVector) vector<int>;
    %template(DoubleVector) vector<double>;
 }
 
+// The SB kernels below do not touch Python objects once their arguments are converted, so the GIL is released while they run: this allows Python threads to render models concurrently. C++ exceptions are converted to ValueError once the GIL is reacquired
+%exception {
+  std::string errorMessage;
+  bool failed = false;
+  Py_BEGIN_ALLOW_THREADS
+  try {
+    $action
+  } catch (const std::exception& e) {
+    failed = true;
+    errorMessage = e.what();
+  }
+  Py_END_ALLOW_THREADS
+  if(failed){
+    SWIG_exception(SWIG_ValueError, errorMessage.c_str());
+  }
+}
+
+///------ Thread control for the SB kernels (OpenMP): nThreads <= 0 uses all available threads. Returns the number of threads set, which is always 1 if compiled without OpenMP
+int set_GaussSB_Threads(int nThreads);
+
+int get_GaussSB_Threads();
+
+
 ///------ GAUSSIAN
 std::vector<double> cxx_GaussSB(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);			
 
@@ -37,4 +80,31 @@ std::vector<double> cxx_GaussSB_de2dT(double flux, double e1, double e2, double
 
 std::vector<double> cxx_GaussSB_de1de2(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);
 
-//std::vector<double> cxx_GaussSB_dTdF(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);				
+std::vector<double> cxx_GaussSB_dTdF(double flux, double e1, double e2, double size, std::vector<double> dx, std::vector<double> dy);				
+
+
+///------ GAUSSIAN: numpy array (in place) interface
+void cxx_GaussSB_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
+
+void cxx_GaussSB_dT_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
+
+void cxx_GaussSB_de1_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
+
+void cxx_GaussSB_de2_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
+
+void cxx_GaussSB_dde1_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
+
+void cxx_GaussSB_dde2_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
+
+void cxx_GaussSB_ddT_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
+
+void cxx_GaussSB_de1dT_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
+
+void cxx_GaussSB_de2dT_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
+
+void cxx_GaussSB_de1de2_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
+
+void cxx_GaussSB_dTdF_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSBX, int nSBY);
+
+///------ GAUSSIAN: fused SB profile, first and second derivatives (numpy array interface)
+void cxx_GaussSB_Bundle_Array(double flux, double e1, double e2, double size, double* dx, int nX, double* dy, int nY, double* SB, int nSB, int nSBX, int nSBY);
@@ -1,111 +1,73 @@
 # This file was automatically generated by SWIG (http://www.swig.org).
-# Version 3.0.12
+# Version 4.0.2
 #
 # Do not make changes to this file unless you know what you are doing--modify
 # the SWIG interface file instead.
 
 from sys import version_info as _swig_python_version_info
-if _swig_python_version_info >= (2, 7, 0):
-    def swig_import_helper():
-        import importlib
-        pkg = __name__.rpartition('.')[0]
-        mname = '.'.join((pkg, '_surface_Brightness_Profiles_CXX')).lstrip('.')
-        try:
-            return importlib.import_module(mname)
-        except ImportError:
-            return importlib.import_module('_surface_Brightness_Profiles_CXX')
-    _surface_Brightness_Profiles_CXX = swig_import_helper()
-    del swig_import_helper
-elif _swig_python_version_info >= (2, 6, 0):
-    def swig_import_helper():
-        from os.path import dirname
-        import imp
-        fp = None
-        try:
-            fp, pathname, description = imp.find_module('_surface_Brightness_Profiles_CXX', [dirname(__file__)])
-        except ImportError:
-            import _surface_Brightness_Profiles_CXX
-            return _surface_Brightness_Profiles_CXX
-        try:
-            _mod = imp.load_module('_surface_Brightness_Profiles_CXX', fp, pathname, description)
-        finally:
-            if fp is not None:
-                fp.close()
-        return _mod
-    _surface_Brightness_Profiles_CXX = swig_import_helper()
-    del swig_import_helper
+if _swig_python_version_info < (2, 7, 0):
+    raise RuntimeError("Python 2.7 or later required")
+
+# Import the low-level C/C++ module
+if __package__ or "." in __name__:
+    from . import _surface_Brightness_Profiles_CXX
 else:
     import _surface_Brightness_Profiles_CXX
-del _swig_python_version_info
-
-try:
-    _swig_property = property
-except NameError:
-    pass  # Python < 2.2 doesn't have 'property'.
 
 try:
     import builtins as __builtin__
 except ImportError:
     import __builtin__
 
-def _swig_setattr_nondynamic(self, class_type, name, value, static=1):
-    if (name == "thisown"):
-        return self.this.own(value)
-    if (name == "this"):
-        if type(value).__name__ == 'SwigPyObject':
-            self.__dict__[name] = value
-            return
-    method = class_type.__swig_setmethods__.get(name, None)
-    if method:
-        return method(self, value)
-    if (not static):
-        if _newclass:
-            object.__setattr__(self, name, value)
+def _swig_repr(self):
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
+    return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
+
+
+def _swig_setattr_nondynamic_instance_variable(set):
+    def set_instance_attr(self, name, value):
+        if name == "thisown":
+            self.this.own(value)
+        elif name == "this":
+            set(self, name, value)
+        elif hasattr(self, name) and isinstance(getattr(type(self), name), property):
+            set(self, name, value)
         else:
-            self.__dict__[name] = value
-    else:
-        raise AttributeError("You cannot add attributes to %s" % self)
+            raise AttributeError("You cannot add instance attributes to %s" % self)
+    return set_instance_attr
 
 
-def _swig_setattr(self, class_type, name, value):
-    return _swig_setattr_nondynamic(self, class_type, name, value, 0)
+def _swig_setattr_nondynamic_class_variable(set):
+    def set_class_attr(cls, name, value):
+        if hasattr(cls, name) and not isinstance(getattr(cls, name), property):
+            set(cls, name, value)
+        else:
+            raise AttributeError("You cannot add class attributes to %s" % cls)
+    return set_class_attr
 
 
-def _swig_getattr(self, class_type, name):
-    if (name == "thisown"):
-        return self.this.own()
-    method = class_type.__swig_getmethods__.get(name, None)
-    if method:
-        return method(self)
-    raise AttributeError("'%s' object has no attribute '%s'" % (class_type.__name__, name))
+def _swig_add_metaclass(metaclass):
+    """Class decorator for adding a metaclass to a SWIG wrapped class - a slimmed down version of six.add_metaclass"""
+    def wrapper(cls):
+        return metaclass(cls.__name__, cls.__bases__, cls.__dict__.copy())
+    return wrapper
 
 
-def _swig_repr(self):
-    try:
-        strthis = "proxy of " + self.this.__repr__()
-    except __builtin__.Exception:
-        strthis = ""
-    return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
+class _SwigNonDynamicMeta(type):
+    """Meta class to enforce nondynamic attributes (no new attributes) for a class"""
+    __setattr__ = _swig_setattr_nondynamic_class_variable(type.__setattr__)
 
-try:
-    _object = object
-    _newclass = 1
-except __builtin__.Exception:
-    class _object:
-        pass
-    _newclass = 0
-
-class SwigPyIterator(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, SwigPyIterator, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, SwigPyIterator, name)
+
+class SwigPyIterator(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
 
     def __init__(self, *args, **kwargs):
         raise AttributeError("No constructor defined - class is abstract")
     __repr__ = _swig_repr
     __swig_destroy__ = _surface_Brightness_Profiles_CXX.delete_SwigPyIterator
-    __del__ = lambda self: None
 
     def value(self):
         return _surface_Brightness_Profiles_CXX.SwigPyIterator_value(self)
@@ -156,14 +118,12 @@ class SwigPyIterator(_object):
         return _surface_Brightness_Profiles_CXX.SwigPyIterator___sub__(self, *args)
     def __iter__(self):
         return self
-SwigPyIterator_swigregister = _surface_Brightness_Profiles_CXX.SwigPyIterator_swigregister
-SwigPyIterator_swigregister(SwigPyIterator)
-
-class IntVector(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, IntVector, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, IntVector, name)
+
+# Register SwigPyIterator in _surface_Brightness_Profiles_CXX:
+_surface_Brightness_Profiles_CXX.SwigPyIterator_swigregister(SwigPyIterator)
+
+class IntVector(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def iterator(self):
@@ -238,11 +198,7 @@ class IntVector(_object):
         return _surface_Brightness_Profiles_CXX.IntVector_erase(self, *args)
 
     def __init__(self, *args):
-        this = _surface_Brightness_Profiles_CXX.new_IntVector(*args)
-        try:
-            self.this.append(this)
-        except __builtin__.Exception:
-            self.this = this
+        _surface_Brightness_Profiles_CXX.IntVector_swiginit(self, _surface_Brightness_Profiles_CXX.new_IntVector(*args))
 
     def push_back(self, x):
         return _surface_Brightness_Profiles_CXX.IntVector_push_back(self, x)
@@ -268,15 +224,12 @@ class IntVector(_object):
     def capacity(self):
         return _surface_Brightness_Profiles_CXX.IntVector_capacity(self)
     __swig_destroy__ = _surface_Brightness_Profiles_CXX.delete_IntVector
-    __del__ = lambda self: None
-IntVector_swigregister = _surface_Brightness_Profiles_CXX.IntVector_swigregister
-IntVector_swigregister(IntVector)
-
-class DoubleVector(_object):
-    __swig_setmethods__ = {}
-    __setattr__ = lambda self, name, value: _swig_setattr(self, DoubleVector, name, value)
-    __swig_getmethods__ = {}
-    __getattr__ = lambda self, name: _swig_getattr(self, DoubleVector, name)
+
+# Register IntVector in _surface_Brightness_Profiles_CXX:
+_surface_Brightness_Profiles_CXX.IntVector_swigregister(IntVector)
+
+class DoubleVector(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
 
     def iterator(self):
@@ -351,11 +304,7 @@ class DoubleVector(_object):
         return _surface_Brightness_Profiles_CXX.DoubleVector_erase(self, *args)
 
     def __init__(self, *args):
-        this = _surface_Brightness_Profiles_CXX.new_DoubleVector(*args)
-        try:
-            self.this.append(this)
-        except __builtin__.Exception:
-            self.this = this
+        _surface_Brightness_Profiles_CXX.DoubleVector_swiginit(self, _surface_Brightness_Profiles_CXX.new_DoubleVector(*args))
 
     def push_back(self, x):
         return _surface_Brightness_Profiles_CXX.DoubleVector_push_back(self, x)
@@ -381,50 +330,84 @@ class DoubleVector(_object):
     def capacity(self):
         return _surface_Brightness_Profiles_CXX.DoubleVector_capacity(self)
     __swig_destroy__ = _surface_Brightness_Profiles_CXX.delete_DoubleVector
-    __del__ = lambda self: None
-DoubleVector_swigregister = _surface_Brightness_Profiles_CXX.DoubleVector_swigregister
-DoubleVector_swigregister(DoubleVector)
+
+# Register DoubleVector in _surface_Brightness_Profiles_CXX:
+_surface_Brightness_Profiles_CXX.DoubleVector_swigregister(DoubleVector)
 
 
+def set_GaussSB_Threads(nThreads):
+    return _surface_Brightness_Profiles_CXX.set_GaussSB_Threads(nThreads)
+
+def get_GaussSB_Threads():
+    return _surface_Brightness_Profiles_CXX.get_GaussSB_Threads()
+
 def cxx_GaussSB(flux, e1, e2, size, dx, dy):
     return _surface_Brightness_Profiles_CXX.cxx_GaussSB(flux, e1, e2, size, dx, dy)
-cxx_GaussSB = _surface_Brightness_Profiles_CXX.cxx_GaussSB
 
 def cxx_GaussSB_dT(flux, e1, e2, size, dx, dy):
     return _surface_Brightness_Profiles_CXX.cxx_GaussSB_dT(flux, e1, e2, size, dx, dy)
-cxx_GaussSB_dT = _surface_Brightness_Profiles_CXX.cxx_GaussSB_dT
 
 def cxx_GaussSB_de1(flux, e1, e2, size, dx, dy):
     return _surface_Brightness_Profiles_CXX.cxx_GaussSB_de1(flux, e1, e2, size, dx, dy)
-cxx_GaussSB_de1 = _surface_Brightness_Profiles_CXX.cxx_GaussSB_de1
 
 def cxx_GaussSB_de2(flux, e1, e2, size, dx, dy):
     return _surface_Brightness_Profiles_CXX.cxx_GaussSB_de2(flux, e1, e2, size, dx, dy)
-cxx_GaussSB_de2 = _surface_Brightness_Profiles_CXX.cxx_GaussSB_de2
 
 def cxx_GaussSB_dde1(flux, e1, e2, size, dx, dy):
     return _surface_Brightness_Profiles_CXX.cxx_GaussSB_dde1(flux, e1, e2, size, dx, dy)
-cxx_GaussSB_dde1 = _surface_Brightness_Profiles_CXX.cxx_GaussSB_dde1
 
 def cxx_GaussSB_dde2(flux, e1, e2, size, dx, dy):
     return _surface_Brightness_Profiles_CXX.cxx_GaussSB_dde2(flux, e1, e2, size, dx, dy)
-cxx_GaussSB_dde2 = _surface_Brightness_Profiles_CXX.cxx_GaussSB_dde2
 
 def cxx_GaussSB_ddT(flux, e1, e2, size, dx, dy):
     return _surface_Brightness_Profiles_CXX.cxx_GaussSB_ddT(flux, e1, e2, size, dx, dy)
-cxx_GaussSB_ddT = _surface_Brightness_Profiles_CXX.cxx_GaussSB_ddT
 
 def cxx_GaussSB_de1dT(flux, e1, e2, size, dx, dy):
     return _surface_Brightness_Profiles_CXX.cxx_GaussSB_de1dT(flux, e1, e2, size, dx, dy)
-cxx_GaussSB_de1dT = _surface_Brightness_Profiles_CXX.cxx_GaussSB_de1dT
 
 def cxx_GaussSB_de2dT(flux, e1, e2, size, dx, dy):
     return _surface_Brightness_Profiles_CXX.cxx_GaussSB_de2dT(flux, e1, e2, size, dx, dy)
-cxx_GaussSB_de2dT = _surface_Brightness_Profiles_CXX.cxx_GaussSB_de2dT
 
 def cxx_GaussSB_de1de2(flux, e1, e2, size, dx, dy):
     return _surface_Brightness_Profiles_CXX.cxx_GaussSB_de1de2(flux, e1, e2, size, dx, dy)
-cxx_GaussSB_de1de2 = _surface_Brightness_Profiles_CXX.cxx_GaussSB_de1de2
-# This file is compatible with both classic and new-style classes.
+
+def cxx_GaussSB_dTdF(flux, e1, e2, size, dx, dy):
+    return _surface_Brightness_Profiles_CXX.cxx_GaussSB_dTdF(flux, e1, e2, size, dx, dy)
+
+def cxx_GaussSB_Array(flux, e1, e2, size, dx, dy, SB):
+    return _surface_Brightness_Profiles_CXX.cxx_GaussSB_Array(flux, e1, e2, size, dx, dy, SB)
+
+def cxx_GaussSB_dT_Array(flux, e1, e2, size, dx, dy, SB):
+    return _surface_Brightness_Profiles_CXX.cxx_GaussSB_dT_Array(flux, e1, e2, size, dx, dy, SB)
+
+def cxx_GaussSB_de1_Array(flux, e1, e2, size, dx, dy, SB):
+    return _surface_Brightness_Profiles_CXX.cxx_GaussSB_de1_Array(flux, e1, e2, size, dx, dy, SB)
+
+def cxx_GaussSB_de2_Array(flux, e1, e2, size, dx, dy, SB):
+    return _surface_Brightness_Profiles_CXX.cxx_GaussSB_de2_Array(flux, e1, e2, size, dx, dy, SB)
+
+def cxx_GaussSB_dde1_Array(flux, e1, e2, size, dx, dy, SB):
+    return _surface_Brightness_Profiles_CXX.cxx_GaussSB_dde1_Array(flux, e1, e2, size, dx, dy, SB)
+
+def cxx_GaussSB_dde2_Array(flux, e1, e2, size, dx, dy, SB):
+    return _surface_Brightness_Profiles_CXX.cxx_GaussSB_dde2_Array(flux, e1, e2, size, dx, dy, SB)
+
+def cxx_GaussSB_ddT_Array(flux, e1, e2, size, dx, dy, SB):
+    return _surface_Brightness_Profiles_CXX.cxx_GaussSB_ddT_Array(flux, e1, e2, size, dx, dy, SB)
+
+def cxx_GaussSB_de1dT_Array(flux, e1, e2, size, dx, dy, SB):
+    return _surface_Brightness_Profiles_CXX.cxx_GaussSB_de1dT_Array(flux, e1, e2, size, dx, dy, SB)
+
+def cxx_GaussSB_de2dT_Array(flux, e1, e2, size, dx, dy, SB):
+    return _surface_Brightness_Profiles_CXX.cxx_GaussSB_de2dT_Array(flux, e1, e2, size, dx, dy, SB)
+
+def cxx_GaussSB_de1de2_Array(flux, e1, e2, size, dx, dy, SB):
+    return _surface_Brightness_Profiles_CXX.cxx_GaussSB_de1de2_Array(flux, e1, e2, size, dx, dy, SB)
+
+def cxx_GaussSB_dTdF_Array(flux, e1, e2, size, dx, dy, SB):
+    return _surface_Brightness_Profiles_CXX.cxx_GaussSB_dTdF_Array(flux, e1, e2, size, dx, dy, SB)
+
+def cxx_GaussSB_Bundle_Array(flux, e1, e2, size, dx, dy, SB):
+    return _surface_Brightness_Profiles_CXX.cxx_GaussSB_Bundle_Array(flux, e1, e2, size, dx, dy, SB)
 
 
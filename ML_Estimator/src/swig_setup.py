@@ -1,8 +1,20 @@
 from distutils.core import setup, Extension
+import numpy
+import os
+import sys
 
+## Compile the SB kernels with OpenMP, so that grid rows can be split across threads (see set_GaussSB_Threads). Set SBCXX_OPENMP=0 (or 1) to disable (enable) explicitly: this is off by default on OS X, where the system compiler does not support -fopenmp
+useOpenMP = os.environ.get('SBCXX_OPENMP', ('0' if sys.platform == 'darwin' else '1')) != '0'
+if(useOpenMP):
+    ompArgs = ['-fopenmp']
+else:
+    ompArgs = []
 
 SBCXX_module = Extension('_surface_Brightness_Profiles_CXX',
                            sources=['surface_Brightness_Profiles_CXX_wrap.cxx', 'surface_Brightness_Profiles_CXX.cxx'],
+                           include_dirs=[numpy.get_include()],
+                           extra_compile_args=ompArgs,
+                           extra_link_args=ompArgs,
                            )
 
 setup (name = 'example',